@@ -7,7 +7,9 @@ All user-facing settings live in that YAML file — cdk.json is reserved for CDK
 """
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import yaml
 import aws_cdk as cdk
@@ -17,6 +19,12 @@ from app.app_stack import BedrockBudgeteerStack
 DEFAULT_CONFIG_FILE = "budgeteer.config.yaml"
 
 
+@lru_cache(maxsize=4)
+def get_environment(account: Optional[str], region: str) -> cdk.Environment:
+    """Build the stack environment once per (account, region), reused across main() calls"""
+    return cdk.Environment(account=account, region=region)
+
+
 def load_config(app: cdk.App) -> dict:
     """Load configuration from YAML file.
 
@@ -55,6 +63,7 @@ def inject_context(app: cdk.App, config: dict) -> None:
         "enable-point-in-time-recovery": infra.get("enable_point_in_time_recovery", True),
         "enable-multi-az": infra.get("enable_multi_az", False),
         "skip-s3-public-access-block": infra.get("skip_s3_public_access_block", False),
+        "expire-on-destroy": infra.get("expire_on_destroy", False),
     }
     app.node.set_context("bedrock-budgeteer:feature-flags", feature_flags)
 
@@ -77,19 +86,20 @@ def inject_context(app: cdk.App, config: dict) -> None:
     app.node.set_context("bedrock-budgeteer:key-provisioning", config.get("key_provisioning", {}))
     app.node.set_context("bedrock-budgeteer:agentcore", config.get("agentcore", {}))
     app.node.set_context("bedrock-budgeteer:retention", config.get("retention", {}))
-
-
-# Single environment configuration with us-east-1 default
-environment_config = cdk.Environment(
-    account=os.getenv('CDK_DEFAULT_ACCOUNT'),
-    region=os.getenv('CDK_DEFAULT_REGION', 'us-east-1')
-)
+    app.node.set_context("bedrock-budgeteer:provisioned-concurrency", config.get("provisioned_concurrency", {}))
 
 
 def main():
     """Main application entry point"""
+    # Skip jsii stack-trace capture for every construct/token; it dominates synth time
+    os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
     app = cdk.App()
 
+    # Single environment configuration with us-east-1 default (built here, not at import)
+    account = os.environ.get('CDK_DEFAULT_ACCOUNT')
+    region = os.environ.get('CDK_DEFAULT_REGION', 'us-east-1')
+    environment_config = get_environment(account, region)
+
     config = load_config(app)
     inject_context(app, config)
 
@@ -3,117 +3,254 @@ Bedrock Budgeteer Main Application Stack
 Orchestrates all components of the budget monitoring system
 """
 import os
-from typing import Dict, Any, Optional
-from aws_cdk import (
-    Stack,
-    aws_kms as kms,
-    aws_logs as logs,
-)
+from functools import cached_property
+from graphlib import TopologicalSorter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+from aws_cdk import Annotations, Stack
 from constructs import Construct
 
-# Import our custom constructs
-from .constructs.data_storage import DataStorageConstruct
-from .constructs.security import SecurityConstruct
-from .constructs.monitoring import MonitoringConstruct
-from .constructs.tagging import TaggingFramework
-from .constructs.configuration import ConfigurationConstruct
-from .constructs.event_ingestion import EventIngestionConstruct
-from .constructs.log_storage import LogStorageConstruct
-from .constructs.core_processing import CoreProcessingConstruct
-from .constructs.workflow_orchestration import WorkflowOrchestrationConstruct
-from .constructs.agentcore import AgentCoreConstruct
-from .constructs.cost_allocation_reporting import CostAllocationReportingConstruct
+from .constructs.shared_resources import SharedResources
+
+# Custom constructs are imported lazily at their point of use so that code paths
+# left disabled (feature flags, optional setup steps) never pay the jsii load cost.
+if TYPE_CHECKING:
+    from aws_cdk import aws_iam as iam, aws_kms as kms, aws_sqs as sqs
 # Operational controls removed per changelog - see 2025-09-02 updates
 
+# Static headers sent by the external webhook integration; Authorization is added per stack
+_WEBHOOK_HEADER_TEMPLATE = {"X-Source": "bedrock-budgeteer"}
+
 
 
 class BedrockBudgeteerStack(Stack):
     """Main application stack for Bedrock Budgeteer system"""
 
-    def __init__(self, scope: Construct, construct_id: str, 
+    def __init__(self, scope: Construct, construct_id: str,
                  environment_name: str = "production",
-                 kms_key: Optional[kms.IKey] = None,
+                 kms_key: Optional["kms.IKey"] = None,
+                 enabled_components: Optional[Set[str]] = None,
                  **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
-        
+
         self.environment_name = environment_name
         self.kms_key = kms_key  # User-provided KMS key (optional)
+        # Resources handed from one construct to the next, filled in as they are created
+        self.shared = SharedResources(kms_key=kms_key)
+
+        # Construct pipeline: (name, factory, dependencies), declared in creation order
+        self._constructs: List[Tuple[str, Callable[[], None], List[str]]] = [
+            ("Security", self._create_security, []),
+            ("DataStorage", self._create_data_storage, []),
+            ("LogStorage", self._create_log_storage, []),
+            ("Configuration", self._create_configuration, []),
+            ("CoreProcessing", self._create_core_processing, ["Security", "DataStorage", "LogStorage"]),
+            ("EventIngestion", self._create_event_ingestion, ["LogStorage", "CoreProcessing"]),
+            ("Monitoring", self._create_monitoring, ["Configuration"]),
+            ("WorkflowOrchestration", self._create_workflow_orchestration,
+             ["Security", "DataStorage", "CoreProcessing", "Monitoring"]),
+        ]
+
+        # Partial synth: `cdk synth -c bb-components=EventIngestion,CoreProcessing` builds
+        # only those components and their dependencies. Everything is built by default.
+        if enabled_components is None:
+            enabled_components = self._requested_components()
+        self._enabled_components = self._resolve_components(enabled_components)
+        skipped = [name for name, _, _ in self._constructs if name not in self._enabled_components]
+        if skipped:
+            # Deploying a partial template would delete the skipped components' resources
+            Annotations.of(self).add_warning(
+                f"Partial synth: skipping component(s) {', '.join(skipped)}. "
+                "Do not deploy this template over a full stack."
+            )
+
+        factories = {name: factory for name, factory, _ in self._constructs}
+        for name in self._enabled_components:
+            factories[name]()
+
+        # Feature-flagged components wire into several core constructs
+        if self._is_enabled("Security", "DataStorage", "CoreProcessing", "Monitoring"):
+            self._create_feature_flagged_components()
+
+        # Read notification settings once; the setup methods below share them
+        self._ops_email = self._resolve_ops_email()
+        self._ops_phone = os.environ.get("OPS_PHONE_NUMBER")
+        self._slack_webhook = os.environ.get("SLACK_WEBHOOK_URL")
+        self._webhook_url = os.environ.get("EXTERNAL_WEBHOOK_URL")
+
+        # Add additional permissions to security roles
+        if self._is_enabled("Security", "DataStorage", "LogStorage", "CoreProcessing"):
+            self._configure_security_permissions()
+            self._wire_dlqs(self.core_processing.dead_letter_queues)
+
+        if self._is_enabled("Monitoring"):
+            # Set up monitoring for created resources
+            if self._is_enabled("DataStorage"):
+                self._setup_monitoring()
+
+            # Set up ingestion pipeline monitoring
+            if self._is_enabled("EventIngestion", "LogStorage"):
+                self._setup_ingestion_monitoring()
+
+            # Set up core processing monitoring
+            if self._is_enabled("CoreProcessing"):
+                self._setup_core_processing_monitoring()
+
+            # Set up workflow orchestration monitoring
+            if self._is_enabled("WorkflowOrchestration"):
+                self._setup_workflow_monitoring()
+
+            # Enable Phase 5: Advanced notifications and business metrics
+            self._enable_phase5_features()
+
+        # Phase 6: Operational Controls removed per changelog - see 2025-09-02 updates
+        # Emergency controls and maintenance mode no longer needed
+
+        # Tag everything in one pass now that all resources exist, rather than
+        # leaving a tagging Aspect to walk the tree again during synth
+        from .constructs.tagging import apply_tags
+        apply_tags(self, self.environment_name)
         
-        # Initialize tagging framework first (applies to all subsequent resources)
-        self.tagging_framework = TaggingFramework(
-            self, "TaggingFramework",
-            environment_name=environment_name
-        )
-        
-        # Tags are applied by TaggingFramework aspects
-        
-        # Initialize core constructs
+        # Note: Log group deletion policies are handled by disabling CDK auto-creation
+        # and managing log groups explicitly with RemovalPolicy.DESTROY where needed
+    
+
+    
+    def _requested_components(self) -> Optional[Set[str]]:
+        """Components named by the explicit bb-components context, or None for all"""
+        requested = self.node.try_get_context("bb-components")
+        if not requested:
+            return None
+        if isinstance(requested, str):
+            requested = requested.split(",")
+        return {name.strip() for name in requested if name.strip()} or None
+
+    def _resolve_components(self, requested: Optional[Set[str]]) -> List[str]:
+        """Return the components to build, in dependency order"""
+        dependencies = {name: deps for name, _, deps in self._constructs}
+
+        if requested is None:
+            selected = set(dependencies)
+        else:
+            unknown = set(requested) - set(dependencies)
+            if unknown:
+                raise ValueError(
+                    f"Unknown component(s) {sorted(unknown)}; expected any of {list(dependencies)}"
+                )
+            # Dependency closure of the requested components
+            selected: Set[str] = set()
+            pending = list(requested)
+            while pending:
+                name = pending.pop()
+                if name not in selected:
+                    selected.add(name)
+                    pending.extend(dependencies[name])
+
+        # Validates the graph (raises CycleError); ties keep the declared order
+        declared = {name: index for index, (name, _, _) in enumerate(self._constructs)}
+        ordered = list(TopologicalSorter({name: dependencies[name] for name in selected}).static_order())
+        return sorted(ordered, key=declared.__getitem__)
+
+    def _is_enabled(self, *components: str) -> bool:
+        """Check whether all given components are part of this synth"""
+        return all(component in self._enabled_components for component in components)
+
+    def _dashboards_enabled(self) -> bool:
+        """Dedicated dashboards are on unless skipped with `cdk synth -c create_dashboards=false`"""
+        return self.node.try_get_context("create_dashboards") not in (False, "false")
+
+    def _create_security(self) -> None:
+        """Initialize IAM roles and policies"""
+        from .constructs.security import SecurityConstruct
         self.security = SecurityConstruct(
             self, "Security",
-            environment_name=environment_name
+            environment_name=self.environment_name
         )
-        
+
+    def _create_data_storage(self) -> None:
+        """Initialize DynamoDB tables"""
+        from .constructs.data_storage import DataStorageConstruct
         self.data_storage = DataStorageConstruct(
-            self, "DataStorage", 
-            environment_name=environment_name,
+            self, "DataStorage",
+            environment_name=self.environment_name,
             kms_key=self.kms_key
         )
-        
-        # Initialize log storage with user-provided KMS key
+
+    def _create_log_storage(self) -> None:
+        """Initialize log storage with user-provided KMS key"""
+        from .constructs.log_storage import LogStorageConstruct
         self.log_storage = LogStorageConstruct(
             self, "LogStorage",
-            environment_name=environment_name,
+            environment_name=self.environment_name,
             kms_key=self.kms_key
         )
-        
-        # Create configuration management
+
+    def _create_configuration(self) -> None:
+        """Create configuration management"""
+        from .constructs.configuration import ConfigurationConstruct
         self.configuration = ConfigurationConstruct(
             self, "Configuration",
-            environment_name=environment_name,
+            environment_name=self.environment_name,
             kms_key=self.kms_key
         )
-        
-        # Initialize core processing Lambda functions first (needed for event ingestion)
+
+    def _create_core_processing(self) -> None:
+        """Initialize core processing Lambda functions (needed for event ingestion)"""
+        from .constructs.core_processing import CoreProcessingConstruct
+        self.shared = self.shared.with_updates(
+            tables=self.data_storage.tables,
+            bucket=self.log_storage.logs_bucket,
+            roles=self.security.roles,
+        )
         self.core_processing = CoreProcessingConstruct(
             self, "CoreProcessing",
-            environment_name=environment_name,
-            dynamodb_tables=self.data_storage.tables,
-            s3_bucket=self.log_storage.logs_bucket,
-            lambda_execution_role=self.security.roles["lambda_execution"],
-            kms_key=self.kms_key
+            environment_name=self.environment_name,
+            shared=self.shared
         )
-        
-        # Initialize event ingestion with usage calculator for real-time processing
+        self.shared = self.shared.with_updates(
+            functions=self.core_processing.functions,
+            queues=self.core_processing.dead_letter_queues,
+        )
+
+    def _create_event_ingestion(self) -> None:
+        """Initialize event ingestion with usage calculator for real-time processing"""
+        from aws_cdk import aws_logs as logs
+        from .constructs.event_ingestion import EventIngestionConstruct
         self.event_ingestion = EventIngestionConstruct(
             self, "EventIngestion",
-            environment_name=environment_name,
+            environment_name=self.environment_name,
             s3_bucket=self.log_storage.logs_bucket,
             kms_key=self.kms_key,
             usage_calculator_function=self.core_processing.functions["usage_calculator"],
             log_retention_days=logs.RetentionDays.ONE_WEEK  # Use 7 days default, should match parameter
         )
-        
+
+    def _create_monitoring(self) -> None:
+        """Initialize CloudWatch monitoring and SNS topics"""
+        from .constructs.monitoring import MonitoringConstruct
         self.monitoring = MonitoringConstruct(
             self, "Monitoring",
-            environment_name=environment_name,
+            environment_name=self.environment_name,
             log_retention_parameter_name=self.configuration.get_parameter_reference("monitoring", "log_retention_days")
         )
-        
-        # Initialize workflow orchestration
+        self.shared = self.shared.with_updates(topics=self.monitoring.topics)
+
+    def _create_workflow_orchestration(self) -> None:
+        """Initialize workflow orchestration"""
+        from .constructs.workflow_orchestration import WorkflowOrchestrationConstruct
         self.workflow_orchestration = WorkflowOrchestrationConstruct(
             self, "WorkflowOrchestration",
-            environment_name=environment_name,
-            dynamodb_tables=self.data_storage.tables,
-            lambda_functions=self.core_processing.functions,
-            step_functions_role=self.security.roles["step_functions"],
-            lambda_execution_role=self.security.roles["lambda_execution"],
-            sns_topics=self.monitoring.topics,
-            kms_key=self.kms_key
+            environment_name=self.environment_name,
+            shared=self.shared
         )
-        
+
+    def _create_feature_flagged_components(self) -> None:
+        """Deploy AgentCore, key provisioning and cost allocation support when enabled"""
+        environment_name = self.environment_name
+
         # Deploy AgentCore budgeting (feature-flagged)
         feature_flags = self.node.try_get_context("bedrock-budgeteer:feature-flags") or {}
         if feature_flags.get("enable_agentcore_budgeting"):
+            from .constructs.agentcore import AgentCoreConstruct
             self.agentcore = AgentCoreConstruct(
                 self, "AgentCore",
                 environment_name=environment_name,
@@ -152,6 +289,7 @@ class BedrockBudgeteerStack(Stack):
         if feature_flags.get("enable_cost_allocation_reporting"):
             self.security.add_cost_explorer_permissions()
 
+            from .constructs.cost_allocation_reporting import CostAllocationReportingConstruct
             self.cost_allocation_reporting = CostAllocationReportingConstruct(
                 self, "CostAllocationReporting",
                 environment_name=environment_name,
@@ -163,52 +301,36 @@ class BedrockBudgeteerStack(Stack):
 
             # Create cost allocation dashboard
             self.monitoring.create_cost_allocation_dashboard()
-
-        # Add additional permissions to security roles
-        self._configure_security_permissions()
-        
-        # Set up monitoring for created resources
-        self._setup_monitoring()
-        
-        # Set up ingestion pipeline monitoring
-        self._setup_ingestion_monitoring()
-        
-        # Set up core processing monitoring
-        self._setup_core_processing_monitoring()
-        
-        # Set up workflow orchestration monitoring
-        self._setup_workflow_monitoring()
-        
-        # Enable Phase 5: Advanced notifications and business metrics
-        self._enable_phase5_features()
-        
-        # Phase 6: Operational Controls removed per changelog - see 2025-09-02 updates
-        # Emergency controls and maintenance mode no longer needed
-        
-        # Note: Log group deletion policies are handled by disabling CDK auto-creation
-        # and managing log groups explicitly with RemovalPolicy.DESTROY where needed
-    
-
     
     def _configure_security_permissions(self) -> None:
         """Configure additional security permissions for service integration"""
+        # Service statements are collected and attached to the Lambda role as one policy
+        statements: List["iam.PolicyStatement"] = []
+        
         # Add Bedrock permissions for cost monitoring
-        self.security.add_bedrock_permissions()
+        self.security.add_bedrock_permissions(statements)
         
         # Add Pricing API permissions for cost calculation
-        self.security.add_pricing_api_permissions()
+        self.security.add_pricing_api_permissions(statements)
         
         # Add CloudTrail permissions for usage tracking
-        self.security.add_cloudtrail_permissions()
+        self.security.add_cloudtrail_permissions(statements)
         
         # Add SSM permissions for configuration access
-        self.security.add_ssm_permissions()
+        self.security.add_ssm_permissions(statements)
         
         # Add IAM read permissions for policy management
-        self.security.add_iam_read_permissions()
+        self.security.add_iam_read_permissions(statements)
         
         # Add CloudWatch metrics permissions
-        self.security.add_cloudwatch_metrics_permissions()
+        self.security.add_cloudwatch_metrics_permissions(statements)
+        
+        # Add AgentCore IAM permissions if feature is enabled
+        feature_flags = self.node.try_get_context("bedrock-budgeteer:feature-flags") or {}
+        if feature_flags.get("enable_agentcore_budgeting"):
+            self.security.add_agentcore_iam_permissions(statements)
+        
+        self.security.attach_lambda_policy("LambdaServicePermissions", statements)
         
         # Add DynamoDB permissions for core processing tables
         self.security.add_dynamodb_permissions(self.data_storage.tables)
@@ -216,167 +338,168 @@ class BedrockBudgeteerStack(Stack):
         # Add S3 permissions for log processing
         self.security.add_s3_permissions(self.log_storage.logs_bucket)
         
-        # Add SQS permissions for DLQ access
-        self.security.add_sqs_permissions(self.core_processing.dead_letter_queues)
-
-        # Add AgentCore IAM permissions if feature is enabled
-        feature_flags = self.node.try_get_context("bedrock-budgeteer:feature-flags") or {}
-        if feature_flags.get("enable_agentcore_budgeting"):
-            self.security.add_agentcore_iam_permissions()
+        # SQS permissions for DLQ access are granted in _wire_dlqs
+    
+    def _wire_dlqs(self, dlqs: Dict[str, "sqs.IQueue"]) -> None:
+        """Grant send access to and monitor each dead letter queue in a single pass"""
+        monitor = self._is_enabled("Monitoring")
+        for name, queue in dlqs.items():
+            self.security.add_sqs_permissions_one(queue)
+            if monitor:
+                self.monitoring.add_sqs_monitoring(f"{name}_dlq", queue)
     
     def _setup_monitoring(self) -> None:
         """Set up monitoring for all created resources"""
         # Add monitoring for DynamoDB tables
-        for table_name, table in self.data_storage.tables.items():
-            self.monitoring.add_dynamodb_monitoring(table_name, table)
+        self.monitoring.add_dynamodb_monitoring_bulk(self.data_storage.tables)
         
-        # Add email subscriptions if environment variables are set
-        ops_email = os.getenv("OPS_EMAIL")
-        if ops_email:
-            self.monitoring.add_email_subscription("high_severity", ops_email)
-            self.monitoring.add_email_subscription("operational_alerts", ops_email)
+        # Email subscriptions are added once in _setup_notification_channels
     
     def _setup_ingestion_monitoring(self) -> None:
         """Set up monitoring for the ingestion pipeline"""
-        # Create ingestion pipeline dashboard
-        self.monitoring.create_ingestion_pipeline_dashboard()
+        # Create ingestion pipeline dashboard (opt-in, dashboards add large JSON bodies to the template)
+        if self.node.try_get_context("enable-dashboards") and self._dashboards_enabled():
+            self.monitoring.create_ingestion_pipeline_dashboard()
         
         # Add monitoring for CloudTrail trails
-        for trail_name, trail in self.event_ingestion.cloudtrail_trails.items():
-            self.monitoring.add_cloudtrail_monitoring(trail_name, trail)
+        self.monitoring.add_cloudtrail_monitoring_bulk(self.event_ingestion.cloudtrail_trails)
         
         # Add monitoring for EventBridge rules
-        for rule_name, rule in self.event_ingestion.eventbridge_rules.items():
-            self.monitoring.add_eventbridge_monitoring(rule_name, rule)
+        self.monitoring.add_eventbridge_monitoring_bulk(self.event_ingestion.eventbridge_rules)
         
         # Add monitoring for Firehose streams
-        for stream_name, stream in self.event_ingestion.firehose_streams.items():
-            self.monitoring.add_firehose_monitoring(stream_name, stream)
+        self.monitoring.add_firehose_monitoring_bulk(self.event_ingestion.firehose_streams)
         
         # Add monitoring for S3 buckets
-        for bucket_name, bucket in self.log_storage.buckets.items():
-            self.monitoring.add_s3_monitoring(bucket_name, bucket)
+        self.monitoring.add_s3_monitoring_bulk(self.log_storage.buckets)
         
         # Add monitoring for CloudWatch log groups (Bedrock invocation logs)
-        for log_group_name, log_group in self.event_ingestion.log_groups.items():
-            self.monitoring.add_log_group_monitoring(log_group_name, log_group)
+        self.monitoring.add_log_group_monitoring_bulk(self.event_ingestion.log_groups)
     
     def _setup_core_processing_monitoring(self) -> None:
         """Set up monitoring for core processing Lambda functions"""
         # Add monitoring for Lambda functions
-        for function_name, function in self.core_processing.functions.items():
-            self.monitoring.add_lambda_monitoring(function_name, function)
+        self.monitoring.add_lambda_monitoring_bulk(self.core_processing.functions)
         
-        # Add monitoring for DLQ queues
-        for queue_name, queue in self.core_processing.dead_letter_queues.items():
-            self.monitoring.add_sqs_monitoring(f"{queue_name}_dlq", queue)
-    
+        # DLQ monitoring is added in _wire_dlqs
+
     def _setup_workflow_monitoring(self) -> None:
         """Set up monitoring for workflow orchestration"""
         # Add monitoring for workflow Lambda functions
-        for function_name, function in self.workflow_orchestration.workflow_functions.items():
-            self.monitoring.add_lambda_monitoring(f"workflow_{function_name}", function)
+        self.monitoring.add_lambda_monitoring_bulk(
+            self.workflow_orchestration.workflow_functions, "workflow_{}"
+        )
         
         # Add monitoring for workflow DLQ queues
-        for queue_name, queue in self.workflow_orchestration.workflow_dlqs.items():
-            self.monitoring.add_sqs_monitoring(f"workflow_{queue_name}_dlq", queue)
+        self.monitoring.add_sqs_monitoring_bulk(
+            self.workflow_orchestration.workflow_dlqs, "workflow_{}_dlq"
+        )
         
         # Add monitoring for Step Functions state machines
-        for machine_name, machine in self.workflow_orchestration.state_machines.items():
-            self.monitoring.add_stepfunctions_monitoring(machine_name, machine)
+        self.monitoring.add_stepfunctions_monitoring_bulk(self.workflow_orchestration.state_machines)
         
         # Create workflow dashboard
-        self.monitoring.create_workflow_dashboard()
+        if self._dashboards_enabled():
+            self.monitoring.create_workflow_dashboard()
     
     def _enable_phase5_features(self) -> None:
         """Enable Phase 5 advanced monitoring and notification features"""
-        # Create custom business metrics and alarms
-        self.monitoring.create_custom_business_metrics()
+        # Business alarms only matter when something is subscribed to receive them
+        has_notification_sink = any((
+            self._ops_email, self._slack_webhook, self._ops_phone, self._webhook_url
+        ))
+        if has_notification_sink:
+            # Create custom business metrics and alarms
+            self.monitoring.create_custom_business_metrics()
+        else:
+            Annotations.of(self).add_warning(
+                "No notification channel configured (OPS_EMAIL, SLACK_WEBHOOK_URL, OPS_PHONE_NUMBER, "
+                "EXTERNAL_WEBHOOK_URL or alert_email); skipping business metric alarms"
+            )
         
         # Set up multi-channel notifications based on environment
         self._setup_notification_channels()
     
+    def _resolve_ops_email(self) -> Optional[str]:
+        """Resolve the operations email from OPS_EMAIL, falling back to CDK context alert-email"""
+        ops_email = os.environ.get("OPS_EMAIL")
+        if not ops_email:
+            config = self.node.try_get_context("bedrock-budgeteer:config")
+            if config:
+                ops_email = config.get("alert-email")
+        return ops_email or None
+    
     def _setup_notification_channels(self) -> None:
         """Set up multi-channel notification integrations"""
         # Add notification channels
-        slack_webhook = os.getenv("SLACK_WEBHOOK_URL")
-        if slack_webhook:
-            self.monitoring.add_slack_subscription("high_severity", slack_webhook)
-            self.monitoring.add_slack_subscription("operational_alerts", slack_webhook)
+        if self._slack_webhook:
+            self.monitoring.add_slack_subscription("high_severity", self._slack_webhook)
+            self.monitoring.add_slack_subscription("operational_alerts", self._slack_webhook)
         
         # SMS for critical budget alerts
-        ops_phone = os.getenv("OPS_PHONE_NUMBER")
-        if ops_phone:
-            self.monitoring.add_sms_subscription("high_severity", ops_phone)
+        if self._ops_phone:
+            self.monitoring.add_sms_subscription("high_severity", self._ops_phone)
         
         # Generic webhook for external integrations
-        webhook_url = os.getenv("EXTERNAL_WEBHOOK_URL")
-        if webhook_url:
+        if self._webhook_url:
             webhook_headers = {
-                "Authorization": f"Bearer {os.getenv('WEBHOOK_AUTH_TOKEN', '')}",
-                "X-Source": "bedrock-budgeteer"
+                **_WEBHOOK_HEADER_TEMPLATE,
+                "Authorization": f"Bearer {os.environ.get('WEBHOOK_AUTH_TOKEN', '')}",
             }
-            self.monitoring.add_webhook_subscription("budget_alerts", webhook_url, webhook_headers)
+            self.monitoring.add_webhook_subscription("budget_alerts", self._webhook_url, webhook_headers)
         
         # Email notifications
-        ops_email = os.getenv("OPS_EMAIL")
-        if not ops_email:
-            # Fallback to CDK context alert-email if environment variable not set
-            ops_email = self.node.try_get_context("bedrock-budgeteer:config")
-            if ops_email:
-                ops_email = ops_email.get("alert-email")
-        
-        if ops_email:
-            self.monitoring.add_email_subscription("operational_alerts", ops_email)
-            self.monitoring.add_email_subscription("budget_alerts", ops_email)
-            self.monitoring.add_email_subscription("high_severity", ops_email)
+        if self._ops_email:
+            self.monitoring.add_email_subscription("operational_alerts", self._ops_email)
+            self.monitoring.add_email_subscription("budget_alerts", self._ops_email)
+            self.monitoring.add_email_subscription("high_severity", self._ops_email)
     
-    @property
+    @cached_property
     def dynamodb_tables(self) -> Dict[str, Any]:
         """Expose DynamoDB tables for use by other constructs"""
         return self.data_storage.tables
     
-    @property
+    @cached_property
     def iam_roles(self) -> Dict[str, Any]:
         """Expose IAM roles for use by other constructs"""
         return self.security.roles
     
-    @property
+    @cached_property
     def sns_topics(self) -> Dict[str, Any]:
         """Expose SNS topics for use by other constructs"""
         return self.monitoring.topics
     
-    @property
+    @cached_property
     def s3_buckets(self) -> Dict[str, Any]:
         """Expose S3 buckets for use by other constructs"""
         return self.log_storage.buckets
     
-    @property
+    @cached_property
     def cloudtrail_trails(self) -> Dict[str, Any]:
         """Expose CloudTrail trails for use by other constructs"""
         return self.event_ingestion.cloudtrail_trails
     
-    @property
+    @cached_property
     def eventbridge_rules(self) -> Dict[str, Any]:
         """Expose EventBridge rules for use by other constructs"""
         return self.event_ingestion.eventbridge_rules
     
-    @property
+    @cached_property
     def firehose_streams(self) -> Dict[str, Any]:
         """Expose Kinesis Firehose streams for use by other constructs"""
         return self.event_ingestion.firehose_streams
     
-    @property
+    @cached_property
     def lambda_functions(self) -> Dict[str, Any]:
         """Expose Lambda functions for use by other constructs"""
         return self.core_processing.functions
     
-    @property
+    @cached_property
     def dlq_queues(self) -> Dict[str, Any]:
         """Expose dead letter queues for monitoring"""
         return self.core_processing.dead_letter_queues
     
-    @property
+    @cached_property
     def step_functions_state_machines(self) -> Dict[str, Any]:
         """Expose Step Functions state machines"""
         return {
@@ -384,7 +507,7 @@ class BedrockBudgeteerStack(Stack):
             "restoration": self.workflow_orchestration.restoration_state_machine
         }
     
-    @property
+    @cached_property
     def workflow_functions(self) -> Dict[str, Any]:
         """Expose workflow Lambda functions"""
         return self.workflow_orchestration.workflow_functions
@@ -403,7 +526,5 @@ class BedrockBudgeteerStack(Stack):
         return self.event_ingestion.bedrock_invocation_log_group.log_group_name
 
 
-# Legacy class name for backward compatibility  
-class AppStack(BedrockBudgeteerStack):
-    """Backward compatibility wrapper"""
-    pass
+# Legacy name kept for backward compatibility (plain alias, not a subclass)
+AppStack = BedrockBudgeteerStack
@@ -27,6 +27,9 @@ from .shared.lambda_utilities import get_shared_lambda_utilities
 from .shared.agentcore_helpers import get_agentcore_helpers
 from .workflow_lambda_functions.agentcore_iam_utilities import get_agentcore_iam_utilities_function_code
 
+# Runtime lifecycle calls routed to agentcore_setup; the CloudTrail trail records these
+AGENTCORE_LIFECYCLE_EVENT_NAMES = ["CreateAgentRuntime", "UpdateAgentRuntime", "DeleteAgentRuntime"]
+
 
 class AgentCoreConstruct(Construct):
     """Construct for AgentCore runtime budget monitoring and enforcement"""
@@ -211,7 +214,7 @@ class AgentCoreConstruct(Construct):
                 source=["aws.bedrock-agentcore"],
                 detail={
                     "eventSource": ["bedrock-agentcore.amazonaws.com"],
-                    "eventName": ["CreateAgentRuntime", "UpdateAgentRuntime", "DeleteAgentRuntime"]
+                    "eventName": AGENTCORE_LIFECYCLE_EVENT_NAMES
                 }
             )
         )
@@ -2,7 +2,7 @@
 Configuration Management Construct for Bedrock Budgeteer
 Manages SSM Parameter Store hierarchy and application configuration
 """
-from typing import Dict, Optional
+from typing import Dict, Final, Optional, Tuple
 from aws_cdk import (
     aws_ssm as ssm,
     aws_kms as kms,
@@ -10,9 +10,70 @@ from aws_cdk import (
 from constructs import Construct
 
 
+_PARAM_TEMPLATE = "/bedrock-budgeteer/{env}/{category}/{key}"
+_GLOBAL_PARAM_TEMPLATE = "/bedrock-budgeteer/{category}/{key}"
+
+# Static parameter definitions, one flat row per parameter:
+# (category, key, default value, description, is_global, runtime_mutable).
+# Built once at import; only the values are overridden from YAML context per stack.
+# Parameters that no Lambda reads at runtime are not runtime_mutable and get no SSM resource.
+_ALL_PARAMS: Final[Tuple[Tuple[str, str, object, str, bool, bool], ...]] = (
+    ("cost", "budget_refresh_period_days", 30,
+     "Budget refresh period in days (resets budget and counters)", False, True),
+    ("global", "thresholds_percent_warn", 70, "Budget warning threshold percentage", True, True),
+    ("global", "thresholds_percent_critical", 90, "Budget critical threshold percentage", True, True),
+    ("global", "default_user_budget_usd", 1, "Default budget limit for users in USD", True, True),
+    ("global", "grace_period_seconds", 300,
+     "Grace period in seconds before suspending users who exceed budget", True, True),
+    ("monitoring", "log_retention_days", 7, "CloudWatch log group retention period in days", False, False),
+)
+
+# Feature-flagged parameter definitions: key -> (default value, description)
+_AGENTCORE_CONFIG: Final[Dict[str, Tuple[object, str]]] = {
+    "global_budget_limit_usd": (500, "Global budget pool for all AgentCore runtimes (USD)"),
+    "grace_period_seconds": (3600, "Grace period before AgentCore runtime suspension (seconds)"),
+    "warning_threshold_percent": (75, "Warning threshold for AgentCore budget utilization"),
+    "critical_threshold_percent": (90, "Critical threshold for AgentCore budget utilization"),
+    "default_per_agent_budget_usd": ("none", "Default per-agent budget in USD (none = draws from pool)"),
+}
+
+_KEY_PROVISIONING_CONFIG: Final[Dict[str, Tuple[object, str]]] = {
+    "api_key_pool_budget_usd": (500, "Global budget pool for all Bedrock API keys (USD)"),
+    "budget_tier_low_usd": (1, "Budget limit for low-tier API keys (USD)"),
+    "budget_tier_medium_usd": (5, "Budget limit for medium-tier API keys (USD)"),
+    "budget_tier_high_usd": (25, "Budget limit for high-tier API keys (USD)"),
+    "api_key_global_cap_usd": (1000, "Global cap guardrail across all API keys (USD)"),
+}
+
+# CDK context key holding the YAML overrides for each category
+_OVERRIDE_CONTEXT_KEYS: Dict[str, str] = {
+    "cost": "bedrock-budgeteer:budgets",
+    "global": "bedrock-budgeteer:budgets",
+    "monitoring": "bedrock-budgeteer:retention",
+}
+
+# Construct IDs, generated once rather than per stack
+_LOGICAL_IDS: Dict[Tuple[str, str], str] = {
+    (category, key): f"{'Global' if is_global else ''}{category.title()}{key.title()}Parameter"
+    for category, key, _, _, is_global, _ in _ALL_PARAMS
+}
+
+# Global names do not depend on the environment, so they are resolved at import
+_GLOBAL_PARAM_NAMES: Dict[Tuple[str, str], str] = {
+    (category, key): _GLOBAL_PARAM_TEMPLATE.format(category=category, key=key)
+    for category, key, _, _, is_global, _ in _ALL_PARAMS
+    if is_global
+}
+
+
 class ConfigurationConstruct(Construct):
     """Construct for managing application configuration via SSM Parameter Store"""
     
+    # Built-in defaults keyed by "category/key", available without creating any resource
+    _STATIC_DEFAULTS: Dict[str, str] = {
+        f"{category}/{key}": str(default) for category, key, default, _, _, _ in _ALL_PARAMS
+    }
+    
     def __init__(self, scope: Construct, construct_id: str, 
                  environment_name: str, kms_key: Optional[kms.Key] = None, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -20,11 +81,16 @@ class ConfigurationConstruct(Construct):
         self.environment_name = environment_name
         self.kms_key = kms_key
         self.parameters: Dict[str, ssm.StringParameter] = {}
+        # Effective value of every configured parameter, including ones without an SSM resource
+        self.values: Dict[str, str] = {}
+        # Environment-scoped names resolved up front; get_parameter_reference is called repeatedly
+        self._param_names: Dict[Tuple[str, str], str] = {
+            (category, key): _PARAM_TEMPLATE.format(env=environment_name, category=category, key=key)
+            for category, key, _, _, _, _ in _ALL_PARAMS
+        }
         
         # Create parameter hierarchy - only parameters that are actually used
-        self._create_cost_config()  # Only budget_refresh_period_days is used
-        self._create_global_config()  # Thresholds, budgets, and control flags
-        self._create_monitoring_config()  # Log retention and monitoring settings
+        self._create_core_config()
 
         # Add AgentCore config if feature is enabled
         feature_flags = self.node.try_get_context("bedrock-budgeteer:feature-flags") or {}
@@ -35,35 +101,47 @@ class ConfigurationConstruct(Construct):
         if feature_flags.get("enable_key_provisioning"):
             self._create_key_provisioning_config()
 
-        # Tags are applied by TaggingFramework aspects
+        # Tags are applied by the stack via apply_tags
     
     def _get_parameter_name(self, category: str, key: str) -> str:
         """Generate standardized parameter name"""
-        return f"/bedrock-budgeteer/{self.environment_name}/{category}/{key}"
+        name = self._param_names.get((category, key))
+        if name is None:
+            name = self._param_names[(category, key)] = _PARAM_TEMPLATE.format(
+                env=self.environment_name, category=category, key=key
+            )
+        return name
     
     def _get_global_parameter_name(self, category: str, key: str) -> str:
         """Generate global parameter name (without environment)"""
-        return f"/bedrock-budgeteer/{category}/{key}"
+        name = _GLOBAL_PARAM_NAMES.get((category, key))
+        if name is None:
+            name = _GLOBAL_PARAM_TEMPLATE.format(category=category, key=key)
+        return name
     
     def _create_secure_parameter(self, category: str, key: str, value: str, 
                                description: str) -> ssm.StringParameter:
         """Create a secure string parameter with KMS encryption"""
+        construct_id = f"{category.title()}{key.title()}Parameter"
         parameter_name = self._get_parameter_name(category, key)
         
-        param_props = {
-            "parameter_name": parameter_name,
-            "string_value": value,
-            "description": description,
-            "tier": ssm.ParameterTier.STANDARD
-        }
-        
         # Use custom KMS key if provided
         if self.kms_key:
-            param_props["encryption_key"] = self.kms_key
+            return ssm.StringParameter(
+                self, construct_id,
+                parameter_name=parameter_name,
+                string_value=value,
+                description=description,
+                tier=ssm.ParameterTier.STANDARD,
+                encryption_key=self.kms_key
+            )
         
         return ssm.StringParameter(
-            self, f"{category.title()}{key.title()}Parameter",
-            **param_props
+            self, construct_id,
+            parameter_name=parameter_name,
+            string_value=value,
+            description=description,
+            tier=ssm.ParameterTier.STANDARD
         )
     
     def _create_standard_parameter(self, category: str, key: str, value: str,
@@ -96,177 +174,62 @@ class ConfigurationConstruct(Construct):
     
     # Removed _create_security_config - all parameters were unused
     
-    def _create_monitoring_config(self) -> None:
-        """Create monitoring configuration parameters"""
-        monitoring_config = self._get_monitoring_config()
-        
-        for key, config in monitoring_config.items():
-            self.parameters[f"monitoring_{key}"] = self._create_standard_parameter(
-                category="monitoring",
-                key=key,
-                value=config["value"],
-                description=config["description"]
-            )
-    
     # Removed _create_integration_config - all parameters were unused
     
-    def _create_cost_config(self) -> None:
-        """Create cost and budget configuration parameters"""
-        cost_config = self._get_cost_config()
-        
-        for key, config in cost_config.items():
-            self.parameters[f"cost_{key}"] = self._create_standard_parameter(
-                category="cost",
-                key=key,
-                value=config["value"],
-                description=config["description"]
-            )
-    
-    # Removed _get_application_config - all parameters were unused
-    
-    # Removed _get_security_config - all parameters were unused
-    
-    def _get_monitoring_config(self) -> Dict[str, Dict[str, str]]:
-        """Get monitoring configuration from YAML config context."""
-        retention = self.node.try_get_context("bedrock-budgeteer:retention") or {}
-
-        monitoring_config = {
-            "log_retention_days": {
-                "value": str(retention.get("log_retention_days", 7)),
-                "description": "CloudWatch log group retention period in days"
-            }
-        }
-
-        return monitoring_config
-    
-    # Removed _get_integration_config - all parameters were unused
-    
-    def _get_cost_config(self) -> Dict[str, Dict[str, str]]:
-        """Get cost and budget configuration from YAML config context."""
-        budgets = self.node.try_get_context("bedrock-budgeteer:budgets") or {}
-
-        cost_config = {
-            "budget_refresh_period_days": {
-                "value": str(budgets.get("budget_refresh_period_days", 30)),
-                "description": "Budget refresh period in days (resets budget and counters)"
-            }
-        }
-
-        return cost_config
-    
     # Removed _create_workflow_config - all parameters were unused
     
-    def _create_global_config(self) -> None:
-        """Create global system configuration parameters"""
-        global_config = self._get_global_config()
+    def _create_core_config(self) -> None:
+        """Create cost, global and monitoring parameters in a single pass over _ALL_PARAMS"""
+        overrides = {
+            category: self.node.try_get_context(context_key) or {}
+            for category, context_key in _OVERRIDE_CONTEXT_KEYS.items()
+        }
         
-        for key, config in global_config.items():
-            self.parameters[f"global_{key}"] = self._create_global_parameter(
-                category="global",
-                key=key,
-                value=config["value"],
-                description=config["description"]
+        for category, key, default, description, is_global, runtime_mutable in _ALL_PARAMS:
+            value = str(overrides[category].get(key, default))
+            self.values[f"{category}/{key}"] = value
+            if not runtime_mutable:
+                continue
+            self.parameters[f"{category}_{key}"] = ssm.StringParameter(
+                self, _LOGICAL_IDS[(category, key)],
+                parameter_name=(self._get_global_parameter_name(category, key) if is_global
+                                else self._get_parameter_name(category, key)),
+                string_value=value,
+                description=description,
+                tier=ssm.ParameterTier.STANDARD
             )
     
-    # Removed _get_workflow_config - all parameters were unused
-    
-    def _get_global_config(self) -> Dict[str, Dict[str, str]]:
-        """Get global system configuration from YAML config context."""
-        budgets = self.node.try_get_context("bedrock-budgeteer:budgets") or {}
-
-        global_config = {
-            "thresholds_percent_warn": {
-                "value": str(budgets.get("thresholds_percent_warn", 70)),
-                "description": "Budget warning threshold percentage"
-            },
-            "thresholds_percent_critical": {
-                "value": str(budgets.get("thresholds_percent_critical", 90)),
-                "description": "Budget critical threshold percentage"
-            },
-            "default_user_budget_usd": {
-                "value": str(budgets.get("default_user_budget_usd", 1)),
-                "description": "Default budget limit for users in USD"
-            },
-            "grace_period_seconds": {
-                "value": str(budgets.get("grace_period_seconds", 300)),
-                "description": "Grace period in seconds before suspending users who exceed budget"
-            }
-        }
-
-        return global_config
-    
     # Removed _get_max_budget_value - no longer needed
 
     def _create_agentcore_config(self) -> None:
         """Create AgentCore budget configuration parameters from YAML config."""
         ac = self.node.try_get_context("bedrock-budgeteer:agentcore") or {}
 
-        agentcore_config = {
-            "global_budget_limit_usd": {
-                "value": str(ac.get("global_budget_limit_usd", 500)),
-                "description": "Global budget pool for all AgentCore runtimes (USD)"
-            },
-            "grace_period_seconds": {
-                "value": str(ac.get("grace_period_seconds", 3600)),
-                "description": "Grace period before AgentCore runtime suspension (seconds)"
-            },
-            "warning_threshold_percent": {
-                "value": str(ac.get("warning_threshold_percent", 75)),
-                "description": "Warning threshold for AgentCore budget utilization"
-            },
-            "critical_threshold_percent": {
-                "value": str(ac.get("critical_threshold_percent", 90)),
-                "description": "Critical threshold for AgentCore budget utilization"
-            },
-            "default_per_agent_budget_usd": {
-                "value": str(ac.get("default_per_agent_budget_usd", "none")),
-                "description": "Default per-agent budget in USD (none = draws from pool)"
-            }
-        }
-
-        for key, config in agentcore_config.items():
+        for key, (default, description) in _AGENTCORE_CONFIG.items():
             self.parameters[f"agentcore_{key}"] = self._create_global_parameter(
                 category="global/agentcore",
                 key=key,
-                value=config["value"],
-                description=config["description"]
+                value=str(ac.get(key, default)),
+                description=description
             )
 
     def _create_key_provisioning_config(self) -> None:
         """Create Key Provisioning budget configuration parameters from YAML config."""
         kp = self.node.try_get_context("bedrock-budgeteer:key-provisioning") or {}
 
-        key_provisioning_config = {
-            "api_key_pool_budget_usd": {
-                "value": str(kp.get("api_key_pool_budget_usd", 500)),
-                "description": "Global budget pool for all Bedrock API keys (USD)"
-            },
-            "budget_tier_low_usd": {
-                "value": str(kp.get("budget_tier_low_usd", 1)),
-                "description": "Budget limit for low-tier API keys (USD)"
-            },
-            "budget_tier_medium_usd": {
-                "value": str(kp.get("budget_tier_medium_usd", 5)),
-                "description": "Budget limit for medium-tier API keys (USD)"
-            },
-            "budget_tier_high_usd": {
-                "value": str(kp.get("budget_tier_high_usd", 25)),
-                "description": "Budget limit for high-tier API keys (USD)"
-            },
-            "api_key_global_cap_usd": {
-                "value": str(kp.get("api_key_global_cap_usd", 1000)),
-                "description": "Global cap guardrail across all API keys (USD)"
-            }
-        }
-
-        for key, config in key_provisioning_config.items():
+        for key, (default, description) in _KEY_PROVISIONING_CONFIG.items():
             self.parameters[f"key_provisioning_{key}"] = self._create_global_parameter(
                 category="global",
                 key=key,
-                value=config["value"],
-                description=config["description"]
+                value=str(kp.get(key, default)),
+                description=description
             )
 
+    def get_default(self, category: str, key: str) -> Optional[str]:
+        """Get a configured value in Python without resolving it from SSM"""
+        name = f"{category}/{key}"
+        return self.values.get(name, self._STATIC_DEFAULTS.get(name))
+    
     def get_parameter_reference(self, category: str, key: str) -> str:
         """Get SSM parameter reference for use in other constructs"""
         return self._get_parameter_name(category, key)
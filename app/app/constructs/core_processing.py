@@ -2,11 +2,14 @@
 Core Processing Construct - Refactored
 Implements Lambda functions for processing events, calculating costs, and monitoring budgets
 """
-from typing import Dict, Any, Optional
+import json
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from aws_cdk import (
     Duration,
     RemovalPolicy,
     aws_lambda as lambda_,
+    aws_lambda_event_sources as lambda_event_sources,
     aws_iam as iam,
     aws_dynamodb as dynamodb,
     aws_s3 as s3,
@@ -17,10 +20,62 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+from .shared_resources import SharedResources
+
 # Import shared utilities and Lambda function implementations
-from .shared.lambda_utilities import get_shared_lambda_utilities
+from .shared.lambda_utilities import (
+    build_function_asset,
+    build_shared_utilities_layer,
+    get_shared_utilities_import,
+)
 from .lambda_functions.user_setup import get_user_setup_function_code
 from .lambda_functions.usage_calculator import get_usage_calculator_function_code
+from .lambda_functions.budget_enforcement import get_budget_enforcement_code
+from .lambda_functions.budget_monitor_stream import get_budget_monitor_stream_function_code
+from .lambda_functions.audit_logger import get_audit_logger_function_code
+
+
+# Minimal model list used when the Bedrock API cannot be reached (at synth or at runtime)
+ESSENTIAL_FOUNDATION_MODELS: List[str] = [
+    'anthropic.claude-3-sonnet-20240229-v1:0',      # Most commonly used Claude 3
+    'anthropic.claude-3-5-sonnet-20241022-v2:0',    # Latest Claude 3.5
+    'anthropic.claude-3-haiku-20240307-v1:0',       # Cost-effective option
+    'anthropic.claude-sonnet-4-20250115-v1:0',      # Claude 4 Sonnet
+    'anthropic.claude-opus-4-20250115-v1:0',        # Claude 4 Opus
+    'anthropic.claude-opus-4-1-20250115-v1:0'       # Claude 4.1 Opus
+]
+
+# Lambda caps all environment variables at 4 KB combined; leave room for the others
+_BAKED_MODELS_MAX_BYTES = 3072
+
+# High-volume telemetry kept out of the audit log; everything else from bedrock-budgeteer is audited
+AUDIT_EXCLUDED_DETAIL_TYPES: List[str] = [
+    'Usage Cost Calculated'
+]
+
+
+@lru_cache(maxsize=4)
+def fetch_foundation_models(region: str = 'us-east-1') -> List[str]:
+    """List on-demand text foundation models at synth time, falling back to the essential list"""
+    try:
+        import boto3
+        from botocore.config import Config
+
+        client = boto3.client(
+            'bedrock',
+            region_name=region,
+            config=Config(connect_timeout=5, read_timeout=10, retries={'max_attempts': 1})
+        )
+        response = client.list_foundation_models(byInferenceType='ON_DEMAND', byOutputModality='TEXT')
+        models = sorted({
+            model['modelId'] for model in response.get('modelSummaries', []) if model.get('modelId')
+        })
+    except Exception:  # boto3 missing, no credentials or no network - synth must still succeed
+        return list(ESSENTIAL_FOUNDATION_MODELS)
+
+    if not models or len(json.dumps(models)) > _BAKED_MODELS_MAX_BYTES:
+        return list(ESSENTIAL_FOUNDATION_MODELS)
+    return models
 
 
 class CoreProcessingConstruct(Construct):
@@ -31,22 +86,30 @@ class CoreProcessingConstruct(Construct):
         scope: Construct,
         construct_id: str,
         environment_name: str,
-        dynamodb_tables: Dict[str, dynamodb.Table],
-        s3_bucket: s3.Bucket,
-        lambda_execution_role: iam.Role,
+        dynamodb_tables: Optional[Dict[str, dynamodb.Table]] = None,
+        s3_bucket: Optional[s3.Bucket] = None,
+        lambda_execution_role: Optional[iam.Role] = None,
         kms_key: Optional[kms.Key] = None,
+        shared: Optional[SharedResources] = None,
         **kwargs
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
         
+        # Explicit arguments win; anything omitted is taken from the shared bundle
+        self._shared = shared or SharedResources()
         self.environment_name = environment_name
-        self.dynamodb_tables = dynamodb_tables
-        self.s3_bucket = s3_bucket
-        self.lambda_execution_role = lambda_execution_role
-        self.kms_key = kms_key
+        self.dynamodb_tables = dynamodb_tables if dynamodb_tables is not None else self._shared.tables
+        self.s3_bucket = s3_bucket if s3_bucket is not None else self._shared.bucket
+        self.lambda_execution_role = lambda_execution_role or self._shared.roles.get("lambda_execution")
+        self.kms_key = kms_key if kms_key is not None else self._shared.kms_key
+        
+        # Fallback model list for pricing_manager when ListFoundationModels fails at runtime
+        self._baked_models = self._fetch_models_at_synth()
         
         # Storage for created Lambda functions
         self.lambda_functions: Dict[str, lambda_.Function] = {}
+        # "live" aliases with provisioned concurrency, for latency-sensitive functions
+        self.lambda_aliases: Dict[str, lambda_.Alias] = {}
         self.dlq_queues: Dict[str, sqs.Queue] = {}
         
         # Create shared resources
@@ -61,11 +124,43 @@ class CoreProcessingConstruct(Construct):
         # Create monitoring schedule
         self._create_monitoring_schedule()
     
+    def _fetch_models_at_synth(self) -> List[str]:
+        """Resolve the pricing manager's fallback model list; the synth-time lookup is opt-in by context"""
+        bake = self.node.try_get_context("bedrock-budgeteer:bake-foundation-models")
+        if bake is True or str(bake).lower() == "true":
+            return fetch_foundation_models()
+        return list(ESSENTIAL_FOUNDATION_MODELS)
+    
     def _create_shared_resources(self) -> None:
         """Create shared resources used by multiple Lambda functions"""
         
         # Create dead letter queues for error handling
         self._create_dead_letter_queues()
+        
+        # Shared utilities ship once as a layer instead of inside every function's code
+        self.shared_layer = lambda_.LayerVersion(
+            self,
+            "SharedUtilsLayer",
+            code=lambda_.Code.from_asset(build_shared_utilities_layer()),
+            compatible_runtimes=[lambda_.Runtime.PYTHON_3_11],
+            compatible_architectures=[lambda_.Architecture.X86_64, lambda_.Architecture.ARM_64],
+            description="Shared utilities for Bedrock Budgeteer Lambda functions"
+        )
+        
+        # Buffer audit events so audit_logger can write them in batches
+        self.audit_ingest_queue = sqs.Queue(
+            self,
+            "AuditIngestQueue",
+            queue_name=f"bedrock-budgeteer-audit-ingest-{self.environment_name}",
+            retention_period=Duration.days(4),
+            visibility_timeout=Duration.minutes(30),  # 6x the audit_logger timeout
+            encryption=sqs.QueueEncryption.SQS_MANAGED,  # EventBridge cannot use the aws/sqs KMS key
+            dead_letter_queue=sqs.DeadLetterQueue(
+                max_receive_count=3,
+                queue=self.dlq_queues["audit_logger"]
+            ),
+            removal_policy=RemovalPolicy.DESTROY
+        )
     
     def _create_dead_letter_queues(self) -> None:
         """Create dead letter queues for failed Lambda executions"""
@@ -74,9 +169,9 @@ class CoreProcessingConstruct(Construct):
             "user_setup",
             "usage_calculator", 
             "budget_monitor",
+            "budget_monitor_stream",
             "budget_refresh",
-            "audit_logger",
-            "state_reconciliation"
+            "audit_logger"
         ]
         
         for function_name in dlq_functions:
@@ -88,7 +183,8 @@ class CoreProcessingConstruct(Construct):
                 queue_name=dlq_name,
                 retention_period=Duration.days(14),
                 visibility_timeout=Duration.minutes(5),
-                encryption=sqs.QueueEncryption.KMS_MANAGED,
+                # SSE-SQS: DLQ payloads are error envelopes, no KMS data-key calls per failure
+                encryption=sqs.QueueEncryption.SQS_MANAGED,
                 removal_policy=RemovalPolicy.DESTROY
             )
     
@@ -101,6 +197,7 @@ class CoreProcessingConstruct(Construct):
             "timeout": Duration.minutes(5),
             "memory_size": 512,
             "role": self.lambda_execution_role,
+            "layers": [self.shared_layer],
             "environment": {
                 "ENVIRONMENT": self.environment_name,
                 "USER_BUDGETS_TABLE": self.dynamodb_tables["user_budgets"].table_name,
@@ -115,16 +212,42 @@ class CoreProcessingConstruct(Construct):
         self._create_user_setup_lambda(common_config)
         self._create_usage_calculator_lambda(common_config)
         self._create_budget_monitor_lambda(common_config)
+        self._create_budget_monitor_stream_lambda(common_config)
         self._create_budget_refresh_lambda(common_config)
         self._create_audit_logger_lambda(common_config)
-        self._create_state_reconciliation_lambda(common_config)
         self._create_pricing_manager_lambda(common_config)
     
+    def _get_provisioned_concurrency(self) -> int:
+        """Provisioned concurrency for this environment (context int or {env: int}, default 0)"""
+        setting = self.node.try_get_context("bedrock-budgeteer:provisioned-concurrency") or 0
+        if isinstance(setting, dict):
+            setting = setting.get(self.environment_name, 0)
+        return int(setting)
+    
+    def _create_live_alias(self, function_name: str, construct_prefix: str) -> None:
+        """Put a provisioned-concurrency "live" alias in front of a latency-sensitive function"""
+        provisioned = self._get_provisioned_concurrency()
+        if provisioned <= 0:
+            return
+        
+        function = self.lambda_functions[function_name]
+        self.lambda_aliases[function_name] = lambda_.Alias(
+            self,
+            f"{construct_prefix}Alias",
+            alias_name="live",
+            version=function.current_version,
+            provisioned_concurrent_executions=provisioned
+        )
+    
+    def _invoke_target(self, function_name: str) -> lambda_.IFunction:
+        """Function or alias that event sources should invoke, so warm capacity is used"""
+        return self.lambda_aliases.get(function_name) or self.lambda_functions[function_name]
+    
     def _create_user_setup_lambda(self, common_config: Dict[str, Any]) -> None:
         """Create Lambda function for user setup and budget initialization"""
         
         function_code = f"""
-{get_shared_lambda_utilities()}
+{get_shared_utilities_import()}
 
 {get_user_setup_function_code()}
 """
@@ -138,12 +261,14 @@ class CoreProcessingConstruct(Construct):
             dead_letter_queue=self.dlq_queues["user_setup"],
             **common_config
         )
+        
+        self._create_live_alias("user_setup", "UserSetup")
     
     def _create_usage_calculator_lambda(self, common_config: Dict[str, Any]) -> None:
         """Create Lambda function for usage cost calculation"""
         
         function_code = f"""
-{get_shared_lambda_utilities()}
+{get_shared_utilities_import()}
 
 {get_usage_calculator_function_code()}
 """
@@ -152,14 +277,17 @@ class CoreProcessingConstruct(Construct):
         usage_config = common_config.copy()
         usage_config.update({
             "memory_size": 1024,
-            "timeout": Duration.minutes(10)
+            "timeout": Duration.minutes(10),
+            # Pure-Python decode/JSON hot path on every Firehose batch; Graviton is cheaper per GB-second
+            "architecture": lambda_.Architecture.ARM_64
         })
         
         self.lambda_functions["usage_calculator"] = lambda_.Function(
             self,
             "UsageCalculatorFunction", 
             function_name=f"bedrock-budgeteer-usage-calculator-{self.environment_name}",
-            code=lambda_.Code.from_inline(function_code),
+            # Environment-agnostic source as a hashed asset: uploaded only when it changes
+            code=lambda_.Code.from_asset(build_function_asset("usage_calculator", function_code)),
             handler="index.lambda_handler",
             dead_letter_queue=self.dlq_queues["usage_calculator"],
             **usage_config
@@ -169,13 +297,20 @@ class CoreProcessingConstruct(Construct):
         """Create Lambda function for budget monitoring with pool and global cap enforcement"""
 
         function_code = f"""
-{get_shared_lambda_utilities()}
+{get_shared_utilities_import()}
+
+# Clients and tables are built once per container and reused by warm invocations
+USER_BUDGETS_TABLE = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+
 
 import time
 import json
+from boto3.dynamodb.conditions import Key
+
+{get_budget_enforcement_code()}
 
-ssm_client = boto3.client('ssm')
-sfn_client = boto3.client('stepfunctions')
+ssm_client = boto3.client('ssm', config=BOTO_CONFIG)
+sfn_client = boto3.client('stepfunctions', config=BOTO_CONFIG)
 
 
 def lambda_handler(event, context):
@@ -183,32 +318,41 @@ def lambda_handler(event, context):
     logger.info("Starting budget monitoring run")
 
     try:
-        user_budgets_table = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+        user_budgets_table = USER_BUDGETS_TABLE
 
-        items = _scan_all(user_budgets_table)
+        # Only keys that can still exceed their budget; suspended, restricted and
+        # deleted keys are never read
+        items = (
+            _query_status(user_budgets_table, 'active')
+            + _query_status(user_budgets_table, 'grace_period')
+        )
+        global_pool = user_budgets_table.get_item(
+            Key={{'principal_id': 'GLOBAL_API_KEY_POOL'}}
+        ).get('Item')
 
-        # Classify items
-        global_pool = None
+        # Classify items, converting spend and usage once per key for all three tiers
         budgeted_keys = []
         unbudgeted_keys = []
+        budgeted_usage = []  # (key_item, usage_percent) for keys with a positive budget
+        budgeted_spent = 0.0
+        computed_pool_spent = 0.0
 
         for item in items:
             principal_id = item['principal_id']
-            if principal_id == 'GLOBAL_API_KEY_POOL':
-                global_pool = item
-                continue
-            if item.get('status') in ('suspended', 'restricted', 'deleted'):
-                continue
             if not principal_id.startswith('BedrockAPIKey-'):
                 continue  # Skip non-API-key entries
+            spent = float(item.get('spent_usd', 0))
             if item.get('has_carveout'):
                 budgeted_keys.append(item)
+                budgeted_spent += spent
+                budget = float(item.get('budget_limit_usd', 0))
+                if budget > 0:
+                    budgeted_usage.append((item, (spent / budget) * 100))
             else:
                 unbudgeted_keys.append(item)
+                computed_pool_spent += spent
 
-        grace_period_seconds = int(ConfigurationManager.get_parameter(
-            '/bedrock-budgeteer/global/grace_period_seconds', 60
-        ))
+        grace_period_seconds = _get_grace_period_seconds()
         warning_threshold = float(ConfigurationManager.get_parameter(
             '/bedrock-budgeteer/global/thresholds_percent_warn', 70
         ))
@@ -219,13 +363,7 @@ def lambda_handler(event, context):
         suspensions_triggered = 0
 
         # === Tier 1: Per-key check (budgeted keys only) ===
-        for key_item in budgeted_keys:
-            budget = float(key_item.get('budget_limit_usd', 0))
-            spent = float(key_item.get('spent_usd', 0))
-            if budget <= 0:
-                continue
-            usage_percent = (spent / budget) * 100
-
+        for key_item, usage_percent in budgeted_usage:
             if usage_percent >= 100:
                 suspensions_triggered += _handle_budget_exceeded(
                     user_budgets_table, key_item, grace_period_seconds, 'per_key'
@@ -238,7 +376,6 @@ def lambda_handler(event, context):
                 _update_threshold_state(user_budgets_table, key_item, 'normal')
 
         # === Tier 2: Pool check (unbudgeted keys) ===
-        computed_pool_spent = sum(float(k.get('spent_usd', 0)) for k in unbudgeted_keys)
         pool_budget = 500.0  # default
         pool_usage_percent = 0.0
 
@@ -276,9 +413,7 @@ def lambda_handler(event, context):
         global_cap = float(ConfigurationManager.get_parameter(
             '/bedrock-budgeteer/global/api_key_global_cap_usd', 1000
         ))
-        total_all_keys_spent = sum(
-            float(k.get('spent_usd', 0)) for k in budgeted_keys + unbudgeted_keys
-        )
+        total_all_keys_spent = budgeted_spent + computed_pool_spent
 
         if global_cap > 0 and total_all_keys_spent >= global_cap:
             logger.error(
@@ -291,7 +426,11 @@ def lambda_handler(event, context):
                     )
 
         # Check for budget refreshes (suspended keys eligible for restoration)
-        restorations_triggered = _check_budget_refreshes(user_budgets_table, items)
+        suspended_items = _query_status(user_budgets_table, 'suspended')
+        restorations_triggered = _check_budget_refreshes(user_budgets_table, suspended_items)
+
+        # Reconciliation runs over the same reads instead of a separate full-table scan
+        reconciled_users = len(items) + len(suspended_items)
 
         # Publish metrics
         all_active_keys = budgeted_keys + unbudgeted_keys
@@ -319,6 +458,12 @@ def lambda_handler(event, context):
             'None',
             {{'Environment': os.environ['ENVIRONMENT']}}
         )
+        MetricsPublisher.publish_budget_metric(
+            'ReconciledUsers',
+            reconciled_users,
+            'Count',
+            {{'Environment': os.environ['ENVIRONMENT']}}
+        )
 
         logger.info(
             f"Budget monitoring completed: {{len(all_active_keys)}} keys, "
@@ -329,125 +474,16 @@ def lambda_handler(event, context):
             'monitored_keys': len(all_active_keys),
             'suspensions_triggered': suspensions_triggered,
             'restorations_triggered': restorations_triggered,
+            'reconciled_users': reconciled_users,
             'pool_usage_percent': pool_usage_percent
         }}
 
     except Exception as e:
         logger.error(f"Error in budget monitoring: {{e}}", exc_info=True)
         raise
-
-
-def _handle_budget_exceeded(table, key_item, grace_period_seconds, reason):
-    \"\"\"Handle a key that has exceeded its budget (per-key, pool, or global cap)\"\"\"
-    principal_id = key_item['principal_id']
-    current_status = key_item.get('status', 'active')
-
-    if current_status == 'suspended':
-        return 0
-
-    grace_deadline_epoch = key_item.get('grace_deadline_epoch')
-
-    if grace_deadline_epoch:
-        try:
-            epoch_ts = float(str(grace_deadline_epoch))
-        except (ValueError, TypeError):
-            logger.error(f"Invalid grace_deadline_epoch for {{principal_id}}: {{grace_deadline_epoch}}")
-            return 0
-
-        if time.time() >= epoch_ts:
-            _trigger_suspension_workflow(key_item, reason)
-            return 1
-        else:
-            logger.info(f"{{principal_id}} in grace period until {{grace_deadline_epoch}}")
-            return 0
-    else:
-        deadline = int(time.time()) + grace_period_seconds
-        table.update_item(
-            Key={{'principal_id': principal_id}},
-            UpdateExpression='SET #s = :status, grace_deadline_epoch = :deadline',
-            ExpressionAttributeNames={{'#s': 'status'}},
-            ExpressionAttributeValues={{
-                ':status': 'grace_period',
-                ':deadline': deadline
-            }}
-        )
-        # Update in-memory state so subsequent tier checks in the same run
-        # see the new status and don't double-grace this key
-        key_item['status'] = 'grace_period'
-        key_item['grace_deadline_epoch'] = deadline
-        logger.info(f"Started grace period for {{principal_id}}, deadline: {{deadline}}")
-
-        EventPublisher.publish_budget_event(
-            'Grace Period Started',
-            {{
-                'principal_id': principal_id,
-                'reason': reason,
-                'grace_period_seconds': grace_period_seconds,
-                'spent_usd': float(key_item.get('spent_usd', 0)),
-                'budget_limit_usd': float(key_item.get('budget_limit_usd', 0))
-            }}
-        )
-        return 0
-
-
-def _trigger_suspension_workflow(key_item, reason):
-    \"\"\"Trigger suspension workflow via EventBridge\"\"\"
-    principal_id = key_item['principal_id']
-    grace_period_seconds = int(ConfigurationManager.get_parameter(
-        '/bedrock-budgeteer/global/grace_period_seconds', 60
-    ))
-
-    EventPublisher.publish_budget_event(
-        'Suspension Workflow Required',
-        {{
-            'principal_id': principal_id,
-            'reason': reason,
-            'suspension_reason': reason,
-            'grace_period_seconds': grace_period_seconds,
-            'budget_data': {{
-                'account_type': key_item.get('account_type', 'bedrock_api_key'),
-                'budget_limit_usd': float(key_item.get('budget_limit_usd', 0)),
-                'spent_usd': float(key_item.get('spent_usd', 0)),
-                'has_carveout': key_item.get('has_carveout', False)
-            }},
-            'triggered_by': 'budget_monitor',
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }}
-    )
-
-    MetricsPublisher.publish_budget_metric(
-        'SuspensionWorkflowsTriggered',
-        1.0,
-        'Count',
-        {{'Environment': os.environ['ENVIRONMENT'], 'Reason': reason}}
-    )
-
-    logger.error(f"Suspension workflow triggered for {{principal_id}}: reason={{reason}}")
-
-
-def _update_threshold_state(table, item, new_state):
-    \"\"\"Update threshold state if changed\"\"\"
-    pk_field = 'principal_id'
-    pk_value = item.get('principal_id', item.get('runtime_id'))
-    current_state = item.get('threshold_state', 'normal')
-
-    if current_state != new_state:
-        table.update_item(
-            Key={{pk_field: pk_value}},
-            UpdateExpression='SET threshold_state = :state',
-            ExpressionAttributeValues={{':state': new_state}}
-        )
-        logger.info(f"Updated {{pk_value}} threshold: {{current_state}} -> {{new_state}}")
-
-        if new_state in ('warning', 'critical'):
-            EventPublisher.publish_budget_event(
-                f'Budget Threshold Changed',
-                {{
-                    'principal_id': pk_value,
-                    'threshold_state': new_state,
-                    'previous_state': current_state
-                }}
-            )
+    finally:
+        # Grace-period and suspension events are queued by the enforcement helpers
+        EventPublisher.flush()
 
 
 def _check_budget_refreshes(table, items):
@@ -482,13 +518,17 @@ def _check_budget_refreshes(table, items):
     return restorations
 
 
-def _scan_all(table):
-    \"\"\"Scan all items from DynamoDB table with pagination\"\"\"
+def _query_status(table, status):
+    \"\"\"Query all items with the given status from the sparse ActiveBudgetIndex\"\"\"
+    query_kwargs = {{
+        'IndexName': 'ActiveBudgetIndex',
+        'KeyConditionExpression': Key('status').eq(status) & Key('spent_usd').gte(0)
+    }}
     items = []
-    response = table.scan()
+    response = table.query(**query_kwargs)
     items.extend(response.get('Items', []))
     while 'LastEvaluatedKey' in response:
-        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+        response = table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query_kwargs)
         items.extend(response.get('Items', []))
     return items
 """
@@ -503,11 +543,60 @@ def _scan_all(table):
             **common_config
         )
     
+    def _create_budget_monitor_stream_lambda(self, common_config: Dict[str, Any]) -> None:
+        """Create Lambda function that checks per-key budgets from user-budgets stream records"""
+        
+        function_code = f"""
+{get_shared_utilities_import()}
+
+import time
+
+{get_budget_enforcement_code()}
+
+{get_budget_monitor_stream_function_code()}
+"""
+        
+        user_budgets_table = self.dynamodb_tables["user_budgets"]
+        
+        self.lambda_functions["budget_monitor_stream"] = lambda_.Function(
+            self,
+            "BudgetMonitorStreamFunction",
+            function_name=f"bedrock-budgeteer-budget-monitor-stream-{self.environment_name}",
+            code=lambda_.Code.from_inline(function_code),
+            handler="index.lambda_handler",
+            **common_config
+        )
+        
+        user_budgets_table.grant_stream_read(self.lambda_functions["budget_monitor_stream"])
+        
+        # Only items whose spend changed are evaluated, seconds after the write
+        lambda_.EventSourceMapping(
+            self,
+            "BudgetMonitorStreamMapping",
+            target=self.lambda_functions["budget_monitor_stream"],
+            event_source_arn=user_budgets_table.table_stream_arn,
+            starting_position=lambda_.StartingPosition.LATEST,
+            batch_size=100,
+            max_batching_window=Duration.seconds(5),
+            bisect_batch_on_error=True,
+            retry_attempts=3,
+            on_failure=lambda_event_sources.SqsDlq(self.dlq_queues["budget_monitor_stream"])
+        )
+    
     def _create_budget_refresh_lambda(self, common_config: Dict[str, Any]) -> None:
         """Create Lambda function for budget refresh operations and automatic restoration"""
         
         function_code = f"""
-{get_shared_lambda_utilities()}
+{get_shared_utilities_import()}
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+# Scan segments run in parallel threads; the low-level client is thread-safe
+MAX_SCAN_SEGMENTS = 8
+ITEMS_PER_SEGMENT = 1024
+MAX_REFRESH_WORKERS = 16
+
 
 def lambda_handler(event, context):
     \"\"\"Handle budget refresh operations and trigger automatic restoration for suspended users\"\"\"
@@ -515,73 +604,29 @@ def lambda_handler(event, context):
     
     try:
         current_time = datetime.now(timezone.utc)
-        user_budgets_table = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+        table_name = os.environ['USER_BUDGETS_TABLE']
         
-        refreshed_count = 0
-        restoration_count = 0
+        # Scan for users whose refresh period has been reached, one segment per thread
+        item_count = dynamodb_client.describe_table(TableName=table_name)['Table'].get('ItemCount', 0)
+        total_segments = min(MAX_SCAN_SEGMENTS, max(1, math.ceil(item_count / ITEMS_PER_SEGMENT)))
         
-        # Scan for users whose refresh period has been reached
-        paginator = dynamodb_client.get_paginator('scan')
-        page_iterator = paginator.paginate(TableName=os.environ['USER_BUDGETS_TABLE'])
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            futures = [
+                executor.submit(_refresh_segment, table_name, segment, total_segments, current_time)
+                for segment in range(total_segments)
+            ]
+            results = [future.result() for future in futures]
         
-        for page in page_iterator:
-            for item in page.get('Items', []):
-                principal_id = item.get('principal_id', {{}}).get('S', '')
-                status = item.get('status', {{}}).get('S', 'active')
-                refresh_date_str = item.get('budget_refresh_date', {{}}).get('S', '')
-                
-                if not principal_id or not refresh_date_str:
-                    continue
-                
-                # Parse refresh date
-                try:
-                    refresh_date = datetime.fromisoformat(refresh_date_str.replace('Z', '+00:00'))
-                except (ValueError, AttributeError):
-                    logger.warning(f"Invalid refresh date format for {{principal_id}}: {{refresh_date_str}}")
-                    continue
-                
-                # Check if refresh period has been reached
-                if current_time >= refresh_date:
-                    if status == 'suspended':
-                        # Trigger automatic restoration workflow
-                        try:
-                            EventPublisher.publish_budget_event(
-                                'Automatic User Restoration Required',
-                                {{
-                                    'principal_id': principal_id,
-                                    'restoration_reason': 'budget_refresh_period_reached',
-                                    'refresh_date': refresh_date.isoformat(),
-                                    'current_time': current_time.isoformat()
-                                }}
-                            )
-                            restoration_count += 1
-                            logger.info(f"Triggered automatic restoration for suspended user: {{principal_id}}")
-                        except Exception as e:
-                            logger.error(f"Error triggering restoration for {{principal_id}}: {{e}}")
-                    
-                    elif status == 'active':
-                        # Reset budget for active users (refresh their budget)
-                        try:
-                            refresh_period_days = int(item.get('refresh_period_days', {{}}).get('N', '30'))
-                            next_refresh_date = current_time + timedelta(days=refresh_period_days)
-                            
-                            user_budgets_table.update_item(
-                                Key={{'principal_id': principal_id}},
-                                UpdateExpression='SET spent_usd = :zero, budget_period_start = :period_start, budget_refresh_date = :next_refresh, refresh_count = refresh_count + :one, grace_deadline_epoch = :null_val, #s = :active',
-                                ExpressionAttributeNames={{'#s': 'status'}},
-                                ExpressionAttributeValues={{
-                                    ':zero': 0,
-                                    ':period_start': current_time.isoformat(),
-                                    ':next_refresh': next_refresh_date.isoformat(),
-                                    ':one': 1,
-                                    ':null_val': None,
-                                    ':active': 'active'
-                                }}
-                            )
-                            refreshed_count += 1
-                            logger.info(f"Refreshed budget for active user: {{principal_id}}")
-                        except Exception as e:
-                            logger.error(f"Error refreshing budget for {{principal_id}}: {{e}}")
+        to_refresh = [entry for refresh_entries, _ in results for entry in refresh_entries]
+        restoration_count = sum(restored for _, restored in results)
+        
+        # Reset due budgets with overlapping update_item calls
+        refreshed_count = 0
+        if to_refresh:
+            with ThreadPoolExecutor(max_workers=min(MAX_REFRESH_WORKERS, len(to_refresh))) as executor:
+                refreshed_count = sum(executor.map(
+                    lambda entry: _refresh_one(table_name, entry, current_time), to_refresh
+                ))
         
         # Publish metrics
         MetricsPublisher.publish_budget_metric(
@@ -609,6 +654,89 @@ def lambda_handler(event, context):
     except Exception as e:
         logger.error(f"Error in budget refresh: {{e}}", exc_info=True)
         raise
+
+
+def _refresh_segment(table_name, segment, total_segments, current_time):
+    \"\"\"Scan one table segment, restore its due suspended users and collect due active users
+
+    Returns ([(principal_id, refresh_period_days), ...], restored)
+    \"\"\"
+    to_refresh = []
+    restoration_count = 0
+    
+    paginator = dynamodb_client.get_paginator('scan')
+    page_iterator = paginator.paginate(
+        TableName=table_name, Segment=segment, TotalSegments=total_segments
+    )
+    
+    for page in page_iterator:
+        for item in page.get('Items', []):
+            principal_id = item.get('principal_id', {{}}).get('S', '')
+            status = item.get('status', {{}}).get('S', 'active')
+            refresh_date_str = item.get('budget_refresh_date', {{}}).get('S', '')
+            
+            if not principal_id or not refresh_date_str:
+                continue
+            
+            # Parse refresh date
+            try:
+                refresh_date = datetime.fromisoformat(refresh_date_str.replace('Z', '+00:00'))
+            except (ValueError, AttributeError):
+                logger.warning(f"Invalid refresh date format for {{principal_id}}: {{refresh_date_str}}")
+                continue
+            
+            # Check if refresh period has been reached
+            if current_time >= refresh_date:
+                if status == 'suspended':
+                    # Trigger automatic restoration workflow
+                    try:
+                        EventPublisher.publish_budget_event(
+                            'Automatic User Restoration Required',
+                            {{
+                                'principal_id': principal_id,
+                                'restoration_reason': 'budget_refresh_period_reached',
+                                'refresh_date': refresh_date.isoformat(),
+                                'current_time': current_time.isoformat()
+                            }}
+                        )
+                        restoration_count += 1
+                        logger.info(f"Triggered automatic restoration for suspended user: {{principal_id}}")
+                    except Exception as e:
+                        logger.error(f"Error triggering restoration for {{principal_id}}: {{e}}")
+                
+                elif status == 'active':
+                    # Reset budget for active users once all segments are scanned
+                    refresh_period_days = int(item.get('refresh_period_days', {{}}).get('N', '30'))
+                    to_refresh.append((principal_id, refresh_period_days))
+    
+    return to_refresh, restoration_count
+
+
+def _refresh_one(table_name, entry, current_time):
+    \"\"\"Reset one active user's budget for the next period; returns 1 if refreshed\"\"\"
+    principal_id, refresh_period_days = entry
+    try:
+        next_refresh_date = current_time + timedelta(days=refresh_period_days)
+        
+        dynamodb_client.update_item(
+            TableName=table_name,
+            Key={{'principal_id': {{'S': principal_id}}}},
+            UpdateExpression='SET spent_usd = :zero, budget_period_start = :period_start, budget_refresh_date = :next_refresh, refresh_count = refresh_count + :one, grace_deadline_epoch = :null_val, #s = :active',
+            ExpressionAttributeNames={{'#s': 'status'}},
+            ExpressionAttributeValues={{
+                ':zero': {{'N': '0'}},
+                ':period_start': {{'S': current_time.isoformat()}},
+                ':next_refresh': {{'S': next_refresh_date.isoformat()}},
+                ':one': {{'N': '1'}},
+                ':null_val': {{'NULL': True}},
+                ':active': {{'S': 'active'}}
+            }}
+        )
+        logger.info(f"Refreshed budget for active user: {{principal_id}}")
+        return 1
+    except Exception as e:
+        logger.error(f"Error refreshing budget for {{principal_id}}: {{e}}")
+        return 0
 """
         
         self.lambda_functions["budget_refresh"] = lambda_.Function(
@@ -619,55 +747,17 @@ def lambda_handler(event, context):
             handler="index.lambda_handler",
             dead_letter_queue=self.dlq_queues["budget_refresh"],
             timeout=Duration.minutes(10),
-            **{k: v for k, v in common_config.items() if k != 'timeout'}
+            memory_size=1769,  # One full vCPU for the parallel scan threads
+            **{k: v for k, v in common_config.items() if k not in ('timeout', 'memory_size')}
         )
     
     def _create_audit_logger_lambda(self, common_config: Dict[str, Any]) -> None:
         """Create Lambda function for audit logging"""
         
         function_code = f"""
-{get_shared_lambda_utilities()}
+{get_shared_utilities_import()}
 
-def lambda_handler(event, context):
-    \"\"\"Process audit events and store them in the audit logs table\"\"\"
-    logger.info("Processing audit event")
-    
-    try:
-        if 'detail' not in event:
-            logger.error("Invalid event format - missing detail")
-            return {{'statusCode': 400, 'body': 'Invalid event format'}}
-        
-        detail = event['detail']
-        event_source = event.get('source', 'unknown')
-        detail_type = event.get('detail-type', 'Unknown Event')
-        
-        # Create audit log entry
-        audit_entry = {{
-            'event_id': str(uuid.uuid4()),
-            'event_time': datetime.now(timezone.utc).isoformat(),
-            'event_source': event_source,
-            'event_type': detail_type,
-            'principal_id': detail.get('principal_id', 'system'),
-            'details': json.dumps(detail, default=str),
-            'timestamp_epoch': int(datetime.now(timezone.utc).timestamp())
-        }}
-        
-        # Store in DynamoDB
-        audit_logs_table = dynamodb.Table(os.environ['AUDIT_LOGS_TABLE'])
-        audit_logs_table.put_item(Item=DynamoDBHelper.float_to_decimal(audit_entry))
-        
-        MetricsPublisher.publish_budget_metric(
-            'AuditEventsProcessed',
-            1.0,
-            'Count',
-            {{'EventSource': event_source, 'Environment': os.environ['ENVIRONMENT']}}
-        )
-        
-        return {{'statusCode': 200, 'body': 'Audit event processed successfully'}}
-        
-    except Exception as e:
-        logger.error(f"Error processing audit event: {{e}}", exc_info=True)
-        raise
+{get_audit_logger_function_code()}
 """
         
         self.lambda_functions["audit_logger"] = lambda_.Function(
@@ -679,77 +769,116 @@ def lambda_handler(event, context):
             dead_letter_queue=self.dlq_queues["audit_logger"],
             **common_config
         )
-    
-    def _create_state_reconciliation_lambda(self, common_config: Dict[str, Any]) -> None:
-        """Create Lambda function for state reconciliation"""
-        
-        function_code = f"""
-{get_shared_lambda_utilities()}
-
-def lambda_handler(event, context):
-    \"\"\"Reconcile state between IAM policies and DynamoDB budget status\"\"\"
-    logger.info("Starting state reconciliation process")
-    
-    try:
-        user_budgets_table = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
-        
-        scan_kwargs = {{}}
-        reconciled_users = 0
-        
-        while True:
-            response = user_budgets_table.scan(**scan_kwargs)
-            
-            for item in response['Items']:
-                reconciled_users += 1
-                # Basic reconciliation logic would go here
-            
-            if 'LastEvaluatedKey' in response:
-                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            else:
-                break
-        
-        MetricsPublisher.publish_budget_metric(
-            'ReconciledUsers',
-            reconciled_users,
-            'Count',
-            {{'Environment': os.environ['ENVIRONMENT']}}
-        )
         
-        return {{'statusCode': 200, 'reconciled_users': reconciled_users}}
+        self._create_live_alias("audit_logger", "AuditLogger")
         
-    except Exception as e:
-        logger.error(f"Error in state reconciliation: {{e}}", exc_info=True)
-        raise
-"""
-        
-        reconciliation_config = common_config.copy()
-        reconciliation_config.update({
-            "timeout": Duration.minutes(15),
-            "memory_size": 256
-        })
-        
-        self.lambda_functions["state_reconciliation"] = lambda_.Function(
-            self,
-            "StateReconciliationFunction",
-            function_name=f"bedrock-budgeteer-state-reconciliation-{self.environment_name}",
-            code=lambda_.Code.from_inline(function_code),
-            handler="index.lambda_handler", 
-            dead_letter_queue=self.dlq_queues["state_reconciliation"],
-            **reconciliation_config
+        # Audit events arrive through the ingest queue so one invocation stores many
+        self._invoke_target("audit_logger").add_event_source(
+            lambda_event_sources.SqsEventSource(
+                self.audit_ingest_queue,
+                batch_size=100,
+                max_batching_window=Duration.seconds(10),
+                report_batch_item_failures=True
+            )
         )
     
     def _create_pricing_manager_lambda(self, common_config: Dict[str, Any]) -> None:
         """Create Lambda function for managing Bedrock pricing data"""
         
         function_code = f"""
-{get_shared_lambda_utilities()}
+{get_shared_utilities_import()}
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Clients and tables are built once per container and reused by warm invocations
+PRICING_TABLE = dynamodb.Table(os.environ['PRICING_TABLE'])
+BEDROCK_CLIENT = boto3.client('bedrock', region_name='us-east-1', config=BOTO_CONFIG)
+
+# Bounded so concurrent lookups stay under the Pricing API rate limit
+PRICING_FETCH_WORKERS = 16
+
+# Rows written more recently than this are not refetched by a non-forced refresh
+PRICING_REFRESH_THRESHOLD_HOURS = 20
+
+
+# Per-token rates repeat across models; convert each distinct float to Decimal once
+_decimal_rates = {{}}
+
+
+def _rate_decimal(rate):
+    \"\"\"Decimal for a float rate, via its shortest repr to avoid binary-float digits\"\"\"
+    value = _decimal_rates.get(rate)
+    if value is None:
+        value = _decimal_rates[rate] = Decimal(repr(rate))
+    return value
 
-def _get_all_foundation_models():
-    \"\"\"Get all available Bedrock foundation models\"\"\"
+
+def _fetch_model_pricing(model_id):
+    \"\"\"Fetch pricing for one model from the AWS Pricing API, falling back to static pricing\"\"\"
+    # Try to fetch real pricing from AWS Pricing API first
+    pricing_data = BedrockPricingCalculator.fetch_pricing_from_api(model_id, 'us-east-1')
+    if pricing_data:
+        return pricing_data, 'aws_pricing_api'
+    
+    # Fall back to static pricing if API fails (summarized once per run by the handler)
+    return BedrockPricingCalculator._get_fallback_pricing(model_id), 'fallback'
+
+
+# Last ListFoundationModels result, reused by warm invocations for 24 hours
+_MODEL_CACHE_TTL_SECONDS = 86400
+_model_cache = {{'ts': 0, 'models': None}}
+
+
+def _get_fresh_models(model_ids, region='us-east-1'):
+    \"\"\"Return the model IDs whose pricing row was updated within the refresh threshold\"\"\"
+    table_name = os.environ['PRICING_TABLE']
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=PRICING_REFRESH_THRESHOLD_HOURS)
+    fresh = set()
+    
+    for i in range(0, len(model_ids), 100):  # BatchGetItem takes at most 100 keys
+        request_items = {{table_name: {{
+            'Keys': [{{'model_id': {{'S': m}}, 'region': {{'S': region}}}} for m in model_ids[i:i + 100]],
+            'ProjectionExpression': 'model_id, last_updated'
+        }}}}
+        while request_items:
+            response = dynamodb_client.batch_get_item(RequestItems=request_items)
+            for item in response.get('Responses', {{}}).get(table_name, []):
+                try:
+                    last_updated = datetime.fromisoformat(item['last_updated']['S'])
+                except (KeyError, ValueError):
+                    continue
+                if last_updated >= cutoff:
+                    fresh.add(item['model_id']['S'])
+            request_items = response.get('UnprocessedKeys') or None
+    
+    return fresh
+
+
+def _get_priced_models(region='us-east-1'):
+    \"\"\"Return the model IDs that already have a pricing row, so they are refreshed before their ttl\"\"\"
+    model_ids = set()
+    scan_kwargs = {{
+        'ProjectionExpression': 'model_id, #r',
+        'ExpressionAttributeNames': {{'#r': 'region'}}
+    }}
+    while True:
+        response = PRICING_TABLE.scan(**scan_kwargs)
+        model_ids.update(item['model_id'] for item in response.get('Items', []) if item.get('region') == region)
+        if 'LastEvaluatedKey' not in response:
+            return model_ids
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def _get_all_foundation_models(force_refresh=False):
+    \"\"\"Get Bedrock foundation models from the API, reusing a warm result unless a refresh is forced\"\"\"
+    if not force_refresh and _model_cache['models'] and time.time() - _model_cache['ts'] < _MODEL_CACHE_TTL_SECONDS:
+        logger.info(f"Using {{len(_model_cache['models'])}} cached foundation models")
+        return _model_cache['models']
+    
     try:
         # Try to get models from Bedrock API
-        bedrock = boto3.client('bedrock', region_name='us-east-1')
-        response = bedrock.list_foundation_models()
+        response = BEDROCK_CLIENT.list_foundation_models()
         
         models = []
         for model in response.get('modelSummaries', []):
@@ -759,19 +888,18 @@ def _get_all_foundation_models():
         
         if models:
             logger.info(f"Retrieved {{len(models)}} foundation models from Bedrock API")
+            _model_cache.update(ts=time.time(), models=models)
             return models
     except Exception as e:
         logger.warning(f"Failed to fetch models from Bedrock API: {{e}}")
     
+    baked_models = json.loads(os.environ.get('BAKED_FOUNDATION_MODELS', '[]'))
+    if baked_models:
+        logger.warning(f"Bedrock API unavailable - using {{len(baked_models)}} foundation models baked in at deploy time")
+        return baked_models
+    
     # Minimal fallback - only essential Claude models if Bedrock API fails
-    essential_models = [
-        'anthropic.claude-3-sonnet-20240229-v1:0',      # Most commonly used Claude 3
-        'anthropic.claude-3-5-sonnet-20241022-v2:0',    # Latest Claude 3.5
-        'anthropic.claude-3-haiku-20240307-v1:0',       # Cost-effective option
-        'anthropic.claude-sonnet-4-20250115-v1:0',      # Claude 4 Sonnet
-        'anthropic.claude-opus-4-20250115-v1:0',        # Claude 4 Opus
-        'anthropic.claude-opus-4-1-20250115-v1:0'       # Claude 4.1 Opus
-    ]
+    essential_models = {ESSENTIAL_FOUNDATION_MODELS!r}
     
     logger.warning(f"Bedrock API unavailable - using minimal fallback with {{len(essential_models)}} essential models")
     return essential_models
@@ -802,15 +930,17 @@ def lambda_handler(event, context):
                 
                 # Check if pricing table is already populated
                 # Only populate on FIRST Bedrock API key creation
-                pricing_table = dynamodb.Table(os.environ['PRICING_TABLE'])
-                
                 try:
-                    # Check if any pricing data exists
-                    scan_response = pricing_table.scan(Limit=1)
-                    existing_items = scan_response.get('Items', [])
+                    # ItemCount is free (no RCU) but refreshed only every ~6 hours, so an
+                    # empty count is confirmed with a one-item scan before populating
+                    item_count = dynamodb_client.describe_table(
+                        TableName=os.environ['PRICING_TABLE']
+                    )['Table'].get('ItemCount', 0)
+                    if not item_count:
+                        item_count = len(PRICING_TABLE.scan(Limit=1).get('Items', []))
                     
-                    if existing_items:
-                        logger.info(f"Pricing table already populated ({{len(existing_items)}} items exist). Skipping population for user: {{created_user_name}}")
+                    if item_count:
+                        logger.info(f"Pricing table already populated ({{item_count}} items exist). Skipping population for user: {{created_user_name}}")
                         return {{'statusCode': 200, 'body': 'Pricing table already populated - skipping'}}
                     
                     logger.info(f"Pricing table is empty. Populating pricing data for first Bedrock API key: {{created_user_name}}")
@@ -831,53 +961,83 @@ def lambda_handler(event, context):
             logger.warning(f"Unknown action: {{action}}")
             return {{'statusCode': 400, 'body': 'Unknown action'}}
         
-        # Fetch ALL foundation models from AWS Pricing API
-        # For daily_refresh/refresh_all, we need to get the pricing table reference
-        if action in ['daily_refresh', 'refresh_all']:
-            pricing_table = dynamodb.Table(os.environ['PRICING_TABLE'])
+        # Get all available Bedrock foundation models; a forced refresh_all bypasses the warm cache
+        force_refresh = action == 'refresh_all' and event.get('force_refresh') is True
+        all_models = _get_all_foundation_models(force_refresh=force_refresh)
         
-        # Get all available Bedrock foundation models
-        all_models = _get_all_foundation_models()
+        # Rows expire after a day, so every model already priced is refreshed as well,
+        # including models missing from the API or fallback list
+        if action in ['daily_refresh', 'refresh_all']:
+            try:
+                known_models = set(all_models)
+                all_models = list(all_models) + sorted(_get_priced_models() - known_models)
+            except Exception as e:
+                logger.warning(f"Could not list priced models, refreshing the model list only: {{e}}")
         logger.info(f"Found {{len(all_models)}} foundation models to process")
         
-        updated_count = 0
         failed_count = 0
+        skipped_count = 0
+        by_source = {{'aws_pricing_api': 0, 'fallback': 0}}
+        fallback_ids = []
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        ttl = int((now + timedelta(days=1)).timestamp())
         
-        for model_id in all_models:
+        # Skip models refreshed recently; a forced refresh rewrites every row
+        if action in ['daily_refresh', 'refresh_all'] and not force_refresh:
             try:
-                # Try to fetch real pricing from AWS Pricing API first
-                pricing_data = BedrockPricingCalculator.fetch_pricing_from_api(model_id, 'us-east-1')
-                data_source = 'aws_pricing_api'
-                
-                # Fall back to static pricing if API fails
-                if not pricing_data:
-                    logger.warning(f"AWS Pricing API failed for {{model_id}}, using fallback pricing")
-                    pricing_data = BedrockPricingCalculator._get_fallback_pricing(model_id)
-                    data_source = 'fallback'
-                
-                ttl = int((datetime.now(timezone.utc) + timedelta(days=1)).timestamp())
-                
-                pricing_table.put_item(
-                    Item={{
-                        'model_id': model_id,
-                        'region': 'us-east-1',
-                        'input_tokens_per_1000': Decimal(str(pricing_data['input_tokens_per_1000'])),
-                        'output_tokens_per_1000': Decimal(str(pricing_data['output_tokens_per_1000'])),
-                        'last_updated': datetime.now(timezone.utc).isoformat(),
-                        'data_source': data_source,
-                        'populated_by': populated_by,
-                        'ttl': ttl
-                    }}
-                )
-                updated_count += 1
-                logger.info(f"Updated pricing for {{model_id}} (source: {{data_source}}, trigger: {{populated_by}}): input=${{pricing_data['input_tokens_per_1000']:.6f}}, output=${{pricing_data['output_tokens_per_1000']:.6f}}")
-                
+                fresh_models = _get_fresh_models(all_models)
             except Exception as e:
-                logger.error(f"Failed to update pricing for {{model_id}}: {{e}}")
-                failed_count += 1
+                logger.warning(f"Could not check pricing freshness, refreshing all models: {{e}}")
+                fresh_models = set()
+            skipped_count = len(fresh_models)
+            all_models = [m for m in all_models if m not in fresh_models]
+            logger.info(f"Skipping {{skipped_count}} models with pricing newer than {{PRICING_REFRESH_THRESHOLD_HOURS}}h")
         
-        logger.info(f"Pricing population completed: {{updated_count}}/{{len(all_models)}} models updated, {{failed_count}} failed")
-        return {{'statusCode': 200, 'body': {{'refreshed': updated_count, 'total': len(all_models), 'failed': failed_count, 'populated_by': populated_by}}}}
+        # Pricing API lookups are independent, so they run concurrently; writes are batched
+        pricing_items = {{}}  # keyed by model_id so a repeated model is written once
+        with ThreadPoolExecutor(max_workers=PRICING_FETCH_WORKERS) as executor:
+            futures = {{
+                executor.submit(_fetch_model_pricing, model_id): model_id for model_id in all_models
+            }}
+            for future in as_completed(futures):
+                model_id = futures[future]
+                try:
+                    pricing_data, data_source = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch pricing for {{model_id}}: {{e}}")
+                    failed_count += 1
+                    continue
+                
+                pricing_items[model_id] = {{
+                    'model_id': model_id,
+                    'region': 'us-east-1',
+                    'input_tokens_per_1000': _rate_decimal(pricing_data['input_tokens_per_1000']),
+                    'output_tokens_per_1000': _rate_decimal(pricing_data['output_tokens_per_1000']),
+                    'last_updated': now_iso,
+                    'data_source': data_source,
+                    'populated_by': populated_by,
+                    'ttl': ttl
+                }}
+                by_source[data_source] += 1
+                if data_source == 'fallback':
+                    fallback_ids.append(model_id)
+        
+        unprocessed = DynamoDBHelper.batch_put_items(PRICING_TABLE, list(pricing_items.values()))
+        updated_count = len(pricing_items) - len(unprocessed)
+        failed_count += len(unprocessed)
+        
+        logger.info(json.dumps({{
+            'message': 'Pricing population completed',
+            'updated': updated_count,
+            'total': len(all_models),
+            'failed': failed_count,
+            'skipped': skipped_count,
+            'by_source': by_source,
+            'fallbacks': fallback_ids,
+            'populated_by': populated_by
+        }}))
+        return {{'statusCode': 200, 'body': {{'refreshed': updated_count, 'total': len(all_models), 'failed': failed_count, 'skipped': skipped_count, 'populated_by': populated_by}}}}
         
     except Exception as e:
         logger.error(f"Error in pricing manager: {{e}}", exc_info=True)
@@ -887,14 +1047,19 @@ def lambda_handler(event, context):
         pricing_config = common_config.copy()
         pricing_config.update({
             "timeout": Duration.minutes(10),
-            "memory_size": 256
+            "memory_size": 1024,  # CPU and network scale with memory; the refresh is I/O-bound
+            "environment": {
+                **common_config["environment"],
+                "BAKED_FOUNDATION_MODELS": json.dumps(self._baked_models)
+            }
         })
         
         self.lambda_functions["pricing_manager"] = lambda_.Function(
             self,
             "PricingManagerFunction",
             function_name=f"bedrock-budgeteer-pricing-manager-{self.environment_name}",
-            code=lambda_.Code.from_inline(function_code),
+            # Packaged as an asset so the handler source stays out of the template
+            code=lambda_.Code.from_asset(build_function_asset("pricing_manager", function_code)),
             handler="index.lambda_handler",
             **pricing_config
         )
@@ -909,7 +1074,7 @@ def lambda_handler(event, context):
             self,
             "UserSetupEventRule",
             rule_name=f"bedrock-budgeteer-user-setup-{self.environment_name}",
-            description="Route IAM and Bedrock API key creation events to user setup and pricing Lambda",
+            description="Route IAM and Bedrock API key creation events to user setup Lambda",
             event_pattern=events.EventPattern(
                 source=["aws.iam"],
                 detail_type=["AWS API Call via CloudTrail"],
@@ -927,8 +1092,26 @@ def lambda_handler(event, context):
                     ]
                 }
             ),
+            targets=[targets.LambdaFunction(self._invoke_target("user_setup"))]
+        )
+        
+        # Pricing only needs a refresh when a new Bedrock API key user is created
+        events.Rule(
+            self,
+            "BedrockApiKeyPricingRule",
+            rule_name=f"bedrock-budgeteer-api-key-pricing-{self.environment_name}",
+            description="Route Bedrock API key user creation events to pricing Lambda",
+            event_pattern=events.EventPattern(
+                source=["aws.iam"],
+                detail_type=["AWS API Call via CloudTrail"],
+                detail={
+                    "eventName": ["CreateUser"],
+                    "requestParameters": {
+                        "userName": [{"prefix": "BedrockAPIKey-"}]
+                    }
+                }
+            ),
             targets=[
-                targets.LambdaFunction(self.lambda_functions["user_setup"]),
                 targets.LambdaFunction(
                     self.lambda_functions["pricing_manager"],
                     event=events.RuleTargetInput.from_object({
@@ -948,17 +1131,20 @@ def lambda_handler(event, context):
             self,
             "AuditEventRule", 
             rule_name=f"bedrock-budgeteer-audit-{self.environment_name}",
-            description="Route all system events to audit logger",
+            description="Route material system events to the audit ingest queue",
             event_pattern=events.EventPattern(
-                source=["bedrock-budgeteer"]
+                source=["bedrock-budgeteer"],
+                # Per-invocation cost events are already recorded in usage_tracking
+                detail_type=events.Match.anything_but(*AUDIT_EXCLUDED_DETAIL_TYPES)
             ),
-            targets=[targets.LambdaFunction(self.lambda_functions["audit_logger"])]
+            targets=[targets.SqsQueue(self.audit_ingest_queue)]
         )
     
     def _create_monitoring_schedule(self) -> None:
         """Create CloudWatch Events schedule for monitoring functions"""
         
-        # Budget monitoring schedule (every 5 minutes)
+        # Budget monitoring schedule (every 5 minutes). Per-key checks also run from the
+        # user-budgets stream; this run covers pool and global cap totals and refreshes.
         events.Rule(
             self,
             "BudgetMonitoringSchedule",
@@ -968,37 +1154,21 @@ def lambda_handler(event, context):
             targets=[targets.LambdaFunction(self.lambda_functions["budget_monitor"])]
         )
         
-        # State reconciliation schedule (every 4 hours)
-        events.Rule(
-            self,
-            "StateReconciliationSchedule",
-            rule_name=f"bedrock-budgeteer-reconciliation-schedule-{self.environment_name}",
-            description="Schedule for state reconciliation Lambda",
-            schedule=events.Schedule.rate(Duration.hours(4)),
-            targets=[targets.LambdaFunction(self.lambda_functions["state_reconciliation"])]
-        )
-        
-        # Budget refresh schedule (daily at 2 AM UTC)
+        # Daily refresh schedule (2 AM UTC): one rule drives both daily batch jobs,
+        # budget refresh and pricing refresh
         events.Rule(
             self,
             "BudgetRefreshSchedule",
             rule_name=f"bedrock-budgeteer-refresh-schedule-{self.environment_name}",
             description="Schedule for budget refresh Lambda",
             schedule=events.Schedule.cron(minute="0", hour="2"),
-            targets=[targets.LambdaFunction(self.lambda_functions["budget_refresh"])]
-        )
-        
-        # Pricing refresh schedule (daily at 1 AM UTC)
-        events.Rule(
-            self,
-            "PricingRefreshSchedule",
-            rule_name=f"bedrock-budgeteer-pricing-refresh-{self.environment_name}",
-            description="Schedule for pricing refresh Lambda",
-            schedule=events.Schedule.cron(minute="0", hour="1"),
-            targets=[targets.LambdaFunction(
-                self.lambda_functions["pricing_manager"],
-                event=events.RuleTargetInput.from_object({"action": "refresh_all"})
-            )]
+            targets=[
+                targets.LambdaFunction(self.lambda_functions["budget_refresh"]),
+                targets.LambdaFunction(
+                    self.lambda_functions["pricing_manager"],
+                    event=events.RuleTargetInput.from_object({"action": "refresh_all"})
+                )
+            ]
         )
     
     # Public properties to expose resources (maintain API compatibility)
@@ -2,7 +2,7 @@
 Data Storage Construct for Bedrock Budgeteer
 Manages DynamoDB tables and related storage resources
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from aws_cdk import (
     aws_dynamodb as dynamodb,
     aws_kms as kms,
@@ -35,7 +35,7 @@ class DataStorageConstruct(Construct):
         self._create_audit_logs_table()
         self._create_pricing_table()
         
-        # Tags are applied by TaggingFramework aspects
+        # Tags are applied by the stack via apply_tags
     
     def _get_removal_policy(self) -> RemovalPolicy:
         """Get removal policy for production environment"""
@@ -75,128 +75,133 @@ class DataStorageConstruct(Construct):
                 "encryption": dynamodb.TableEncryption.AWS_MANAGED
             }
     
-    def _create_user_budget_table(self) -> None:
-        """Create the user budget tracking table"""
-        # Get encryption configuration
-        encryption_props = self._get_encryption_config()
-        
-        capacity_config = self._get_table_capacity_config()
+    def _make_table(self, logical_id: str, table_key: str, name_suffix: str,
+                    partition_key: dynamodb.Attribute,
+                    sort_key: Optional[dynamodb.Attribute] = None,
+                    gsis: Tuple[Dict[str, Any], ...] = (),
+                    billing_mode: Optional[dynamodb.BillingMode] = None,
+                    capacity: Optional[Dict[str, int]] = None,
+                    **extra_props: Any) -> dynamodb.Table:
+        """Create a table with the shared encryption, PITR and capacity settings"""
+        billing_mode = billing_mode or self.billing_mode
+        provisioned = billing_mode == dynamodb.BillingMode.PROVISIONED
+        capacity = capacity or self._get_table_capacity_config()
         
         table_props = {
-            "table_name": f"bedrock-budgeteer-{self.environment_name}-user-budgets",
-            "partition_key": dynamodb.Attribute(
-                name="principal_id",
-                type=dynamodb.AttributeType.STRING
-            ),
-            "billing_mode": self.billing_mode,
+            "table_name": f"bedrock-budgeteer-{self.environment_name}-{name_suffix}",
+            "partition_key": partition_key,
+            "billing_mode": billing_mode,
             "removal_policy": self.removal_policy,
             "point_in_time_recovery_specification": dynamodb.PointInTimeRecoverySpecification(
                 point_in_time_recovery_enabled=self._get_point_in_time_recovery()
             ),
-            **encryption_props
+            **self._get_encryption_config(),
+            **extra_props
         }
+        if sort_key:
+            table_props["sort_key"] = sort_key
         
         # Add provisioned throughput for production environment
-        if self.billing_mode == dynamodb.BillingMode.PROVISIONED:
-            table_props.update({
-                "read_capacity": capacity_config["read_capacity"],
-                "write_capacity": capacity_config["write_capacity"]
-            })
+        if provisioned:
+            table_props.update(capacity)
         
-        self.tables["user_budgets"] = dynamodb.Table(
-            self, "UserBudgetTable",
-            **table_props
-        )
+        table = dynamodb.Table(self, logical_id, **table_props)
+        self.tables[table_key] = table
+        
+        if provisioned:
+            self._add_auto_scaling(table, table_key)
         
-        # Add auto-scaling
-        self._add_auto_scaling(self.tables["user_budgets"], "user_budgets")
+        # GSIs share the table's provisioned capacity
+        for gsi_props in gsis:
+            if provisioned:
+                gsi_props = {**gsi_props, **capacity}
+            table.add_global_secondary_index(**gsi_props)
         
-        # Add Global Secondary Index for budget status queries
-        gsi_props = {
-            "index_name": "BudgetStatusIndex",
-            "partition_key": dynamodb.Attribute(
-                name="budget_status",
+        return table
+    
+    def _create_user_budget_table(self) -> None:
+        """Create the user budget tracking table"""
+        self._make_table(
+            "UserBudgetTable", "user_budgets", "user-budgets",
+            partition_key=dynamodb.Attribute(
+                name="principal_id",
                 type=dynamodb.AttributeType.STRING
             ),
-            "sort_key": dynamodb.Attribute(
-                name="created_at",
-                type=dynamodb.AttributeType.STRING
-            )
-        }
-        
-        # Add GSI capacity for provisioned mode
-        if self.billing_mode == dynamodb.BillingMode.PROVISIONED:
-            gsi_props.update({
-                "read_capacity": capacity_config["read_capacity"],
-                "write_capacity": capacity_config["write_capacity"]
-            })
-        
-        self.tables["user_budgets"].add_global_secondary_index(**gsi_props)
+            gsis=(
+                # Budget status queries
+                {
+                    "index_name": "BudgetStatusIndex",
+                    "partition_key": dynamodb.Attribute(
+                        name="budget_status",
+                        type=dynamodb.AttributeType.STRING
+                    ),
+                    "sort_key": dynamodb.Attribute(
+                        name="created_at",
+                        type=dynamodb.AttributeType.STRING
+                    )
+                },
+                # Sparse GSI for the budget monitor: it queries one status at a time instead of
+                # scanning the table, and only reads the attributes its checks need
+                {
+                    "index_name": "ActiveBudgetIndex",
+                    "partition_key": dynamodb.Attribute(
+                        name="status",
+                        type=dynamodb.AttributeType.STRING
+                    ),
+                    # spent_usd rather than a stored usage percent: pool keys have no limit and
+                    # would drop out of the index, and DynamoDB cannot divide in an update
+                    "sort_key": dynamodb.Attribute(
+                        name="spent_usd",
+                        type=dynamodb.AttributeType.NUMBER
+                    ),
+                    "projection_type": dynamodb.ProjectionType.INCLUDE,
+                    "non_key_attributes": [
+                        "budget_limit_usd",
+                        "grace_deadline_epoch",
+                        "account_type",
+                        "has_carveout",
+                        "threshold_state",
+                        "budget_refresh_date"
+                    ]
+                }
+            ),
+            # Spend changes drive the stream-based budget monitor
+            stream=dynamodb.StreamViewType.NEW_AND_OLD_IMAGES
+        )
     
     def _create_usage_tracking_table(self) -> None:
         """Create the usage tracking table for AWS service consumption"""
-        # Get encryption configuration
-        encryption_props = self._get_encryption_config()
-        
         capacity_config = self._get_table_capacity_config()
         
-        table_props = {
-            "table_name": f"bedrock-budgeteer-{self.environment_name}-usage-tracking",
-            "partition_key": dynamodb.Attribute(
+        self._make_table(
+            "UsageTrackingTable", "usage_tracking", "usage-tracking",
+            partition_key=dynamodb.Attribute(
                 name="principal_id",
                 type=dynamodb.AttributeType.STRING
             ),
-            "sort_key": dynamodb.Attribute(
+            sort_key=dynamodb.Attribute(
                 name="timestamp",
                 type=dynamodb.AttributeType.STRING
             ),
-            "billing_mode": self.billing_mode,
-            "removal_policy": self.removal_policy,
-            "point_in_time_recovery_specification": dynamodb.PointInTimeRecoverySpecification(
-                point_in_time_recovery_enabled=self._get_point_in_time_recovery()
+            gsis=(
+                # Service-based queries
+                {
+                    "index_name": "ServiceUsageIndex",
+                    "partition_key": dynamodb.Attribute(
+                        name="service_name",
+                        type=dynamodb.AttributeType.STRING
+                    ),
+                    "sort_key": dynamodb.Attribute(
+                        name="timestamp",
+                        type=dynamodb.AttributeType.STRING
+                    )
+                },
             ),
-            **encryption_props
-        }
-        
-        if self.billing_mode == dynamodb.BillingMode.PROVISIONED:
-            table_props.update({
+            capacity={
                 "read_capacity": max(capacity_config["read_capacity"], 10),
                 "write_capacity": max(capacity_config["write_capacity"], 20)  # Higher write capacity for usage events
-            })
-        
-        self.tables["usage_tracking"] = dynamodb.Table(
-            self, "UsageTrackingTable", 
-            **table_props
+            }
         )
-        
-        # Add auto-scaling
-        self._add_auto_scaling(self.tables["usage_tracking"], "usage_tracking")
-        
-        # Add GSI for service-based queries
-        gsi_props = {
-            "index_name": "ServiceUsageIndex",
-            "partition_key": dynamodb.Attribute(
-                name="service_name",
-                type=dynamodb.AttributeType.STRING
-            ),
-            "sort_key": dynamodb.Attribute(
-                name="timestamp",
-                type=dynamodb.AttributeType.STRING
-            )
-        }
-        
-        # Add GSI capacity for provisioned mode
-        if self.billing_mode == dynamodb.BillingMode.PROVISIONED:
-            gsi_props.update({
-                "read_capacity": max(capacity_config["read_capacity"], 10),
-                "write_capacity": max(capacity_config["write_capacity"], 20)
-            })
-        
-        self.tables["usage_tracking"].add_global_secondary_index(**gsi_props)
-    
-
-    
-
     
     def _add_auto_scaling(self, table: dynamodb.Table, table_type: str) -> None:
         """Add auto-scaling configuration for production DynamoDB tables"""
@@ -204,8 +209,7 @@ class DataStorageConstruct(Construct):
         # Auto-scaling configuration based on table type
         scaling_configs = {
             "user_budgets": {"min_read": 5, "max_read": 40, "min_write": 5, "max_write": 40},
-            "usage_tracking": {"min_read": 10, "max_read": 100, "min_write": 20, "max_write": 200},
-            "audit_logs": {"min_read": 10, "max_read": 100, "min_write": 25, "max_write": 250}
+            "usage_tracking": {"min_read": 10, "max_read": 100, "min_write": 20, "max_write": 400}
         }
         
         config = scaling_configs.get(table_type, scaling_configs["user_budgets"])
@@ -228,137 +232,71 @@ class DataStorageConstruct(Construct):
             max_capacity=config["max_write"]
         )
         
+        # Writes arrive in bursts: scale out quickly, scale in slowly to avoid thrashing
         write_scaling.scale_on_utilization(
             target_utilization_percent=70,
-            scale_in_cooldown=Duration.seconds(60),
-            scale_out_cooldown=Duration.seconds(60)
+            scale_in_cooldown=Duration.seconds(300),
+            scale_out_cooldown=Duration.seconds(15)
         )
     
     def _create_audit_logs_table(self) -> None:
         """Create the audit logs table for CloudTrail event tracking"""
-        # Get encryption configuration
-        encryption_props = self._get_encryption_config()
-        
-        capacity_config = self._get_table_capacity_config()
-        
-        table_props = {
-            "table_name": f"bedrock-budgeteer-{self.environment_name}-audit-logs",
-            "partition_key": dynamodb.Attribute(
+        self._make_table(
+            "AuditLogsTable", "audit_logs", "audit-logs",
+            partition_key=dynamodb.Attribute(
                 name="event_id",
                 type=dynamodb.AttributeType.STRING
             ),
-            "sort_key": dynamodb.Attribute(
+            sort_key=dynamodb.Attribute(
                 name="event_time",
                 type=dynamodb.AttributeType.STRING
             ),
-            "billing_mode": self.billing_mode,
-            "removal_policy": self.removal_policy,
-            "point_in_time_recovery_specification": dynamodb.PointInTimeRecoverySpecification(
-                point_in_time_recovery_enabled=self._get_point_in_time_recovery()
+            gsis=(
+                # User-based audit queries
+                {
+                    "index_name": "UserAuditIndex",
+                    "partition_key": dynamodb.Attribute(
+                        name="user_identity",
+                        type=dynamodb.AttributeType.STRING
+                    ),
+                    "sort_key": dynamodb.Attribute(
+                        name="event_time",
+                        type=dynamodb.AttributeType.STRING
+                    )
+                },
+                # Event source based queries (e.g., all Bedrock events)
+                {
+                    "index_name": "EventSourceIndex",
+                    "partition_key": dynamodb.Attribute(
+                        name="event_source",
+                        type=dynamodb.AttributeType.STRING
+                    ),
+                    "sort_key": dynamodb.Attribute(
+                        name="event_time",
+                        type=dynamodb.AttributeType.STRING
+                    )
+                }
             ),
-            **encryption_props
-        }
-        
-        if self.billing_mode == dynamodb.BillingMode.PROVISIONED:
-            table_props.update({
-                "read_capacity": max(capacity_config["read_capacity"], 10),
-                "write_capacity": max(capacity_config["write_capacity"], 25)  # High write capacity for audit events
-            })
-        
-        self.tables["audit_logs"] = dynamodb.Table(
-            self, "AuditLogsTable",
-            **table_props
+            # On-demand regardless of the stack billing mode: audit writes arrive in
+            # CloudTrail-driven bursts that outpace write auto-scaling
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST
         )
-        
-        # Add auto-scaling
-        self._add_auto_scaling(self.tables["audit_logs"], "audit_logs")
-        
-        # Add GSI for user-based audit queries
-        gsi_props = {
-            "index_name": "UserAuditIndex",
-            "partition_key": dynamodb.Attribute(
-                name="user_identity",
-                type=dynamodb.AttributeType.STRING
-            ),
-            "sort_key": dynamodb.Attribute(
-                name="event_time",
-                type=dynamodb.AttributeType.STRING
-            )
-        }
-        
-        # Add GSI capacity for provisioned mode
-        if self.billing_mode == dynamodb.BillingMode.PROVISIONED:
-            gsi_props.update({
-                "read_capacity": max(capacity_config["read_capacity"], 10),
-                "write_capacity": max(capacity_config["write_capacity"], 25)
-            })
-        
-        self.tables["audit_logs"].add_global_secondary_index(**gsi_props)
-        
-        # Add GSI for event source based queries (e.g., all Bedrock events)
-        gsi2_props = {
-            "index_name": "EventSourceIndex",
-            "partition_key": dynamodb.Attribute(
-                name="event_source",
-                type=dynamodb.AttributeType.STRING
-            ),
-            "sort_key": dynamodb.Attribute(
-                name="event_time",
-                type=dynamodb.AttributeType.STRING
-            )
-        }
-        
-        if self.billing_mode == dynamodb.BillingMode.PROVISIONED:
-            gsi2_props.update({
-                "read_capacity": max(capacity_config["read_capacity"], 5),
-                "write_capacity": max(capacity_config["write_capacity"], 10)
-            })
-        
-        self.tables["audit_logs"].add_global_secondary_index(**gsi2_props)
     
     def _create_pricing_table(self) -> None:
         """Create pricing table for storing AWS Bedrock model pricing data"""
-        
-        capacity_config = self._get_table_capacity_config()
-        
-        table_props = {
-            "table_name": f"bedrock-budgeteer-{self.environment_name}-pricing",
-            "partition_key": dynamodb.Attribute(
+        self._make_table(
+            "PricingTable", "pricing", "pricing",
+            partition_key=dynamodb.Attribute(
                 name="model_id",
                 type=dynamodb.AttributeType.STRING
             ),
-            "sort_key": dynamodb.Attribute(
+            sort_key=dynamodb.Attribute(
                 name="region",
                 type=dynamodb.AttributeType.STRING
             ),
-            "billing_mode": self.billing_mode,
-            "removal_policy": self.removal_policy,
-            "point_in_time_recovery_specification": dynamodb.PointInTimeRecoverySpecification(
-                point_in_time_recovery_enabled=self._get_point_in_time_recovery()
-            ),
-            "time_to_live_attribute": "ttl"
-        }
-        
-        # Add encryption
-        if self.kms_key:
-            table_props["encryption"] = dynamodb.TableEncryption.CUSTOMER_MANAGED
-            table_props["encryption_key"] = self.kms_key
-        else:
-            table_props["encryption"] = dynamodb.TableEncryption.AWS_MANAGED
-        
-        # Add provisioned capacity if needed
-        if self.billing_mode == dynamodb.BillingMode.PROVISIONED:
-            table_props.update({
-                "read_capacity": max(capacity_config["read_capacity"], 5),  # Low read capacity - infrequent access
-                "write_capacity": max(capacity_config["write_capacity"], 2)  # Very low write capacity - daily updates
-            })
-        
-        self.tables["pricing"] = dynamodb.Table(
-            self, "PricingTable",
-            **table_props
+            # On-demand regardless of the stack billing mode: a daily write burst plus
+            # sporadic reads, which auto-scaling reacts to too slowly
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            # TTL for pricing cache expiration
+            time_to_live_attribute="ttl"
         )
-        
-        # Add auto-scaling for production
-        self._add_auto_scaling(self.tables["pricing"], "pricing")
-        
-        # TTL for pricing cache expiration is configured in table_props above
@@ -11,7 +11,6 @@ from aws_cdk import (
     aws_iam as iam,
     aws_lambda as lambda_,
     aws_logs as logs,
-    aws_logs_destinations as logs_destinations,
     aws_kms as kms,
     RemovalPolicy,
     Duration,
@@ -19,6 +18,29 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+from .agentcore import AGENTCORE_LIFECYCLE_EVENT_NAMES
+
+
+# Bedrock management events consumed by the EventBridge rules below; the trail records only these
+BEDROCK_USAGE_EVENT_NAMES = [
+    "InvokeModel",
+    "InvokeModelWithResponseStream",
+    "InvokeModelWithBidirectionalStream",
+    "Converse",
+    "ConverseStream",
+    "StartAsyncInvoke",
+    "GetFoundationModel",
+    "ListFoundationModels"
+]
+BEDROCK_AGENT_EVENT_NAMES = [
+    "InvokeAgent",
+    "InvokeInlineAgent",
+    "InvokeFlow",
+    "Retrieve",
+    "RetrieveAndGenerate",
+    "RetrieveAndGenerateStream"
+]
+
 
 class EventIngestionConstruct(Construct):
     """Construct for event ingestion pipeline including CloudTrail, EventBridge, and Kinesis Firehose"""
@@ -29,14 +51,32 @@ class EventIngestionConstruct(Construct):
                  kms_key: Optional[kms.IKey] = None,
                  usage_calculator_function: Optional[lambda_.Function] = None,
                  log_retention_days: Optional[logs.RetentionDays] = None,
+                 audit_buffer_interval: Optional[Duration] = None,
+                 audit_buffer_size: Optional[Size] = None,
+                 inline_partition_queries: Optional[Dict[str, str]] = None,
                  **kwargs) -> None:
+        """
+        audit_buffer_interval / audit_buffer_size tune the audit-logs Firehose buffer
+        (default 300 s / 5 MiB). Audit traffic is low-rate, so latency barely grows with
+        the buffer while S3 gets fewer, better compressed objects; Firehose already
+        bills each record in 5 KB increments, so the buffer is where batching pays off.
+        
+        inline_partition_queries maps S3 partition keys to JQ expressions over each
+        invocation log (e.g. {"model": ".modelId"}). It only applies without a
+        usage_calculator_function, partitioning inside Firehose with no Lambda hop.
+        """
         super().__init__(scope, construct_id, **kwargs)
         
         self.environment_name = environment_name
+        self._name_prefix = f"bedrock-budgeteer-{environment_name}"
+        self._usage_stream_name = f"{self._name_prefix}-usage-logs"
         self.s3_bucket = s3_bucket
         self.kms_key = kms_key
         self.usage_calculator_function = usage_calculator_function
         self.log_retention_days = log_retention_days or logs.RetentionDays.ONE_WEEK  # Default to 7 days
+        self.audit_buffer_interval = audit_buffer_interval or Duration.seconds(300)
+        self.audit_buffer_size = audit_buffer_size or Size.mebibytes(5)
+        self.inline_partition_queries = inline_partition_queries
         
         # Initialize storage for created resources
         self.cloudtrail_trails: Dict[str, cloudtrail.Trail] = {}
@@ -53,13 +93,16 @@ class EventIngestionConstruct(Construct):
         # Create EventBridge rules for event routing
         self._create_eventbridge_rules()
         
+        # One role per service principal, shared by everything that principal writes
+        self._create_firehose_roles()
+        
         # Create Kinesis Data Firehose streams
         self._create_firehose_streams()
         
         # Create Bedrock invocation log group and subscription
         self._create_bedrock_invocation_logs()
         
-        # Tags are applied by TaggingFramework aspects
+        # Tags are applied by the stack via apply_tags
     
     def _should_skip_public_access_block(self) -> bool:
         """Check if S3 public access block should be skipped (for enterprise SCPs)"""
@@ -68,6 +111,13 @@ class EventIngestionConstruct(Construct):
         except (AttributeError, TypeError):
             return False
     
+    def _expire_on_destroy(self) -> bool:
+        """Check if CloudTrail objects should be expired so the bucket can be deleted"""
+        try:
+            return self.node.try_get_context("bedrock-budgeteer:feature-flags").get("expire-on-destroy", False)
+        except (AttributeError, TypeError):
+            return False
+    
     def _get_removal_policy(self) -> RemovalPolicy:
         """Get removal policy for production environment"""
         # Allow resource deletion for proper rollback during deployment failures
@@ -79,7 +129,7 @@ class EventIngestionConstruct(Construct):
         # Create CloudTrail S3 bucket if not provided
         if not self.s3_bucket:
             cloudtrail_bucket_props = {
-                "bucket_name": f"bedrock-budgeteer-{self.environment_name}-cloudtrail",
+                "bucket_name": f"{self._name_prefix}-cloudtrail",
                 "removal_policy": self.removal_policy,
                 "encryption": s3.BucketEncryption.S3_MANAGED if not self.kms_key else s3.BucketEncryption.KMS,
                 "encryption_key": self.kms_key if self.kms_key else None,
@@ -101,11 +151,17 @@ class EventIngestionConstruct(Construct):
                                 transition_after=Duration.days(365)
                             )
                         ]
+                    ),
+                    # Empties the bucket ahead of a stack deletion: turn the flag on,
+                    # deploy, and let S3 expire the objects in the background
+                    s3.LifecycleRule(
+                        id="ExpireOnDestroy",
+                        enabled=self._expire_on_destroy(),
+                        expiration=Duration.days(1)
                     )
                 ],
                 "public_read_access": False,
-                "versioned": False,  # Disable versioning to allow proper deletion
-                "auto_delete_objects": True  # Allow CDK to delete objects during bucket deletion
+                "versioned": False  # Disable versioning to allow proper deletion
             }
             
             # Only add public access block if not skipped (for enterprise SCPs)
@@ -116,15 +172,16 @@ class EventIngestionConstruct(Construct):
         else:
             self.cloudtrail_bucket = self.s3_bucket
         
-        # Create CloudTrail with EventBridge integration
+        # Create CloudTrail with EventBridge integration. Bedrock activity is regional, so
+        # this trail only records the deployment region; IAM goes to the global trail below
         self.cloudtrail_trails["main"] = cloudtrail.Trail(
             self, "BedrockBudgeteerTrail",
-            trail_name=f"bedrock-budgeteer-{self.environment_name}-trail",
+            trail_name=f"{self._name_prefix}-trail",
             bucket=self.cloudtrail_bucket,
             s3_key_prefix="cloudtrail-logs",
             enable_file_validation=True,
-            include_global_service_events=True,
-            is_multi_region_trail=True,
+            include_global_service_events=False,
+            is_multi_region_trail=False,
             send_to_cloud_watch_logs=True,
             cloud_watch_logs_retention=logs.RetentionDays.ONE_MONTH,
             # Note: EventBridge integration enabled through event rules
@@ -138,23 +195,36 @@ class EventIngestionConstruct(Construct):
         cfn_trail = self.cloudtrail_trails["main"].node.default_child
         cfn_trail.add_property_override("AdvancedEventSelectors", [
             {
+                # Only the management events a rule routes; console/SDK polling and
+                # unrelated services never reach S3 or CloudWatch Logs
                 "Name": "BedrockManagementEvents",
                 "FieldSelectors": [
-                    {"Field": "eventCategory", "EqualTo": ["Management"]}
+                    {"Field": "eventCategory", "Equals": ["Management"]},
+                    {"Field": "eventSource", "Equals": [
+                        "bedrock.amazonaws.com",
+                        "bedrock-agent.amazonaws.com",
+                        "bedrock-agent-runtime.amazonaws.com",
+                        "bedrock-agentcore.amazonaws.com"
+                    ]},
+                    {"Field": "eventName", "Equals": (
+                        BEDROCK_USAGE_EVENT_NAMES
+                        + BEDROCK_AGENT_EVENT_NAMES
+                        + AGENTCORE_LIFECYCLE_EVENT_NAMES
+                    )}
                 ]
             },
             {
                 "Name": "BedrockModelDataEvents",
                 "FieldSelectors": [
-                    {"Field": "eventCategory", "EqualTo": ["Data"]},
-                    {"Field": "resources.type", "EqualTo": ["AWS::Bedrock::Model"]}
+                    {"Field": "eventCategory", "Equals": ["Data"]},
+                    {"Field": "resources.type", "Equals": ["AWS::Bedrock::Model"]}
                 ]
             },
             {
                 "Name": "BedrockAgentDataEvents",
                 "FieldSelectors": [
-                    {"Field": "eventCategory", "EqualTo": ["Data"]},
-                    {"Field": "resources.type", "EqualTo": [
+                    {"Field": "eventCategory", "Equals": ["Data"]},
+                    {"Field": "resources.type", "Equals": [
                         "AWS::Bedrock::Agent",
                         "AWS::Bedrock::InlineAgent"
                     ]}
@@ -163,29 +233,29 @@ class EventIngestionConstruct(Construct):
             {
                 "Name": "BedrockFlowDataEvents",
                 "FieldSelectors": [
-                    {"Field": "eventCategory", "EqualTo": ["Data"]},
-                    {"Field": "resources.type", "EqualTo": ["AWS::Bedrock::Flow"]}
+                    {"Field": "eventCategory", "Equals": ["Data"]},
+                    {"Field": "resources.type", "Equals": ["AWS::Bedrock::Flow"]}
                 ]
             },
             {
                 "Name": "BedrockKnowledgeBaseDataEvents",
                 "FieldSelectors": [
-                    {"Field": "eventCategory", "EqualTo": ["Data"]},
-                    {"Field": "resources.type", "EqualTo": ["AWS::Bedrock::KnowledgeBase"]}
+                    {"Field": "eventCategory", "Equals": ["Data"]},
+                    {"Field": "resources.type", "Equals": ["AWS::Bedrock::KnowledgeBase"]}
                 ]
             },
             {
                 "Name": "BedrockGuardrailDataEvents",
                 "FieldSelectors": [
-                    {"Field": "eventCategory", "EqualTo": ["Data"]},
-                    {"Field": "resources.type", "EqualTo": ["AWS::Bedrock::Guardrail"]}
+                    {"Field": "eventCategory", "Equals": ["Data"]},
+                    {"Field": "resources.type", "Equals": ["AWS::Bedrock::Guardrail"]}
                 ]
             },
             {
                 "Name": "S3DataEvents",
                 "FieldSelectors": [
-                    {"Field": "eventCategory", "EqualTo": ["Data"]},
-                    {"Field": "resources.type", "EqualTo": ["AWS::S3::Object"]}
+                    {"Field": "eventCategory", "Equals": ["Data"]},
+                    {"Field": "resources.type", "Equals": ["AWS::S3::Object"]}
                 ]
             }
         ])
@@ -206,6 +276,27 @@ class EventIngestionConstruct(Construct):
             read_write_type=cloudtrail.ReadWriteType.ALL,
             include_management_events=False
         )
+        
+        # IAM is a global service; record only its write calls, once, for the IAM rules
+        self.cloudtrail_trails["global"] = cloudtrail.Trail(
+            self, "BedrockBudgeteerGlobalTrail",
+            trail_name=f"{self._name_prefix}-global-trail",
+            bucket=self.cloudtrail_bucket,
+            s3_key_prefix="cloudtrail-logs",
+            enable_file_validation=True,
+            include_global_service_events=True,
+            is_multi_region_trail=True
+        )
+        self.cloudtrail_trails["global"].node.default_child.add_property_override("AdvancedEventSelectors", [
+            {
+                "Name": "IAMWriteManagementEvents",
+                "FieldSelectors": [
+                    {"Field": "eventCategory", "Equals": ["Management"]},
+                    {"Field": "eventSource", "Equals": ["iam.amazonaws.com"]},
+                    {"Field": "readOnly", "Equals": ["false"]}
+                ]
+            }
+        ])
     
     def _create_eventbridge_rules(self) -> None:
         """Create EventBridge rules for filtering and routing CloudTrail events"""
@@ -213,23 +304,14 @@ class EventIngestionConstruct(Construct):
         # Rule for Bedrock API usage events
         self.eventbridge_rules["bedrock_usage"] = events.Rule(
             self, "BedrockUsageRule",
-            rule_name=f"bedrock-budgeteer-{self.environment_name}-bedrock-usage",
+            rule_name=f"{self._name_prefix}-bedrock-usage",
             description="Capture Bedrock API usage events for cost tracking",
             event_pattern=events.EventPattern(
                 source=["aws.bedrock"],
                 detail_type=["AWS API Call via CloudTrail"],
                 detail={
                     "eventSource": ["bedrock.amazonaws.com"],
-                    "eventName": [
-                        "InvokeModel",
-                        "InvokeModelWithResponseStream",
-                        "InvokeModelWithBidirectionalStream",
-                        "Converse",
-                        "ConverseStream",
-                        "StartAsyncInvoke",
-                        "GetFoundationModel",
-                        "ListFoundationModels"
-                    ]
+                    "eventName": BEDROCK_USAGE_EVENT_NAMES
                 }
             )
         )
@@ -237,7 +319,7 @@ class EventIngestionConstruct(Construct):
         # Rule for Bedrock Agents, Flows, and Knowledge Bases events
         self.eventbridge_rules["bedrock_agents"] = events.Rule(
             self, "BedrockAgentsRule",
-            rule_name=f"bedrock-budgeteer-{self.environment_name}-bedrock-agents",
+            rule_name=f"{self._name_prefix}-bedrock-agents",
             description="Capture Bedrock Agents, Flows, and Knowledge Bases usage events",
             event_pattern=events.EventPattern(
                 source=["aws.bedrock-agent-runtime", "aws.bedrock-agent", "aws.bedrock"],
@@ -248,14 +330,7 @@ class EventIngestionConstruct(Construct):
                         "bedrock-agent.amazonaws.com",
                         "bedrock.amazonaws.com"
                     ],
-                    "eventName": [
-                        "InvokeAgent",
-                        "InvokeInlineAgent",
-                        "InvokeFlow",
-                        "Retrieve",
-                        "RetrieveAndGenerate",
-                        "RetrieveAndGenerateStream"
-                    ]
+                    "eventName": BEDROCK_AGENT_EVENT_NAMES
                 }
             )
         )
@@ -263,7 +338,7 @@ class EventIngestionConstruct(Construct):
         # Rule for IAM access key creation events
         self.eventbridge_rules["iam_key_creation"] = events.Rule(
             self, "IAMKeyCreationRule",
-            rule_name=f"bedrock-budgeteer-{self.environment_name}-iam-key-creation",
+            rule_name=f"{self._name_prefix}-iam-key-creation",
             description="Capture IAM access key creation events",
             event_pattern=events.EventPattern(
                 source=["aws.iam"],
@@ -282,7 +357,7 @@ class EventIngestionConstruct(Construct):
         # Rule for IAM permission changes affecting Bedrock access
         self.eventbridge_rules["iam_bedrock_permissions"] = events.Rule(
             self, "IAMBedrockPermissionsRule",
-            rule_name=f"bedrock-budgeteer-{self.environment_name}-iam-bedrock-permissions",
+            rule_name=f"{self._name_prefix}-iam-bedrock-permissions",
             description="Capture IAM permission changes affecting Bedrock access",
             event_pattern=events.EventPattern(
                 source=["aws.iam"],
@@ -298,30 +373,32 @@ class EventIngestionConstruct(Construct):
                         "PutRolePolicy",
                         "DeleteUserPolicy",
                         "DeleteRolePolicy"
-                    ],
-                    # Filter for policies that might affect Bedrock access
-                    "requestParameters": {
-                        "policyDocument": {
-                            "Statement": {
-                                "Effect": ["Allow"],
-                                "Action": ["bedrock:*"]
-                            }
-                        }
-                    }
+                    ]
+                    # No requestParameters filter: CloudTrail records policyDocument as an
+                    # encoded string and Attach*/Detach* calls only carry a policyArn, so
+                    # whether a change touches Bedrock has to be decided by the target
                 }
             )
         )
     
-    def _create_firehose_streams(self) -> None:
-        """Create Kinesis Data Firehose streams for log data delivery"""
-        
-        # Create IAM role for Firehose
-        firehose_role = iam.Role(
+    def _create_firehose_roles(self) -> None:
+        """Create the Firehose delivery role and the CloudWatch Logs role that writes to Firehose"""
+        self._firehose_role = iam.Role(
             self, "FirehoseDeliveryRole",
             assumed_by=iam.ServicePrincipal("firehose.amazonaws.com"),
             description="Role for Kinesis Data Firehose to deliver logs"
         )
         
+        self._logs_to_firehose_role = iam.Role(
+            self, "BedrockLogsToFirehoseRole",
+            assumed_by=iam.ServicePrincipal("logs.amazonaws.com"),
+            description="Role for CloudWatch Logs to stream Bedrock logs to Firehose"
+        )
+    
+    def _create_firehose_streams(self) -> None:
+        """Create Kinesis Data Firehose streams for log data delivery"""
+        firehose_role = self._firehose_role
+        
         # Grant permissions to write to S3
         if self.s3_bucket:
             self.s3_bucket.grant_write(firehose_role)
@@ -331,38 +408,96 @@ class EventIngestionConstruct(Construct):
             self.kms_key.grant_encrypt_decrypt(firehose_role)
         
         # Create Firehose stream for Bedrock usage logs with optional data transformation
+        processors = []
+        partition_prefix = None
         if self.usage_calculator_function:
             # Grant Firehose permission to invoke the usage calculator Lambda
             self.usage_calculator_function.grant_invoke(firehose_role)
+            processors.append(firehose.CfnDeliveryStream.ProcessorProperty(
+                type="Lambda",
+                parameters=[
+                    firehose.CfnDeliveryStream.ProcessorParameterProperty(
+                        parameter_name="LambdaArn",
+                        parameter_value=self.usage_calculator_function.function_arn
+                    )
+                ]
+            ))
+        elif self.inline_partition_queries:
+            # No Lambda in the path: Firehose unpacks the CloudWatch Logs payload itself
+            # and evaluates the JQ expressions in-process to pick each record's partition
+            query = "{" + ",".join(
+                f"{key}:{expression}" for key, expression in self.inline_partition_queries.items()
+            ) + "}"
+            processors.extend([
+                firehose.CfnDeliveryStream.ProcessorProperty(
+                    type="Decompression",
+                    parameters=[firehose.CfnDeliveryStream.ProcessorParameterProperty(
+                        parameter_name="CompressionFormat", parameter_value="GZIP"
+                    )]
+                ),
+                firehose.CfnDeliveryStream.ProcessorProperty(
+                    type="CloudWatchLogProcessing",
+                    parameters=[firehose.CfnDeliveryStream.ProcessorParameterProperty(
+                        parameter_name="DataMessageExtraction", parameter_value="true"
+                    )]
+                ),
+                firehose.CfnDeliveryStream.ProcessorProperty(
+                    type="MetadataExtraction",
+                    parameters=[
+                        firehose.CfnDeliveryStream.ProcessorParameterProperty(
+                            parameter_name="MetadataExtractionQuery", parameter_value=query
+                        ),
+                        firehose.CfnDeliveryStream.ProcessorParameterProperty(
+                            parameter_name="JsonParsingEngine", parameter_value="JQ-1.6"
+                        )
+                    ]
+                )
+            ])
+            partition_prefix = "".join(
+                f"{key}=!{{partitionKeyFromQuery:{key}}}/" for key in self.inline_partition_queries
+            )
+        
+        if processors:
+            partition_props = {}
+            encryption_props = {}
+            if self.kms_key:
+                encryption_props["encryption_configuration"] = firehose.CfnDeliveryStream.EncryptionConfigurationProperty(
+                    kms_encryption_config=firehose.CfnDeliveryStream.KMSEncryptionConfigProperty(
+                        awskms_key_arn=self.kms_key.key_arn
+                    )
+                )
+            prefix = "bedrock-usage-logs/year=!{timestamp:yyyy}/month=!{timestamp:MM}/day=!{timestamp:dd}/hour=!{timestamp:HH}/"
+            error_output_prefix = "errors/"
+            buffer_size_mb = 5
+            if partition_prefix:
+                partition_props["dynamic_partitioning_configuration"] = firehose.CfnDeliveryStream.DynamicPartitioningConfigurationProperty(
+                    enabled=True,
+                    retry_options=firehose.CfnDeliveryStream.RetryOptionsProperty(duration_in_seconds=300)
+                )
+                prefix = "bedrock-usage-logs/" + partition_prefix + "year=!{timestamp:yyyy}/month=!{timestamp:MM}/day=!{timestamp:dd}/hour=!{timestamp:HH}/"
+                error_output_prefix = "errors/!{firehose:error-output-type}/"
+                buffer_size_mb = 64  # Minimum buffer size with dynamic partitioning
             
             # Use L1 construct (CfnDeliveryStream) for data transformation support
             self.firehose_streams["bedrock_usage"] = firehose.CfnDeliveryStream(
                 self, "BedrockUsageFirehose",
-                delivery_stream_name=f"bedrock-budgeteer-{self.environment_name}-usage-logs",
+                delivery_stream_name=self._usage_stream_name,
                 delivery_stream_type="DirectPut",
                 extended_s3_destination_configuration=firehose.CfnDeliveryStream.ExtendedS3DestinationConfigurationProperty(
                     bucket_arn=(self.s3_bucket if self.s3_bucket else self.cloudtrail_bucket).bucket_arn,
                     role_arn=firehose_role.role_arn,
-                    prefix="bedrock-usage-logs/year=!{timestamp:yyyy}/month=!{timestamp:MM}/day=!{timestamp:dd}/hour=!{timestamp:HH}/",
-                    error_output_prefix="errors/",
+                    prefix=prefix,
+                    error_output_prefix=error_output_prefix,
                     buffering_hints=firehose.CfnDeliveryStream.BufferingHintsProperty(
                         interval_in_seconds=300,
-                        size_in_m_bs=5
+                        size_in_m_bs=buffer_size_mb
                     ),
                     compression_format="GZIP",
+                    **partition_props,
+                    **encryption_props,
                     processing_configuration=firehose.CfnDeliveryStream.ProcessingConfigurationProperty(
                         enabled=True,
-                        processors=[
-                            firehose.CfnDeliveryStream.ProcessorProperty(
-                                type="Lambda",
-                                parameters=[
-                                    firehose.CfnDeliveryStream.ProcessorParameterProperty(
-                                        parameter_name="LambdaArn",
-                                        parameter_value=self.usage_calculator_function.function_arn
-                                    )
-                                ]
-                            )
-                        ]
+                        processors=processors
                     )
                 )
             )
@@ -370,7 +505,7 @@ class EventIngestionConstruct(Construct):
             # Use L2 construct without data transformation
             self.firehose_streams["bedrock_usage"] = firehose.DeliveryStream(
                 self, "BedrockUsageFirehose",
-                delivery_stream_name=f"bedrock-budgeteer-{self.environment_name}-usage-logs",
+                delivery_stream_name=self._usage_stream_name,
                 destination=firehose.S3Bucket(
                     bucket=self.s3_bucket if self.s3_bucket else self.cloudtrail_bucket,
                     data_output_prefix="bedrock-usage-logs/year=!{timestamp:yyyy}/month=!{timestamp:MM}/day=!{timestamp:dd}/hour=!{timestamp:HH}/",
@@ -378,6 +513,7 @@ class EventIngestionConstruct(Construct):
                     buffering_interval=Duration.seconds(300),
                     buffering_size=Size.mebibytes(5),
                     compression=firehose.Compression.GZIP,
+                    encryption_key=self.kms_key,
                     role=firehose_role
                 )
             )
@@ -385,24 +521,32 @@ class EventIngestionConstruct(Construct):
         # Create Firehose stream for audit logs
         self.firehose_streams["audit_logs"] = firehose.DeliveryStream(
             self, "AuditLogsFirehose",
-            delivery_stream_name=f"bedrock-budgeteer-{self.environment_name}-audit-logs",
+            delivery_stream_name=f"{self._name_prefix}-audit-logs",
             destination=firehose.S3Bucket(
                 bucket=self.s3_bucket if self.s3_bucket else self.cloudtrail_bucket,
                 data_output_prefix="audit-logs/year=!{timestamp:yyyy}/month=!{timestamp:MM}/day=!{timestamp:dd}/hour=!{timestamp:HH}/",
                 error_output_prefix="audit-errors/",
-                buffering_interval=Duration.seconds(60),
-                buffering_size=Size.mebibytes(3),
+                buffering_interval=self.audit_buffer_interval,
+                buffering_size=self.audit_buffer_size,
                 compression=firehose.Compression.GZIP,
+                encryption_key=self.kms_key,
                 role=firehose_role
             )
         )
+        
+        # The usage stream is L1 (CfnDeliveryStream) when it has a transformation, else L2
+        usage_stream = self.firehose_streams["bedrock_usage"]
+        if isinstance(usage_stream, firehose.CfnDeliveryStream):
+            self._bedrock_usage_firehose_arn = usage_stream.attr_arn
+        else:
+            self._bedrock_usage_firehose_arn = usage_stream.delivery_stream_arn
     
     def _create_bedrock_invocation_logs(self) -> None:
         """Create CloudWatch log group for Bedrock invocation logs and subscription to Firehose"""
         
         # Create log group with KMS encryption if available
         log_group_props = {
-            "log_group_name": f"/aws/bedrock/bedrock-budgeteer-{self.environment_name}-invocation-logs",
+            "log_group_name": f"/aws/bedrock/{self._name_prefix}-invocation-logs",
             "retention": self.log_retention_days,
             "removal_policy": self.removal_policy
         }
@@ -416,21 +560,10 @@ class EventIngestionConstruct(Construct):
             **log_group_props
         )
         
-        # Create IAM role for CloudWatch Logs to write to Firehose
-        logs_to_firehose_role = iam.Role(
-            self, "BedrockLogsToFirehoseRole",
-            assumed_by=iam.ServicePrincipal("logs.amazonaws.com"),
-            description="Role for CloudWatch Logs to stream Bedrock logs to Firehose"
-        )
+        logs_to_firehose_role = self._logs_to_firehose_role
         
         # Grant permissions to put records to Firehose
-        # Handle both L1 (CfnDeliveryStream) and L2 (DeliveryStream) constructs
-        if hasattr(self.firehose_streams["bedrock_usage"], 'delivery_stream_arn'):
-            # L2 construct
-            firehose_arn = self.firehose_streams["bedrock_usage"].delivery_stream_arn
-        else:
-            # L1 construct - construct ARN manually
-            firehose_arn = f"arn:aws:firehose:*:*:deliverystream/bedrock-budgeteer-{self.environment_name}-usage-logs"
+        firehose_arn = self._bedrock_usage_firehose_arn
         
         logs_to_firehose_role.add_to_policy(
             iam.PolicyStatement(
@@ -440,142 +573,22 @@ class EventIngestionConstruct(Construct):
             )
         )
         
-        # Grant permissions to use KMS key if provided
-        if self.kms_key:
-            self.kms_key.grant_encrypt_decrypt(logs_to_firehose_role)
+        # No KMS grant: this role only calls PutRecord. The usage stream encrypts its S3
+        # output with the KMS key through the Firehose role, which holds the key grant,
+        # and CloudWatch Logs reads the encrypted log group under the key policy
         
-        # Create subscription filter to stream logs to Firehose
-        # Note: We need to use a custom destination since CDK doesn't have a built-in Firehose destination
-        logs.SubscriptionFilter(
+        # Stream logs straight to Firehose; the usage calculator unpacks the
+        # CloudWatch Logs payload in its data transformation step
+        subscription = logs.CfnSubscriptionFilter(
             self, "BedrockLogsSubscription",
-            log_group=self.log_groups["bedrock_invocation"],
-            destination=logs_destinations.LambdaDestination(
-                # We'll create a simple Lambda that forwards to Firehose
-                self._create_logs_to_firehose_lambda(logs_to_firehose_role)
-            ),
-            filter_pattern=logs.FilterPattern.all_events(),
-            filter_name=f"bedrock-budgeteer-{self.environment_name}-invocation-logs"
-        )
-    
-    def _create_logs_to_firehose_lambda(self, firehose_role: iam.Role) -> lambda_.Function:
-        """Create a Lambda function to forward CloudWatch Logs to Kinesis Data Firehose"""
-        
-        # Create execution role for the Lambda
-        lambda_role = iam.Role(
-            self, "LogsToFirehoseLambdaRole",
-            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
-            managed_policies=[
-                iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole")
-            ]
-        )
-        
-        # Grant permissions to put records to Firehose
-        # Use the same firehose ARN logic as above
-        if hasattr(self.firehose_streams["bedrock_usage"], 'delivery_stream_arn'):
-            # L2 construct
-            firehose_arn = self.firehose_streams["bedrock_usage"].delivery_stream_arn
-        else:
-            # L1 construct - construct ARN manually
-            firehose_arn = f"arn:aws:firehose:*:*:deliverystream/bedrock-budgeteer-{self.environment_name}-usage-logs"
-        
-        lambda_role.add_to_policy(
-            iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                actions=["firehose:PutRecord", "firehose:PutRecordBatch"],
-                resources=[firehose_arn]
-            )
-        )
-        
-        # Grant permissions to use KMS key if provided
-        if self.kms_key:
-            self.kms_key.grant_encrypt_decrypt(lambda_role)
-        
-        # Create the Lambda function
-        logs_forwarder = lambda_.Function(
-            self, "LogsToFirehoseLambda",
-            function_name=f"bedrock-budgeteer-{self.environment_name}-logs-forwarder",
-            runtime=lambda_.Runtime.PYTHON_3_9,
-            handler="index.lambda_handler",
-            role=lambda_role,
-            code=lambda_.Code.from_inline(f"""
-import json
-import boto3
-import gzip
-import base64
-import time
-import logging
-
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-firehose = boto3.client('firehose')
-DELIVERY_STREAM_NAME = 'bedrock-budgeteer-{self.environment_name}-usage-logs'
-
-def lambda_handler(event, context):
-    \"\"\"Forward CloudWatch Logs to Kinesis Data Firehose\"\"\"
-    
-    # Decode CloudWatch Logs data
-    cdata = event['awslogs']['data']
-    compressed_data = base64.b64decode(cdata)
-    uncompressed_data = gzip.decompress(compressed_data)
-    log_data = json.loads(uncompressed_data)
-    
-    # Process each log event
-    records = []
-    for log_event in log_data['logEvents']:
-        # Enrich the log event with metadata from CloudWatch log group
-        enriched_event = log_event.copy()
-        
-        # Extract principal ID from log group or log stream if available
-        # Log stream name might contain user info: e.g., "user-123/stream-456"
-        log_stream = log_data.get('logStream', '')
-        
-        # Try to extract principal from log stream name (format may vary)
-        principal_id = None
-        if '/' in log_stream:
-            parts = log_stream.split('/')
-            # Look for user-like identifiers
-            for part in parts:
-                if part.startswith('user-') or part.startswith('BedrockAPIKey-'):
-                    principal_id = part
-                    break
-        
-        # Add metadata to the log event
-        enriched_event['_metadata'] = {{
-            'logGroup': log_data.get('logGroup', ''),
-            'logStream': log_stream,
-            'principal_id': principal_id,
-            'timestamp': log_event.get('timestamp'),
-            'processed_at': int(time.time() * 1000)
-        }}
-        
-        # Forward the enriched log event to Firehose
-        record = {{
-            'Data': json.dumps(enriched_event) + '\\n'
-        }}
-        records.append(record)
-    
-    # Send to Firehose in batches
-    if records:
-        try:
-            response = firehose.put_record_batch(
-                DeliveryStreamName=DELIVERY_STREAM_NAME,
-                Records=records
-            )
-            logger.info(f"Successfully sent {{len(records)}} records to Firehose")
-            return {{'statusCode': 200, 'recordsProcessed': len(records)}}
-        except Exception as e:
-            logger.error(f"Error sending to Firehose: {{e}}")
-            raise
-    
-    return {{'statusCode': 200, 'recordsProcessed': 0}}
-"""),
-            timeout=Duration.minutes(5),
-            memory_size=256,
-            description="Forwards CloudWatch Logs from Bedrock invocation logs to Kinesis Data Firehose"
+            log_group_name=self.log_groups["bedrock_invocation"].log_group_name,
+            destination_arn=firehose_arn,
+            role_arn=logs_to_firehose_role.role_arn,
+            filter_pattern="",
+            filter_name=f"{self._name_prefix}-invocation-logs"
         )
-        
-        return logs_forwarder
+        # CloudWatch Logs checks the role can write to the stream when creating the filter
+        subscription.node.add_dependency(logs_to_firehose_role)
     
     def add_eventbridge_target(self, rule_name: str, target) -> None:
         """Add a target to an existing EventBridge rule"""
@@ -0,0 +1,97 @@
+"""
+Audit Logger Lambda Function
+Stores queued EventBridge audit events in the audit logs table
+"""
+
+
+def get_audit_logger_function_code() -> str:
+    """Get the Lambda function code for audit logging"""
+    return '''
+import hashlib
+
+# Clients and tables are built once per container and reused by warm invocations
+AUDIT_LOGS_TABLE = dynamodb.Table(os.environ['AUDIT_LOGS_TABLE'])
+
+_CROCKFORD_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+
+def _event_time(audit_event):
+    """EventBridge envelope time, falling back to now when it is missing or malformed"""
+    try:
+        return datetime.fromisoformat(audit_event['time'].replace('Z', '+00:00'))
+    except (KeyError, AttributeError, ValueError):
+        return datetime.now(timezone.utc)
+
+
+def _event_ulid(event_time, event_id):
+    """ULID: 48-bit millisecond event time + 80 bits hashed from the event id
+    
+    A redelivered event maps to the same key and overwrites its earlier row.
+    """
+    entropy = hashlib.sha256(str(event_id).encode('utf-8')).digest()[:10]
+    value = (int(event_time.timestamp() * 1000) << 80) | int.from_bytes(entropy, 'big')
+    return ''.join(_CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+
+def lambda_handler(event, context):
+    """Store a batch of queued audit events in the audit logs table"""
+    records = event.get('Records', [])
+    logger.info(f"Processing {len(records)} audit events")
+    
+    audit_entries = []
+    message_ids = {}  # event_id -> SQS messageId, for reporting unprocessed items
+    event_sources = {}
+    
+    for record in records:
+        try:
+            audit_event = json.loads(record['body'])
+        except (KeyError, TypeError, json.JSONDecodeError):
+            logger.error(f"Invalid audit message {record.get('messageId')} - skipping")
+            continue
+        
+        if 'detail' not in audit_event:
+            logger.error("Invalid event format - missing detail")
+            continue
+        
+        detail = audit_event['detail']
+        event_source = audit_event.get('source', 'unknown')
+        detail_type = audit_event.get('detail-type', 'Unknown Event')
+        
+        # Keys come from the envelope so SQS redelivery is idempotent
+        event_time = _event_time(audit_event)
+        audit_key = _event_ulid(event_time, audit_event.get('id') or record['messageId'])
+        if audit_key in message_ids:
+            # BatchWriteItem rejects duplicate keys; the first copy writes the row
+            continue
+        audit_entries.append({
+            'event_id': audit_key,
+            'event_time': event_time.isoformat(),
+            'event_source': event_source,
+            'event_type': detail_type,
+            'principal_id': detail.get('principal_id', 'system'),
+            'details': json.dumps(detail, default=str),
+            'timestamp_epoch': int(event_time.timestamp())
+        })
+        message_ids[audit_key] = record['messageId']
+        event_sources[event_source] = event_sources.get(event_source, 0) + 1
+    
+    # A failed or throttled chunk comes back as unprocessed; chunks already written
+    # are not reported, so redelivery only repeats the entries that are missing
+    unprocessed = DynamoDBHelper.batch_put_items(
+        AUDIT_LOGS_TABLE, [DynamoDBHelper.float_to_decimal(entry) for entry in audit_entries]
+    )
+    
+    for event_source, count in event_sources.items():
+        MetricsPublisher.publish_budget_metric(
+            'AuditEventsProcessed',
+            float(count),
+            'Count',
+            {'EventSource': event_source, 'Environment': os.environ['ENVIRONMENT']}
+        )
+    
+    if unprocessed:
+        logger.warning(f"{len(unprocessed)} audit events not written; returning them to SQS")
+    return {'batchItemFailures': [
+        {'itemIdentifier': message_ids[item['event_id']]} for item in unprocessed
+    ]}
+'''
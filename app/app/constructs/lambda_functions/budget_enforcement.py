@@ -0,0 +1,149 @@
+"""
+Budget Enforcement Helpers
+Per-key grace period, suspension and threshold-state handling shared by the
+scheduled budget monitor and the stream-driven budget monitor. Events are queued
+on EventPublisher; callers must call EventPublisher.flush() before returning.
+"""
+
+
+def get_budget_enforcement_code() -> str:
+    """Get the budget enforcement helper code included in budget monitor Lambdas"""
+    return '''
+_GRACE_PERIOD_PARAMETER = '/bedrock-budgeteer/global/grace_period_seconds'
+_GRACE_PERIOD_TTL_SECONDS = 300
+_grace_period_cache = {}  # {'value': seconds, 'expires': epoch}
+
+
+def _get_grace_period_seconds():
+    """Grace period from SSM, re-read at most every 5 minutes per warm container"""
+    if _grace_period_cache and time.time() < _grace_period_cache['expires']:
+        return _grace_period_cache['value']
+    # ConfigurationManager caches for the container lifetime; drop it so the TTL applies
+    ConfigurationManager._cache.pop(_GRACE_PERIOD_PARAMETER, None)
+    value = int(ConfigurationManager.get_parameter(_GRACE_PERIOD_PARAMETER, 60))
+    _grace_period_cache.update(value=value, expires=time.time() + _GRACE_PERIOD_TTL_SECONDS)
+    return value
+
+
+def _handle_budget_exceeded(table, key_item, grace_period_seconds, reason):
+    """Handle a key that has exceeded its budget (per-key, pool, or global cap)"""
+    principal_id = key_item['principal_id']
+    current_status = key_item.get('status', 'active')
+
+    if current_status == 'suspended':
+        return 0
+
+    grace_deadline_epoch = key_item.get('grace_deadline_epoch')
+
+    if grace_deadline_epoch:
+        try:
+            epoch_ts = float(str(grace_deadline_epoch))
+        except (ValueError, TypeError):
+            logger.error(f"Invalid grace_deadline_epoch for {principal_id}: {grace_deadline_epoch}")
+            return 0
+
+        if time.time() >= epoch_ts:
+            _trigger_suspension_workflow(key_item, reason, grace_period_seconds)
+            return 1
+        else:
+            logger.info(f"{principal_id} in grace period until {grace_deadline_epoch}")
+            return 0
+    else:
+        deadline = int(time.time()) + grace_period_seconds
+        try:
+            # Scheduled and stream-driven monitors can race; only the first writer
+            # starts the grace period and publishes the event. Budget refresh and
+            # auto-created records store the deadline as NULL, which counts as unset
+            table.update_item(
+                Key={'principal_id': principal_id},
+                UpdateExpression='SET #s = :status, grace_deadline_epoch = :deadline',
+                ConditionExpression=(
+                    '(attribute_not_exists(grace_deadline_epoch) OR '
+                    'attribute_type(grace_deadline_epoch, :null_type)) AND #s <> :status'
+                ),
+                ExpressionAttributeNames={'#s': 'status'},
+                ExpressionAttributeValues={
+                    ':status': 'grace_period',
+                    ':deadline': deadline,
+                    ':null_type': 'NULL'
+                }
+            )
+        except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            key_item['status'] = 'grace_period'
+            logger.info(f"Grace period already started for {principal_id}, skipping")
+            return 0
+        # Update in-memory state so subsequent tier checks in the same run
+        # see the new status and don't double-grace this key
+        key_item['status'] = 'grace_period'
+        key_item['grace_deadline_epoch'] = deadline
+        logger.info(f"Started grace period for {principal_id}, deadline: {deadline}")
+
+        EventPublisher.queue_budget_event(
+            'Grace Period Started',
+            {
+                'principal_id': principal_id,
+                'reason': reason,
+                'grace_period_seconds': grace_period_seconds,
+                'spent_usd': float(key_item.get('spent_usd', 0)),
+                'budget_limit_usd': float(key_item.get('budget_limit_usd', 0))
+            }
+        )
+        return 0
+
+
+def _trigger_suspension_workflow(key_item, reason, grace_period_seconds):
+    """Trigger suspension workflow via EventBridge"""
+    principal_id = key_item['principal_id']
+
+    EventPublisher.queue_budget_event(
+        'Suspension Workflow Required',
+        {
+            'principal_id': principal_id,
+            'reason': reason,
+            'suspension_reason': reason,
+            'grace_period_seconds': grace_period_seconds,
+            'budget_data': {
+                'account_type': key_item.get('account_type', 'bedrock_api_key'),
+                'budget_limit_usd': float(key_item.get('budget_limit_usd', 0)),
+                'spent_usd': float(key_item.get('spent_usd', 0)),
+                'has_carveout': key_item.get('has_carveout', False)
+            },
+            'triggered_by': 'budget_monitor',
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+    )
+
+    MetricsPublisher.publish_budget_metric(
+        'SuspensionWorkflowsTriggered',
+        1.0,
+        'Count',
+        {'Environment': os.environ['ENVIRONMENT'], 'Reason': reason}
+    )
+
+    logger.error(f"Suspension workflow triggered for {principal_id}: reason={reason}")
+
+
+def _update_threshold_state(table, item, new_state):
+    """Update threshold state if changed"""
+    pk_field = 'principal_id'
+    pk_value = item.get('principal_id', item.get('runtime_id'))
+    current_state = item.get('threshold_state', 'normal')
+
+    if current_state != new_state:
+        table.update_item(
+            Key={pk_field: pk_value},
+            UpdateExpression='SET threshold_state = :state',
+            ExpressionAttributeValues={':state': new_state}
+        )
+        logger.info(f"Updated {pk_value} threshold: {current_state} -> {new_state}")
+
+        if new_state in ('warning', 'critical'):
+            EventPublisher.queue_budget_event(
+                f'Budget Threshold Changed',
+                {
+                    'principal_id': pk_value,
+                    'threshold_state': new_state,
+                    'previous_state': current_state
+                }
+            )
+'''
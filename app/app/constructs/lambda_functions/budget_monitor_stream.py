@@ -0,0 +1,90 @@
+"""
+Budget Monitor Stream Lambda Function
+Evaluates per-key budget thresholds from user-budgets DynamoDB Stream records,
+so keys are checked as soon as their spend changes instead of on the next schedule.
+"""
+
+
+def get_budget_monitor_stream_function_code() -> str:
+    """Get the Lambda function code for stream-driven budget monitoring"""
+    return '''
+from boto3.dynamodb.types import TypeDeserializer
+
+_deserializer = TypeDeserializer()
+USER_BUDGETS_TABLE = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+
+
+def lambda_handler(event, context):
+    """
+    Check per-key budgets for user-budget items whose spent_usd changed.
+
+    Only budgeted (carve-out) API keys are evaluated here. Pool and global cap
+    enforcement need totals across all keys and stay with the scheduled budget monitor.
+    """
+    user_budgets_table = USER_BUDGETS_TABLE
+
+    grace_period_seconds = _get_grace_period_seconds()
+    warning_threshold = float(ConfigurationManager.get_parameter(
+        '/bedrock-budgeteer/global/thresholds_percent_warn', 70
+    ))
+    critical_threshold = float(ConfigurationManager.get_parameter(
+        '/bedrock-budgeteer/global/thresholds_percent_critical', 90
+    ))
+
+    evaluated = 0
+    suspensions_triggered = 0
+
+    try:
+        for record in event.get('Records', []):
+            if record.get('eventName') not in ('INSERT', 'MODIFY'):
+                continue
+
+            images = record.get('dynamodb', {})
+            key_item = _deserialize(images.get('NewImage', {}))
+            old_item = _deserialize(images.get('OldImage', {}))
+
+            # Status and threshold updates written by this function do not change spend
+            if key_item.get('spent_usd') == old_item.get('spent_usd'):
+                continue
+
+            principal_id = key_item.get('principal_id', '')
+            if not principal_id.startswith('BedrockAPIKey-') or not key_item.get('has_carveout'):
+                continue
+            if key_item.get('status') in ('suspended', 'restricted', 'deleted'):
+                continue
+
+            budget = float(key_item.get('budget_limit_usd', 0))
+            spent = float(key_item.get('spent_usd', 0))
+            if budget <= 0:
+                continue
+            usage_percent = (spent / budget) * 100
+            evaluated += 1
+
+            if usage_percent >= 100:
+                suspensions_triggered += _handle_budget_exceeded(
+                    user_budgets_table, key_item, grace_period_seconds, 'per_key'
+                )
+            elif usage_percent >= critical_threshold:
+                _update_threshold_state(user_budgets_table, key_item, 'critical')
+            elif usage_percent >= warning_threshold:
+                _update_threshold_state(user_budgets_table, key_item, 'warning')
+            else:
+                _update_threshold_state(user_budgets_table, key_item, 'normal')
+    finally:
+        # Grace-period and suspension events are queued by the enforcement helpers
+        EventPublisher.flush()
+
+    logger.info(
+        f"Stream budget check completed: {evaluated} keys evaluated, "
+        f"{suspensions_triggered} suspensions"
+    )
+    return {
+        'evaluated_keys': evaluated,
+        'suspensions_triggered': suspensions_triggered
+    }
+
+
+def _deserialize(image):
+    """Convert a DynamoDB Stream image into a plain item"""
+    return {key: _deserializer.deserialize(value) for key, value in image.items()}
+'''
@@ -11,6 +11,15 @@ def get_usage_calculator_function_code() -> str:
     """Get the Lambda function code for usage calculator"""
     return '''
 import re
+import zlib
+from botocore.exceptions import ClientError
+
+try:
+    # Optional C parser, used when a layer provides it; its JSONDecodeError subclasses json's
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 def _resolve_model_id_from_arn(model_id_or_arn):
     """Resolve a model ID from an inference profile ARN or cross-region model ID.
@@ -186,41 +195,114 @@ def _calculate_agent_flow_cost(event_name, detail):
     return cost
 
 
+GZIP_MAGIC = b'\\x1f\\x8b'
+_PRINCIPAL_RE = re.compile(r'(?:^|/)((?:user-|BedrockAPIKey-)[^/]*)')
+
+# Table handles are built once per container and reused by warm invocations
+USAGE_TRACKING_TABLE = dynamodb.Table(os.environ['USAGE_TRACKING_TABLE'])
+USER_BUDGETS_TABLE = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+# Usage tracking records for the current Firehose batch, keyed by (principal_id, timestamp)
+_pending_usage_records = {}
+# Spend for the current batch as (record_id, principal_id, model_id, cost), summed per
+# principal at the end of the batch so each principal costs one UpdateItem
+_pending_budget_updates = []
+_current_record_id = None
+
+
+def _unpack_log_events(log_data):
+    """Return the log events carried by one Firehose record, or None for control messages.
+
+    CloudWatch Logs subscriptions deliver a whole batch per record; each event is
+    enriched with its log group/stream and the principal ID found in the stream name.
+    Records that are not a subscription payload are read as newline-delimited events.
+    """
+    log_data = log_data.strip()
+    # A subscription payload is one JSON document with no raw newlines; anything that
+    # spans lines is newline-delimited and is parsed line by line, never as a whole
+    if b'\\n' in log_data:
+        return [_json_loads(line) for line in log_data.splitlines() if line.strip()]
+    
+    payload = _json_loads(log_data)
+    if not isinstance(payload, dict) or 'logEvents' not in payload:
+        return [payload]
+    
+    if payload.get('messageType') == 'CONTROL_MESSAGE':
+        return None
+    
+    log_group = payload.get('logGroup', '')
+    log_stream = payload.get('logStream', '')
+    
+    # Log stream name might contain user info: e.g., "user-123/stream-456"
+    match = _PRINCIPAL_RE.search(log_stream) if '/' in log_stream else None
+    
+    # Everything but the timestamp is shared by all events in the batch
+    metadata = {
+        'logGroup': log_group,
+        'logStream': log_stream,
+        'principal_id': match.group(1) if match else None,
+        'processed_at': int(time.time() * 1000)
+    }
+    log_events = []
+    for log_event in payload['logEvents']:
+        enriched_event = dict(log_event)
+        enriched_event['_metadata'] = {**metadata, 'timestamp': log_event.get('timestamp')}
+        log_events.append(enriched_event)
+    return log_events
+
+
+def _delivery_data(log_events, log_data):
+    """Base64 S3 payload for one record: one log message per line.
+
+    Firehose GZIPs delivered objects itself, so the subscription's gzip envelope is
+    replaced by its decompressed messages instead of being compressed twice.
+    """
+    if log_events and '_metadata' in log_events[0]:
+        log_data = '\\n'.join(event.get('message', '') for event in log_events).encode('utf-8')
+    return base64.b64encode(log_data.strip() + b'\\n').decode('ascii')
+
+
 def lambda_handler(event, context):
     """
     Process Bedrock invocation logs from Kinesis Data Firehose.
     Calculate token-based costs and update user budgets.
     Supports InvokeModel, Converse, Agents, Flows, image models, and batch inference.
     """
-    logger.info(f"=== USAGE CALCULATOR LAMBDA STARTED ===")
-    logger.info(f"Processing usage calculation event with {len(event.get('records', []))} records")
+    # Per-record diagnostics stay at DEBUG: formatting them for every record in a
+    # batch costs billed time even when nobody reads them
+    logger.info("Processing usage calculation event with %d records", len(event.get('records', [])))
     
+    global _current_record_id
     processed_records = []
     
     try:
-        for i, record in enumerate(event.get('records', [])):
+        for record in event.get('records', []):
+            _current_record_id = record['recordId']
             try:
-                logger.info(f"=== PROCESSING RECORD {i+1}/{len(event.get('records', []))} ===")
-                
                 # Firehose base64 encodes data
-                encoded_data = record['data']
-                decoded_data = base64.b64decode(encoded_data)
+                decoded_data = base64.b64decode(record['data'])
                 
-                # Check if data is gzipped
-                try:
-                    decoded_data = gzip.decompress(decoded_data)
-                except (gzip.BadGzipFile, OSError):
-                    pass  # Not gzipped
+                # CloudWatch Logs subscription payloads are gzipped
+                if decoded_data[:2] == GZIP_MAGIC:
+                    # wbits=31 makes zlib read the gzip header itself, skipping gzip's Python wrapper
+                    decoded_data = zlib.decompress(decoded_data, 31)
                 
-                log_data_str = decoded_data.decode('utf-8')
-                log_data = json.loads(log_data_str)
+                # Both parsers read UTF-8 bytes directly, so the payload is never copied to str
+                log_events = _unpack_log_events(decoded_data)
+                if log_events is None:
+                    # CloudWatch Logs control message checking the destination is reachable
+                    processed_records.append({'recordId': record['recordId'], 'result': 'Dropped'})
+                    continue
                 
-                # Process Bedrock invocation log
-                result = process_bedrock_log(log_data)
+                result = True
+                for log_data in log_events:
+                    # Process Bedrock invocation log
+                    if not process_bedrock_log(log_data):
+                        result = False
                 
                 processed_records.append({
                     'recordId': record['recordId'],
-                    'result': 'Ok' if result else 'ProcessingFailed'
+                    'result': 'Ok' if result else 'ProcessingFailed',
+                    'data': _delivery_data(log_events, decoded_data)
                 })
                 
             except Exception as e:
@@ -230,7 +312,14 @@ def lambda_handler(event, context):
                     'result': 'ProcessingFailed'
                 })
         
-        logger.info(f"=== USAGE CALCULATOR COMPLETED: {len(processed_records)} records ===")
+        # ProcessingFailed records go to the error prefix and are not redelivered, so the
+        # spend of their events that did succeed is applied along with everything else
+        failed_record_ids = _flush_budget_updates()
+        for processed in processed_records:
+            if processed['recordId'] in failed_record_ids:
+                processed['result'] = 'ProcessingFailed'
+        
+        logger.info("Usage calculation completed: %d records", len(processed_records))
         return {'records': processed_records}
         
     except Exception as e:
@@ -241,14 +330,24 @@ def lambda_handler(event, context):
                 for r in event.get('records', [])
             ]
         }
+    finally:
+        _pending_budget_updates.clear()
+        _current_record_id = None
+        _flush_usage_records()
+        # Events and metrics for the whole batch go out in a few batched calls
+        EventPublisher.flush()
+        MetricsPublisher.flush()
+
+
+# Raised by logs missing or mistyping expected fields, as opposed to AWS or code failures
+MALFORMED_LOG_ERRORS = (KeyError, TypeError, ValueError, AttributeError)
+
 
 def process_bedrock_invocation_log(log_data):
     """Process CloudWatch Bedrock invocation log (direct from Bedrock service).
     Handles both legacy InvokeModel and Converse API log formats.
     """
     try:
-        logger.info("=== PROCESSING BEDROCK INVOCATION LOG ===")
-        
         input_data = log_data.get('input', {})
         output_data = log_data.get('output', {})
         
@@ -258,6 +357,16 @@ def process_bedrock_invocation_log(log_data):
         cache_read_tokens = 0
         image_count = 0
         
+        # A streamed response's message_start chunk carries both the token usage and the
+        # model name; find it in one pass for both lookups
+        message_start = None
+        output_body = output_data.get('outputBodyJson')
+        if isinstance(output_body, list):
+            message_start = next(
+                (item.get('message', {}) for item in output_body if item.get('type') == 'message_start'),
+                None
+            )
+        
         # Check if this is a Converse API log (has 'usage' at top level or in output)
         converse_usage = _extract_converse_token_usage(log_data)
         if converse_usage['input_tokens'] or converse_usage['output_tokens']:
@@ -265,20 +374,15 @@ def process_bedrock_invocation_log(log_data):
             output_tokens = converse_usage['output_tokens']
             cache_read_tokens = converse_usage['cache_read_tokens']
             cache_creation_tokens = converse_usage['cache_creation_tokens']
-            logger.info(f"Converse API token usage: input={input_tokens}, output={output_tokens}")
+            logger.debug("Converse API token usage: input=%s, output=%s", input_tokens, output_tokens)
         else:
             # Legacy InvokeModel format — check outputBodyJson
-            output_body = output_data.get('outputBodyJson', [])
-            if output_body:
-                for item in output_body:
-                    if item.get('type') == 'message_start':
-                        message = item.get('message', {})
-                        usage = message.get('usage', {})
-                        input_tokens = usage.get('input_tokens', 0)
-                        cache_creation_tokens = usage.get('cache_creation_input_tokens', 0)
-                        cache_read_tokens = usage.get('cache_read_input_tokens', 0)
-                        output_tokens = usage.get('output_tokens', 0)
-                        break
+            if message_start is not None:
+                usage = message_start.get('usage', {})
+                input_tokens = usage.get('input_tokens', 0)
+                cache_creation_tokens = usage.get('cache_creation_input_tokens', 0)
+                cache_read_tokens = usage.get('cache_read_input_tokens', 0)
+                output_tokens = usage.get('output_tokens', 0)
             
             # Fall back to top-level fields
             if input_tokens == 0 and output_tokens == 0:
@@ -296,11 +400,8 @@ def process_bedrock_invocation_log(log_data):
         
         # Extract and resolve model ID (handles inference profile ARNs)
         raw_model_id = log_data.get('modelId', '')
-        if not raw_model_id and output_data.get('outputBodyJson'):
-            for item in output_data['outputBodyJson']:
-                if item.get('type') == 'message_start':
-                    raw_model_id = item.get('message', {}).get('model', '')
-                    break
+        if not raw_model_id and message_start is not None:
+            raw_model_id = message_start.get('model', '')
         
         if not raw_model_id:
             logger.warning("No model ID found in invocation log")
@@ -322,8 +423,10 @@ def process_bedrock_invocation_log(log_data):
         if not principal_id:
             identity = log_data.get('identity', {})
             identity_arn = identity.get('arn', '')
-            if identity_arn and ':user/' in identity_arn:
-                principal_id = identity_arn.split(':user/')[-1]
+            # One scan and a slice, same result as split(':user/')[-1]
+            user_index = identity_arn.rfind(':user/')
+            if user_index >= 0:
+                principal_id = identity_arn[user_index + len(':user/'):]
         
         if not principal_id:
             logger.warning("Could not extract principal ID from invocation log")
@@ -368,29 +471,51 @@ def process_bedrock_invocation_log(log_data):
         if original_model_id != model_id:
             event_detail['original_model_id'] = original_model_id
         
-        EventPublisher.publish_budget_event('Usage Cost Calculated', event_detail)
+        EventPublisher.queue_budget_event('Usage Cost Calculated', event_detail)
         
-        MetricsPublisher.publish_budget_metric(
+        MetricsPublisher.queue_budget_metric(
             'TokensProcessed', total_input_tokens + output_tokens, 'Count',
             {'ModelId': model_id, 'PrincipalId': principal_id}
         )
-        MetricsPublisher.publish_budget_metric(
+        MetricsPublisher.queue_budget_metric(
             'CostCalculated', cost, 'None',
             {'ModelId': model_id, 'PrincipalId': principal_id}
         )
         if image_count > 0:
-            MetricsPublisher.publish_budget_metric(
+            MetricsPublisher.queue_budget_metric(
                 'ImagesGenerated', image_count, 'Count',
                 {'ModelId': model_id, 'PrincipalId': principal_id}
             )
         
-        logger.info(f"Processed invocation for {principal_id}: {total_input_tokens}+{output_tokens} tokens, {image_count} images, cost=${cost:.6f}")
+        logger.debug(
+            "Processed invocation for %s: %s+%s tokens, %s images, cost=$%.6f",
+            principal_id, total_input_tokens, output_tokens, image_count, cost
+        )
         return True
         
+    except MALFORMED_LOG_ERRORS as e:
+        # The record lands in the error prefix for inspection; a traceback adds nothing
+        logger.warning("Malformed Bedrock invocation log: %s: %s", type(e).__name__, e)
+        return False
     except Exception as e:
         logger.error(f"Error processing Bedrock invocation log: {e}", exc_info=True)
         return False
 
+# Supported API operations, built once instead of per log event
+MODEL_INVOCATION_EVENTS = frozenset([
+    'InvokeModel', 'InvokeModelWithResponseStream',
+    'InvokeModelWithBidirectionalStream',
+    'Converse', 'ConverseStream'
+])
+AGENT_FLOW_EVENTS = frozenset([
+    'InvokeAgent', 'InvokeInlineAgent', 'InvokeFlow',
+    'Retrieve', 'RetrieveAndGenerate', 'RetrieveAndGenerateStream'
+])
+BATCH_EVENTS = frozenset(['CreateModelInvocationJob', 'GetModelInvocationJob'])
+ASYNC_EVENTS = frozenset(['StartAsyncInvoke'])
+SUPPORTED_EVENT_NAMES = MODEL_INVOCATION_EVENTS | AGENT_FLOW_EVENTS | BATCH_EVENTS | ASYNC_EVENTS
+
+
 def process_bedrock_log(log_data):
     """Process individual Bedrock log (handles CloudTrail API logs, CloudWatch invocation logs,
     Converse API logs, and Agent/Flow/KB events)."""
@@ -400,7 +525,7 @@ def process_bedrock_log(log_data):
         # Handle wrapped log format
         if 'message' in log_data and isinstance(log_data['message'], str):
             try:
-                actual_log_data = json.loads(log_data['message'])
+                actual_log_data = _json_loads(log_data['message'])
                 if '_metadata' in log_data:
                     actual_log_data['_metadata'] = log_data['_metadata']
             except json.JSONDecodeError:
@@ -413,20 +538,7 @@ def process_bedrock_log(log_data):
         # CloudTrail API log format
         event_name = actual_log_data.get('eventName', '')
         
-        # Supported API operations
-        model_invocation_events = [
-            'InvokeModel', 'InvokeModelWithResponseStream',
-            'InvokeModelWithBidirectionalStream',
-            'Converse', 'ConverseStream'
-        ]
-        agent_flow_events = [
-            'InvokeAgent', 'InvokeInlineAgent', 'InvokeFlow',
-            'Retrieve', 'RetrieveAndGenerate', 'RetrieveAndGenerateStream'
-        ]
-        batch_events = ['CreateModelInvocationJob', 'GetModelInvocationJob']
-        async_events = ['StartAsyncInvoke']
-        
-        if event_name not in model_invocation_events + agent_flow_events + batch_events + async_events:
+        if event_name not in SUPPORTED_EVENT_NAMES:
             return True  # Skip non-relevant events
         
         user_identity = actual_log_data.get('userIdentity', {})
@@ -448,13 +560,13 @@ def process_bedrock_log(log_data):
             principal_id = request_metadata.get('userId') or request_metadata.get('tenantId')
         
         if not principal_id:
-            logger.warning(f"Could not extract principal ID from {event_name} log")
+            logger.warning("Could not extract principal ID from %s log", event_name)
             return True
         
         region = actual_log_data.get('awsRegion', 'us-east-1')
         
         # Handle Agent/Flow/KB events
-        if event_name in agent_flow_events:
+        if event_name in AGENT_FLOW_EVENTS:
             cost = _calculate_agent_flow_cost(event_name, actual_log_data)
             # InvokeInlineAgent uses 'foundationModel' instead of 'modelId'
             if event_name == 'InvokeInlineAgent':
@@ -467,7 +579,7 @@ def process_bedrock_log(log_data):
             if cost > 0:
                 update_user_budget(principal_id, model_id, cost, 0, 0)
             
-            EventPublisher.publish_budget_event('Usage Cost Calculated', {
+            EventPublisher.queue_budget_event('Usage Cost Calculated', {
                 'principal_id': principal_id, 'model_id': model_id,
                 'cost_usd': float(cost), 'usage_type': f'bedrock_{event_name.lower()}',
                 'event_name': event_name, 'region': region,
@@ -475,32 +587,32 @@ def process_bedrock_log(log_data):
             return True
         
         # Handle batch inference events
-        if event_name in batch_events:
+        if event_name in BATCH_EVENTS:
             if event_name == 'CreateModelInvocationJob':
                 model_id = request_params.get('modelId', '')
                 record_usage_tracking(principal_id, model_id, 0, 0, 0,
                                     'bedrock_batch_submitted', request_metadata=request_metadata)
-                EventPublisher.publish_budget_event('Batch Job Submitted', {
+                EventPublisher.queue_budget_event('Batch Job Submitted', {
                     'principal_id': principal_id, 'model_id': model_id,
                     'job_name': request_params.get('jobName', ''),
                     'region': region,
                 })
-                MetricsPublisher.publish_budget_metric(
+                MetricsPublisher.queue_budget_metric(
                     'BatchJobsSubmitted', 1, 'Count',
                     {'ModelId': model_id, 'Environment': os.environ['ENVIRONMENT']}
                 )
             return True
 
         # Handle async invocation events (StartAsyncInvoke)
-        if event_name in async_events:
+        if event_name in ASYNC_EVENTS:
             model_id = request_params.get('modelId', '')
             record_usage_tracking(principal_id, model_id, 0, 0, 0,
                                 'bedrock_async_invocation', request_metadata=request_metadata)
-            EventPublisher.publish_budget_event('Async Invocation Started', {
+            EventPublisher.queue_budget_event('Async Invocation Started', {
                 'principal_id': principal_id, 'model_id': model_id,
                 'event_name': event_name, 'region': region,
             })
-            MetricsPublisher.publish_budget_metric(
+            MetricsPublisher.queue_budget_metric(
                 'AsyncInvocationsStarted', 1, 'Count',
                 {'ModelId': model_id, 'Environment': os.environ['ENVIRONMENT']}
             )
@@ -523,7 +635,7 @@ def process_bedrock_log(log_data):
         image_count = response_elements.get('outputImageCount', usage.get('outputImageCount', 0))
         
         if input_tokens == 0 and output_tokens == 0 and image_count == 0:
-            logger.warning(f"No usage found in {event_name} response")
+            logger.warning("No usage found in %s response", event_name)
             return True
         
         # Determine if batch inference (different pricing)
@@ -563,7 +675,7 @@ def process_bedrock_log(log_data):
                         update_runtime_budget(runtime['runtime_id'], cost)
                         update_global_pool(cost)
                         record_usage_tracking(runtime['runtime_id'], model_id, cost, total_input, output_tokens, 'agentcore')
-                        logger.info(f"Attributed ${cost} to AgentCore runtime {runtime['runtime_id']}")
+                        logger.debug("Attributed $%s to AgentCore runtime %s", cost, runtime['runtime_id'])
                         return True  # Cost attributed to AgentCore runtime; skip standard budget update
 
         # Look up team/purpose from budget record for usage tracking enrichment
@@ -594,30 +706,41 @@ def process_bedrock_log(log_data):
         if is_batch:
             event_detail['is_batch'] = True
         
-        EventPublisher.publish_budget_event('Usage Cost Calculated', event_detail)
+        EventPublisher.queue_budget_event('Usage Cost Calculated', event_detail)
         
-        MetricsPublisher.publish_budget_metric(
+        MetricsPublisher.queue_budget_metric(
             'TokensProcessed', total_input + output_tokens, 'Count',
             {'ModelId': model_id, 'PrincipalId': principal_id}
         )
-        MetricsPublisher.publish_budget_metric(
+        MetricsPublisher.queue_budget_metric(
             'CostCalculated', cost, 'None',
             {'ModelId': model_id, 'PrincipalId': principal_id}
         )
         
         return True
         
+    except MALFORMED_LOG_ERRORS as e:
+        logger.warning("Malformed Bedrock log: %s: %s", type(e).__name__, e)
+        return False
     except Exception as e:
         logger.error(f"Error processing Bedrock log: {e}", exc_info=True)
         return False
 
 
+def _to_decimal(value):
+    """Exact Decimal for a float cost; Decimal values pass through unconverted
+    
+    The str round trip keeps the float's shortest repr. Decimal(float).quantize() is no
+    faster and would round away sub-micro-dollar per-token costs.
+    """
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
 def record_usage_tracking(principal_id, model_id, cost, input_tokens, output_tokens,
                          usage_type, image_count=0, request_metadata=None, original_model_id=None,
                          team=None, purpose=None, region=None):
-    """Record usage data in the usage tracking table"""
+    """Queue usage data for the usage tracking table; written per batch by _flush_usage_records"""
     try:
-        usage_tracking_table = dynamodb.Table(os.environ['USAGE_TRACKING_TABLE'])
         current_time = datetime.now(timezone.utc)
         
         usage_record = {
@@ -629,7 +752,7 @@ def record_usage_tracking(principal_id, model_id, cost, input_tokens, output_tok
             'input_tokens': input_tokens,
             'output_tokens': output_tokens,
             'total_tokens': input_tokens + output_tokens,
-            'cost_usd': Decimal(str(cost)),
+            'cost_usd': _to_decimal(cost),
             'region': region or os.environ.get('AWS_REGION', 'us-east-1'),
             'created_epoch': int(current_time.timestamp())
         }
@@ -645,38 +768,101 @@ def record_usage_tracking(principal_id, model_id, cost, input_tokens, output_tok
         if purpose:
             usage_record['purpose'] = purpose
 
-        usage_tracking_table.put_item(Item=usage_record)
-        logger.info(f"Recorded usage for {principal_id}: {usage_type}, ${cost:.6f}")
+        # Keyed like the table so a repeated key overwrites, as put_item would;
+        # BatchWriteItem rejects requests that carry the same key twice
+        _pending_usage_records[(principal_id, usage_record['timestamp'])] = usage_record
+        logger.debug("Recorded usage for %s: %s, $%.6f", principal_id, usage_type, cost)
         
     except Exception as e:
         logger.error(f"Error recording usage tracking for {principal_id}: {e}")
 
+
+def _flush_usage_records():
+    """Write queued usage tracking records with BatchWriteItem (25 per request)"""
+    if not _pending_usage_records:
+        return
+    items = list(_pending_usage_records.values())
+    _pending_usage_records.clear()
+    try:
+        unprocessed = DynamoDBHelper.batch_put_items(USAGE_TRACKING_TABLE, items)
+        if unprocessed:
+            logger.error(f"{len(unprocessed)} usage tracking records were not written after retries")
+    except Exception as e:
+        logger.error(f"Error writing usage tracking records: {e}", exc_info=True)
+
 def update_user_budget(principal_id, model_id, cost, input_tokens, output_tokens):
-    """Update user budget with new spending"""
+    """Queue spend for the principal; applied once per principal by _flush_budget_updates"""
+    _pending_budget_updates.append((_current_record_id, principal_id, model_id, _to_decimal(cost)))
+
+
+def _flush_budget_updates():
+    """Apply the batch's queued spend with one update per principal
+    
+    Returns the IDs of records whose principal could not be updated.
+    """
+    totals = {}
+    for record_id, principal_id, model_id, cost in _pending_budget_updates:
+        model_costs, record_ids = totals.setdefault(principal_id, ({}, set()))
+        model_costs[model_id] = model_costs.get(model_id, Decimal('0')) + cost
+        record_ids.add(record_id)
+    _pending_budget_updates.clear()
+    
+    failed_record_ids = set()
+    for principal_id, (model_costs, record_ids) in totals.items():
+        try:
+            _apply_budget_update(principal_id, model_costs)
+        except Exception:
+            failed_record_ids |= record_ids
+    return failed_record_ids
+
+
+def _apply_budget_update(principal_id, model_costs):
+    """Add the summed spend per model to a user budget and re-evaluate its thresholds"""
     try:
-        user_budgets_table = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+        user_budgets_table = USER_BUDGETS_TABLE
         current_time = datetime.now(timezone.utc)
         
-        try:
-            response = user_budgets_table.update_item(
-                Key={'principal_id': principal_id},
-                UpdateExpression="SET spent_usd = if_not_exists(spent_usd, :zero) + :cost, last_updated_epoch = :timestamp, model_spend_breakdown.#model_id = if_not_exists(model_spend_breakdown.#model_id, :zero) + :cost",
-                ExpressionAttributeNames={'#model_id': model_id},
-                ExpressionAttributeValues={
-                    ':cost': Decimal(str(cost)),
-                    ':timestamp': int(current_time.timestamp()),
-                    ':zero': Decimal('0.0')
-                },
-                ReturnValues='ALL_NEW'
+        # Distinct models are distinct map paths, so one expression can add to all of them
+        breakdown_updates = []
+        attribute_names = {}
+        attribute_values = {
+            ':cost': sum(model_costs.values(), Decimal('0')),
+            ':timestamp': int(current_time.timestamp()),
+            ':zero': Decimal('0.0')
+        }
+        for index, (model_id, model_cost) in enumerate(model_costs.items()):
+            attribute_names[f'#m{index}'] = model_id
+            attribute_values[f':c{index}'] = model_cost
+            breakdown_updates.append(
+                f"model_spend_breakdown.#m{index} = if_not_exists(model_spend_breakdown.#m{index}, :zero) + :c{index}"
             )
-        except Exception as update_error:
-            logger.error(f"Failed to update budget for {principal_id}: {update_error}")
+        
+        update_request = {
+            'Key': {'principal_id': principal_id},
+            'UpdateExpression': "SET spent_usd = if_not_exists(spent_usd, :zero) + :cost, last_updated_epoch = :timestamp, " + ", ".join(breakdown_updates),
+            'ExpressionAttributeNames': attribute_names,
+            'ExpressionAttributeValues': attribute_values,
+            'ReturnValues': 'ALL_NEW'
+        }
+        try:
+            response = user_budgets_table.update_item(**update_request)
+        except ClientError as update_error:
+            # The nested map path is only invalid when the item or its breakdown map is
+            # missing; throttling and other errors are real failures, not a cue to create
+            if update_error.response['Error']['Code'] != 'ValidationException':
+                logger.error(f"Failed to update budget for {principal_id}: {update_error}")
+                raise
             try:
-                create_basic_budget_record(principal_id, cost, model_id, current_time)
+                create_basic_budget_record(principal_id, model_costs, current_time)
                 return
-            except Exception as create_error:
-                logger.error(f"Failed to create budget record for {principal_id}: {create_error}")
-                raise update_error
+            except ClientError as create_error:
+                if create_error.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+            # The item exists without a breakdown map (user_setup registers keys without one)
+            response = _initialize_spend_breakdown(principal_id, model_costs, current_time)
+            if response is None:
+                # Another invocation created the map first; the nested update now applies
+                response = user_budgets_table.update_item(**update_request)
         
         # Check budget thresholds (only for keys with a per-key carve-out)
         # Pool-based keys have no budget_limit_usd — their enforcement is in budget_monitor
@@ -687,19 +873,13 @@ def update_user_budget(principal_id, model_id, cost, input_tokens, output_tokens
         if budget_limit_raw is not None and updated_item.get('has_carveout'):
             budget_limit_usd = float(budget_limit_raw)
 
-            thresholds = ConfigurationManager.get_budget_thresholds()
-            warn_threshold = budget_limit_usd * (thresholds['warn_percent'] / 100)
-            critical_threshold = budget_limit_usd * (thresholds['critical_percent'] / 100)
-
+            warn_fraction, critical_fraction = _get_threshold_fractions()
             current_threshold_state = updated_item.get('threshold_state', 'normal')
-            new_threshold_state = current_threshold_state
-
-            if spent_usd >= critical_threshold:
-                new_threshold_state = 'critical'
-            elif spent_usd >= warn_threshold:
-                new_threshold_state = 'warning'
-            else:
-                new_threshold_state = 'normal'
+            new_threshold_state = (
+                'critical' if spent_usd >= budget_limit_usd * critical_fraction
+                else 'warning' if spent_usd >= budget_limit_usd * warn_fraction
+                else 'normal'
+            )
 
             if new_threshold_state != current_threshold_state:
                 user_budgets_table.update_item(
@@ -707,7 +887,7 @@ def update_user_budget(principal_id, model_id, cost, input_tokens, output_tokens
                     UpdateExpression='SET threshold_state = :state',
                     ExpressionAttributeValues={':state': new_threshold_state}
                 )
-                EventPublisher.publish_budget_event('Budget Threshold Changed', {
+                EventPublisher.queue_budget_event('Budget Threshold Changed', {
                     'principal_id': principal_id,
                     'previous_state': current_threshold_state,
                     'new_state': new_threshold_state,
@@ -720,10 +900,50 @@ def update_user_budget(principal_id, model_id, cost, input_tokens, output_tokens
         logger.error(f"Error updating user budget for {principal_id}: {e}")
         raise
 
-def create_basic_budget_record(principal_id, initial_cost, model_id, current_time):
+def _initialize_spend_breakdown(principal_id, model_costs, current_time):
+    """Add spend to an existing budget that has no model_spend_breakdown map yet
+    
+    Returns the update response, or None if the map was created concurrently.
+    """
+    try:
+        return USER_BUDGETS_TABLE.update_item(
+            Key={'principal_id': principal_id},
+            UpdateExpression="SET spent_usd = if_not_exists(spent_usd, :zero) + :cost, last_updated_epoch = :timestamp, model_spend_breakdown = :breakdown",
+            ConditionExpression='attribute_exists(principal_id) AND attribute_not_exists(model_spend_breakdown)',
+            ExpressionAttributeValues={
+                ':cost': sum(model_costs.values(), Decimal('0')),
+                ':timestamp': int(current_time.timestamp()),
+                ':zero': Decimal('0.0'),
+                ':breakdown': dict(model_costs)
+            },
+            ReturnValues='ALL_NEW'
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            return None
+        raise
+
+
+_threshold_fractions = None
+
+
+def _get_threshold_fractions():
+    """Warn and critical thresholds as fractions of the budget, read once per container"""
+    global _threshold_fractions
+    if _threshold_fractions is None:
+        thresholds = ConfigurationManager.get_budget_thresholds()
+        _threshold_fractions = (
+            float(thresholds['warn_percent']) / 100,
+            float(thresholds['critical_percent']) / 100
+        )
+    return _threshold_fractions
+
+
+def create_basic_budget_record(principal_id, model_costs, current_time):
     """Create a basic budget record when one does not exist"""
     try:
-        user_budgets_table = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+        initial_cost = sum(model_costs.values(), Decimal('0'))
+        user_budgets_table = USER_BUDGETS_TABLE
         
         default_budget = ConfigurationManager.get_parameter(
             '/bedrock-budgeteer/global/default_user_budget_usd', 5.0
@@ -738,12 +958,12 @@ def create_basic_budget_record(principal_id, initial_cost, model_id, current_tim
             'principal_id': principal_id,
             'account_type': 'bedrock_api_key',
             'budget_limit_usd': Decimal(str(default_budget)),
-            'spent_usd': Decimal(str(initial_cost)),
+            'spent_usd': initial_cost,
             'status': 'active',
             'threshold_state': 'normal',
             'time_window_start': current_time.isoformat(),
             'last_updated_epoch': int(current_time.timestamp()),
-            'model_spend_breakdown': {model_id: Decimal(str(initial_cost))},
+            'model_spend_breakdown': dict(model_costs),
             'anomaly_score': Decimal('0.0'),
             'created_epoch': int(current_time.timestamp()),
             'grace_deadline_epoch': None,
@@ -761,15 +981,20 @@ def create_basic_budget_record(principal_id, initial_cost, model_id, current_tim
         
         logger.info(f"Created budget record for {principal_id} with initial cost ${initial_cost:.6f}")
         
-        EventPublisher.publish_budget_event('Budget Auto-Created', {
+        EventPublisher.queue_budget_event('Budget Auto-Created', {
             'principal_id': principal_id,
             'account_type': 'bedrock_api_key',
             'budget_limit_usd': float(default_budget),
             'initial_cost': float(initial_cost),
-            'model_id': model_id,
+            'model_id': next(iter(model_costs)),
             'reason': 'usage_detected_without_existing_budget'
         })
         
+    except ClientError as e:
+        # An existing item is expected here; the caller falls back to updating it
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            logger.error(f"Error creating budget record for {principal_id}: {e}")
+        raise
     except Exception as e:
         logger.error(f"Error creating budget record for {principal_id}: {e}")
         raise
@@ -790,7 +1015,7 @@ def _get_key_metadata(principal_id):
         return cached
 
     try:
-        user_budgets_table = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+        user_budgets_table = USER_BUDGETS_TABLE
         response = user_budgets_table.get_item(
             Key={'principal_id': principal_id},
             ProjectionExpression='team, purpose, has_carveout'
@@ -820,12 +1045,12 @@ def _update_api_key_pool_if_needed(principal_id, cost, metadata):
         return  # Budgeted keys don't affect the pool
 
     try:
-        user_budgets_table = dynamodb.Table(os.environ['USER_BUDGETS_TABLE'])
+        user_budgets_table = USER_BUDGETS_TABLE
         user_budgets_table.update_item(
             Key={'principal_id': 'GLOBAL_API_KEY_POOL'},
             UpdateExpression='SET spent_usd = if_not_exists(spent_usd, :zero) + :cost',
             ExpressionAttributeValues={
-                ':cost': Decimal(str(cost)),
+                ':cost': _to_decimal(cost),
                 ':zero': Decimal('0')
             }
         )
@@ -39,7 +39,7 @@ class LogStorageConstruct(Construct):
         # Configure bucket policies
         self._configure_bucket_policies()
         
-        # Tags are applied by TaggingFramework aspects
+        # Tags are applied by the stack via apply_tags
     
     def _should_skip_public_access_block(self) -> bool:
         """Check if S3 public access block should be skipped (for enterprise SCPs)"""
@@ -3,7 +3,7 @@ Monitoring Construct for Bedrock Budgeteer
 Manages CloudWatch resources, dashboards, and alarms
 Implements Phase 5: Notifications & Monitoring
 """
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 from aws_cdk import (
     aws_cloudwatch as cloudwatch,
     aws_cloudwatch_actions as cloudwatch_actions,
@@ -30,6 +30,8 @@ class MonitoringConstruct(Construct):
         self.log_groups: Dict[str, logs.LogGroup] = {}
         self.alarms: Dict[str, cloudwatch.Alarm] = {}
         self.topics: Dict[str, sns.Topic] = {}
+        # Widgets collected during bulk registration, flushed as one add_widgets call
+        self._pending_widgets: Optional[List[cloudwatch.IWidget]] = None
         
         # Environment-specific configurations
         self.log_retention = self._get_log_retention(log_retention_parameter_name)
@@ -39,7 +41,7 @@ class MonitoringConstruct(Construct):
         self._create_sns_topics()
         self._create_dashboard()
         
-        # Tags are applied by TaggingFramework aspects
+        # Tags are applied by the stack via apply_tags
     
     def _get_log_retention(self, log_retention_parameter_name: Optional[str] = None) -> logs.RetentionDays:
         """Get log retention for production environment - default to 7 days"""
@@ -108,6 +110,67 @@ class MonitoringConstruct(Construct):
             )
         )
     
+    def _add_dashboard_widgets(self, *widgets: cloudwatch.IWidget) -> None:
+        """Add widgets to the system dashboard, deferring them while a bulk call is active"""
+        if self._pending_widgets is not None:
+            self._pending_widgets.extend(widgets)
+        else:
+            self.dashboard.add_widgets(*widgets)
+    
+    def _add_monitoring_bulk(self, add_monitoring: Callable[[str, object], None],
+                             resources: Dict[str, object], name_format: str) -> None:
+        """Register monitoring for many resources and add their widgets in one dashboard call"""
+        if not resources:
+            return
+        
+        outer_bulk = self._pending_widgets is None
+        if outer_bulk:
+            self._pending_widgets = []
+        try:
+            for name, resource in resources.items():
+                add_monitoring(name_format.format(name), resource)
+        finally:
+            if outer_bulk:
+                widgets, self._pending_widgets = self._pending_widgets, None
+                if widgets:
+                    self.dashboard.add_widgets(*widgets)
+    
+    def add_lambda_monitoring_bulk(self, functions: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several Lambda functions"""
+        self._add_monitoring_bulk(self.add_lambda_monitoring, functions, name_format)
+    
+    def add_dynamodb_monitoring_bulk(self, tables: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several DynamoDB tables"""
+        self._add_monitoring_bulk(self.add_dynamodb_monitoring, tables, name_format)
+    
+    def add_cloudtrail_monitoring_bulk(self, trails: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several CloudTrail trails"""
+        self._add_monitoring_bulk(self.add_cloudtrail_monitoring, trails, name_format)
+    
+    def add_eventbridge_monitoring_bulk(self, rules: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several EventBridge rules"""
+        self._add_monitoring_bulk(self.add_eventbridge_monitoring, rules, name_format)
+    
+    def add_firehose_monitoring_bulk(self, streams: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several Firehose delivery streams"""
+        self._add_monitoring_bulk(self.add_firehose_monitoring, streams, name_format)
+    
+    def add_sqs_monitoring_bulk(self, queues: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several SQS queues"""
+        self._add_monitoring_bulk(self.add_sqs_monitoring, queues, name_format)
+    
+    def add_s3_monitoring_bulk(self, buckets: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several S3 buckets"""
+        self._add_monitoring_bulk(self.add_s3_monitoring, buckets, name_format)
+    
+    def add_log_group_monitoring_bulk(self, log_groups: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several CloudWatch log groups"""
+        self._add_monitoring_bulk(self.add_log_group_monitoring, log_groups, name_format)
+    
+    def add_stepfunctions_monitoring_bulk(self, state_machines: Dict[str, object], name_format: str = "{}") -> None:
+        """Add monitoring for several Step Functions state machines"""
+        self._add_monitoring_bulk(self.add_stepfunctions_monitoring, state_machines, name_format)
+    
     def add_lambda_monitoring(self, function_name: str, lambda_function) -> None:
         """Add monitoring for a Lambda function"""
         # Create error rate alarm
@@ -191,7 +254,7 @@ class MonitoringConstruct(Construct):
             height=6
         )
         
-        self.dashboard.add_widgets(
+        self._add_dashboard_widgets(
             invocation_widget, error_widget,
             duration_widget, throttle_widget
         )
@@ -241,7 +304,7 @@ class MonitoringConstruct(Construct):
             height=6
         )
         
-        self.dashboard.add_widgets(capacity_widget, throttle_widget)
+        self._add_dashboard_widgets(capacity_widget, throttle_widget)
     
     def add_cloudtrail_monitoring(self, trail_name: str, trail) -> None:
         """Add monitoring for CloudTrail"""
@@ -284,7 +347,7 @@ class MonitoringConstruct(Construct):
             height=6
         )
         
-        self.dashboard.add_widgets(cloudtrail_widget)
+        self._add_dashboard_widgets(cloudtrail_widget)
     
     def add_eventbridge_monitoring(self, rule_name: str, rule) -> None:
         """Add monitoring for EventBridge rules"""
@@ -358,7 +421,7 @@ class MonitoringConstruct(Construct):
             height=6
         )
         
-        self.dashboard.add_widgets(eventbridge_widget)
+        self._add_dashboard_widgets(eventbridge_widget)
     
     def add_firehose_monitoring(self, stream_name: str, stream) -> None:
         """Add monitoring for Kinesis Data Firehose"""
@@ -409,7 +472,7 @@ class MonitoringConstruct(Construct):
             height=6
         )
         
-        self.dashboard.add_widgets(firehose_widget)
+        self._add_dashboard_widgets(firehose_widget)
     
     def add_sqs_monitoring(self, queue_name: str, queue) -> None:
         """Add monitoring for an SQS queue"""
@@ -439,7 +502,7 @@ class MonitoringConstruct(Construct):
             height=6
         )
         
-        self.dashboard.add_widgets(sqs_widget)
+        self._add_dashboard_widgets(sqs_widget)
 
     def add_s3_monitoring(self, bucket_name: str, bucket) -> None:
         """Add monitoring for S3 buckets"""
@@ -472,7 +535,7 @@ class MonitoringConstruct(Construct):
             height=6
         )
         
-        self.dashboard.add_widgets(s3_objects_widget)
+        self._add_dashboard_widgets(s3_objects_widget)
     
     def add_log_group_monitoring(self, log_group_name: str, log_group) -> None:
         """Add monitoring for CloudWatch log groups"""
@@ -634,7 +697,7 @@ class MonitoringConstruct(Construct):
             height=6
         )
         
-        self.dashboard.add_widgets(stepfunctions_executions_widget, stepfunctions_performance_widget)
+        self._add_dashboard_widgets(stepfunctions_executions_widget, stepfunctions_performance_widget)
     
     def create_workflow_dashboard(self) -> None:
         """Create a dedicated dashboard for workflow orchestration"""
@@ -2,7 +2,7 @@
 Security Construct for Bedrock Budgeteer
 Manages IAM roles, policies, and security-related resources
 """
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional
 from aws_cdk import (
     aws_iam as iam,
 )
@@ -30,7 +30,7 @@ class SecurityConstruct(Construct):
         self._create_dynamodb_access_policy()
         self._create_eventbridge_publish_policy()
         
-        # Tags are applied by TaggingFramework aspects
+        # Tags are applied by the stack via apply_tags
     
     def _create_lambda_execution_role(self) -> None:
         """Create IAM role for Lambda functions"""
@@ -269,6 +269,22 @@ class SecurityConstruct(Construct):
             ]
         )
     
+    def _add_lambda_statement(self, statement: iam.PolicyStatement,
+                              statements: Optional[List[iam.PolicyStatement]] = None) -> None:
+        """Add a statement to the Lambda execution role, or collect it for a batched policy"""
+        if statements is not None:
+            statements.append(statement)
+        else:
+            self.roles["lambda_execution"].add_to_policy(statement)
+    
+    def attach_lambda_policy(self, policy_id: str, statements: List[iam.PolicyStatement]) -> iam.Policy:
+        """Attach collected statements to the Lambda execution role as one inline policy"""
+        return iam.Policy(
+            self, policy_id,
+            statements=statements,
+            roles=[self.roles["lambda_execution"]]
+        )
+    
     def add_lambda_invoke_permissions(self, function_arns: List[str]) -> None:
         """Add Lambda invoke permissions to Step Functions role"""
         if function_arns:
@@ -280,7 +296,7 @@ class SecurityConstruct(Construct):
                 )
             )
     
-    def add_bedrock_permissions(self) -> None:
+    def add_bedrock_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add Bedrock API permissions for cost monitoring"""
         bedrock_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -294,9 +310,9 @@ class SecurityConstruct(Construct):
             resources=["*"]  # Bedrock requires wildcard for these actions
         )
         
-        self.roles["lambda_execution"].add_to_policy(bedrock_policy)
+        self._add_lambda_statement(bedrock_policy, statements)
     
-    def add_pricing_api_permissions(self) -> None:
+    def add_pricing_api_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add AWS Pricing API permissions for cost calculation"""
         pricing_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -308,9 +324,9 @@ class SecurityConstruct(Construct):
             resources=["*"]  # Pricing API requires wildcard
         )
         
-        self.roles["lambda_execution"].add_to_policy(pricing_policy)
+        self._add_lambda_statement(pricing_policy, statements)
     
-    def add_cloudtrail_permissions(self) -> None:
+    def add_cloudtrail_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add CloudTrail permissions for usage tracking"""
         cloudtrail_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -320,9 +336,9 @@ class SecurityConstruct(Construct):
             resources=["*"]
         )
         
-        self.roles["lambda_execution"].add_to_policy(cloudtrail_policy)
+        self._add_lambda_statement(cloudtrail_policy, statements)
     
-    def add_ssm_permissions(self) -> None:
+    def add_ssm_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add SSM Parameter Store permissions for configuration access"""
         ssm_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -334,9 +350,9 @@ class SecurityConstruct(Construct):
             resources=[f"arn:aws:ssm:*:*:parameter/bedrock-budgeteer/*"]
         )
         
-        self.roles["lambda_execution"].add_to_policy(ssm_policy)
+        self._add_lambda_statement(ssm_policy, statements)
     
-    def add_iam_read_permissions(self) -> None:
+    def add_iam_read_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add IAM read permissions for policy management"""
         iam_read_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -351,9 +367,9 @@ class SecurityConstruct(Construct):
             resources=["*"]
         )
         
-        self.roles["lambda_execution"].add_to_policy(iam_read_policy)
+        self._add_lambda_statement(iam_read_policy, statements)
     
-    def add_agentcore_iam_permissions(self) -> None:
+    def add_agentcore_iam_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add IAM role management permissions for AgentCore suspension/restoration"""
         agentcore_iam_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -377,7 +393,7 @@ class SecurityConstruct(Construct):
             }
         )
 
-        self.roles["lambda_execution"].add_to_policy(agentcore_iam_policy)
+        self._add_lambda_statement(agentcore_iam_policy, statements)
 
         # Also need unconditioned permission to tag roles initially
         # (can't check tag before tag exists)
@@ -390,9 +406,9 @@ class SecurityConstruct(Construct):
             resources=["arn:aws:iam::*:role/*"]
         )
 
-        self.roles["lambda_execution"].add_to_policy(agentcore_tag_policy)
+        self._add_lambda_statement(agentcore_tag_policy, statements)
 
-    def add_key_provisioning_iam_permissions(self) -> None:
+    def add_key_provisioning_iam_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add IAM permissions for key provisioning: tag reading and rogue key auto-tagging"""
         key_tag_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -405,9 +421,9 @@ class SecurityConstruct(Construct):
             ]
         )
 
-        self.roles["lambda_execution"].add_to_policy(key_tag_policy)
+        self._add_lambda_statement(key_tag_policy, statements)
 
-    def add_cost_explorer_permissions(self) -> None:
+    def add_cost_explorer_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add Cost Explorer permissions for cost allocation reporting"""
         cost_explorer_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -417,9 +433,9 @@ class SecurityConstruct(Construct):
             resources=["*"]  # Cost Explorer requires wildcard
         )
 
-        self.roles["lambda_execution"].add_to_policy(cost_explorer_policy)
+        self._add_lambda_statement(cost_explorer_policy, statements)
 
-    def add_cloudwatch_metrics_permissions(self) -> None:
+    def add_cloudwatch_metrics_permissions(self, statements: Optional[List[iam.PolicyStatement]] = None) -> None:
         """Add CloudWatch custom metrics permissions"""
         cloudwatch_policy = iam.PolicyStatement(
             effect=iam.Effect.ALLOW,
@@ -429,7 +445,7 @@ class SecurityConstruct(Construct):
             resources=["*"]
         )
         
-        self.roles["lambda_execution"].add_to_policy(cloudwatch_policy)
+        self._add_lambda_statement(cloudwatch_policy, statements)
     
     def add_dynamodb_permissions(self, tables: Dict[str, Any]) -> None:
         """Add DynamoDB permissions for Lambda functions"""
@@ -443,7 +459,11 @@ class SecurityConstruct(Construct):
     def add_sqs_permissions(self, queues: Dict[str, Any]) -> None:
         """Add SQS permissions for DLQ access"""
         for queue in queues.values():
-            queue.grant_send_messages(self.roles["lambda_execution"])
+            self.add_sqs_permissions_one(queue)
+    
+    def add_sqs_permissions_one(self, queue: Any) -> None:
+        """Add SQS send permission for a single DLQ"""
+        queue.grant_send_messages(self.roles["lambda_execution"])
     
     # Public properties to expose resources
     @property
@@ -2,37 +2,54 @@
 Lambda Utilities
 Provides a unified set of utilities for Lambda functions
 """
+import hashlib
 import logging
+import tempfile
+from functools import lru_cache
+from pathlib import Path
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 
+@lru_cache(maxsize=1)
 def get_shared_lambda_utilities() -> str:
     """
     Generate the shared utilities code to be included in Lambda functions
-    This replaces the large embedded utility code in the original file
+    This replaces the large embedded utility code in the original file.
+    The result is memoized: the layer and AgentCore functions share one string per synth.
     """
     return f"""
 # Common utilities for Bedrock Budgeteer Lambda functions
 import json
 import os
 import boto3
+from botocore.config import Config
 import logging
 import uuid
 import base64
 import gzip
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone, timedelta
 
-# Initialize AWS clients
-dynamodb = boto3.resource('dynamodb')
-dynamodb_client = boto3.client('dynamodb')
-ssm = boto3.client('ssm')
-cloudwatch = boto3.client('cloudwatch')
-events = boto3.client('events')
+# Initialize AWS clients. The pool is sized for the parallel scan/write threads and
+# adaptive retries back off on throttling instead of failing the batch
+BOTO_CONFIG = Config(
+    retries={{'mode': 'adaptive', 'max_attempts': 10}},
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
+dynamodb = boto3.resource('dynamodb', config=BOTO_CONFIG)
+dynamodb_client = boto3.client('dynamodb', config=BOTO_CONFIG)
+ssm = boto3.client('ssm', config=BOTO_CONFIG)
+cloudwatch = boto3.client('cloudwatch', config=BOTO_CONFIG)
+events = boto3.client('events', config=BOTO_CONFIG)
 
 # Configure logging
 logger = logging.getLogger()
@@ -50,6 +67,55 @@ logger.setLevel(logging.INFO)
 """
 
 
+# Module name the shared utilities are importable as from the Lambda layer
+SHARED_UTILITIES_MODULE = "shared_utilities"
+
+# Generated assets live in content-addressed directories under the system temp dir,
+# so repeated synths and test runs reuse one directory per distinct piece of code
+ASSET_CACHE_DIR = Path(tempfile.gettempdir()) / "bedrock-budgeteer-assets"
+
+
+def _asset_dir(name: str, files: dict) -> Path:
+    """
+    Write files (relative path -> source) into a directory keyed by their content
+    Assets hold source only, never bytecode, so their hash is the same on every synth host
+    """
+    digest = hashlib.sha256()
+    for relative_path, source in sorted(files.items()):
+        digest.update(relative_path.encode("utf-8") + b"\0" + source.encode("utf-8") + b"\0")
+    asset_dir = ASSET_CACHE_DIR / f"{name}-{digest.hexdigest()[:16]}"
+    for relative_path, source in files.items():
+        path = asset_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+    return asset_dir
+
+
+@lru_cache(maxsize=None)
+def build_shared_utilities_layer() -> str:
+    """
+    Write the shared utilities as an importable module laid out for a Lambda layer
+    Returns the directory to use as the layer asset; built once per synth
+    """
+    return str(_asset_dir("shared-layer", {
+        f"python/{SHARED_UTILITIES_MODULE}.py": get_shared_lambda_utilities()
+    }))
+
+
+@lru_cache(maxsize=None)
+def build_function_asset(function_name: str, function_code: str) -> str:
+    """
+    Write generated handler code as index.py in its own asset directory
+    Returns the directory to use with Code.from_asset; built once per synth
+    """
+    return str(_asset_dir(function_name.replace("_", "-"), {"index.py": function_code}))
+
+
+def get_shared_utilities_import() -> str:
+    """Import line that gives inline Lambda code the shared utilities from the layer"""
+    return f"from {SHARED_UTILITIES_MODULE} import *  # noqa: F401,F403 - shared utilities layer"
+
+
 def _get_configuration_manager_code() -> str:
     """Get ConfigurationManager class code"""
     return '''
@@ -57,12 +123,15 @@ class ConfigurationManager:
     """Manages SSM parameter configuration"""
     
     _cache = {}
+    # Cached for parameters that do not exist, so callers get their own default
+    _MISSING = object()
     
     @classmethod
     def get_parameter(cls, parameter_name: str, default_value: Any = None) -> Any:
         """Get parameter from SSM Parameter Store with caching"""
         if parameter_name in cls._cache:
-            return cls._cache[parameter_name]
+            value = cls._cache[parameter_name]
+            return default_value if value is cls._MISSING else value
         
         try:
             response = ssm.get_parameter(Name=parameter_name)
@@ -76,6 +145,12 @@ class ConfigurationManager:
             
             cls._cache[parameter_name] = value
             return value
+        except ssm.exceptions.ParameterNotFound:
+            # Parameters only appear on deploy; without this every call would go to SSM.
+            # Other errors (throttling, network) are not cached and retry on the next call
+            logger.warning(f"Parameter {parameter_name} not found, using default {default_value}")
+            cls._cache[parameter_name] = cls._MISSING
+            return default_value
         except Exception as e:
             logger.warning(f"Failed to get parameter {parameter_name}: {e}")
             return default_value
@@ -117,6 +192,31 @@ class DynamoDBHelper:
         elif isinstance(obj, list):
             return [DynamoDBHelper.float_to_decimal(item) for item in obj]
         return obj
+    
+    @staticmethod
+    def batch_put_items(table, items: List[Dict[str, Any]], max_attempts: int = 5) -> List[Dict[str, Any]]:
+        """Put items with BatchWriteItem, 25 per request, retrying unprocessed items with backoff
+        
+        Returns the items that were not written: those still unprocessed after max_attempts,
+        and every item of a request that raised, so earlier written chunks are never reported.
+        """
+        client = table.meta.client
+        unprocessed = []
+        for start in range(0, len(items), 25):
+            requests = [{'PutRequest': {'Item': item}} for item in items[start:start + 25]]
+            for attempt in range(max_attempts):
+                try:
+                    response = client.batch_write_item(RequestItems={table.name: requests})
+                except Exception as e:
+                    logger.error(f"BatchWriteItem failed for {len(requests)} items in {table.name}: {e}")
+                    break
+                requests = response.get('UnprocessedItems', {}).get(table.name, [])
+                if not requests:
+                    break
+                if attempt < max_attempts - 1:
+                    time.sleep(min(0.05 * (2 ** attempt), 2.0))
+            unprocessed.extend(request['PutRequest']['Item'] for request in requests)
+        return unprocessed
 '''
 
 
@@ -131,6 +231,19 @@ class BedrockPricingCalculator:
     _cache_timestamp = None
     _cache_ttl = 300  # 5 minutes local cache
     
+    # Pricing API client, created once and shared by concurrent fetches
+    _pricing_client = None
+    _pricing_client_lock = threading.Lock()
+    
+    @classmethod
+    def _get_pricing_client(cls):
+        """Return the shared Pricing API client (client creation is not thread-safe)"""
+        with cls._pricing_client_lock:
+            if cls._pricing_client is None:
+                # Pricing API only in us-east-1
+                cls._pricing_client = boto3.client('pricing', region_name='us-east-1', config=BOTO_CONFIG)
+        return cls._pricing_client
+    
     @classmethod
     def get_model_pricing(cls, model_id: str, region: str = 'us-east-1') -> Dict[str, float]:
         """Get pricing for a specific Bedrock model from DynamoDB"""
@@ -141,14 +254,14 @@ class BedrockPricingCalculator:
         if (cls._cache_timestamp and 
             (current_time - cls._cache_timestamp).total_seconds() < cls._cache_ttl and
             cache_key in cls._local_cache):
-            logger.info(f"Using local cache for {model_id} pricing")
+            logger.debug("Using local cache for %s pricing", model_id)
             return cls._local_cache[cache_key]
         
         try:
             # Query DynamoDB pricing table
             pricing_table = dynamodb.Table(os.environ['PRICING_TABLE'])
             
-            logger.info(f"Querying pricing table for model={model_id}, region={region}")
+            logger.debug("Querying pricing table for model=%s, region=%s", model_id, region)
             response = pricing_table.get_item(
                 Key={
                     'model_id': model_id,
@@ -182,7 +295,7 @@ class BedrockPricingCalculator:
     def fetch_pricing_from_api(cls, model_id: str, region: str = 'us-east-1') -> Optional[Dict[str, float]]:
         \"\"\"Fetch pricing from AWS Pricing API for a specific Bedrock model\"\"\"
         try:
-            pricing = boto3.client('pricing', region_name='us-east-1')  # Pricing API only in us-east-1
+            pricing = cls._get_pricing_client()
             
             service_code = 'AmazonBedrock'
             model_filters = [
@@ -428,29 +541,59 @@ def _get_metrics_publisher_code() -> str:
 class MetricsPublisher:
     """Publishes custom CloudWatch metrics"""
     
+    # Data points queued during an invocation; sent by flush()
+    _pending: List[Dict[str, Any]] = []
+    # PutMetricData accepts up to 1000 data points per request
+    MAX_BATCH_SIZE = 1000
+    
+    @staticmethod
+    def _datum(metric_name: str, value: float, unit: str,
+               dimensions: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """Build a PutMetricData data point"""
+        metric_data = {
+            'MetricName': metric_name,
+            'Value': value,
+            'Unit': unit,
+            'Timestamp': datetime.now(timezone.utc)
+        }
+        
+        if dimensions:
+            metric_data['Dimensions'] = [
+                {'Name': k, 'Value': v} for k, v in dimensions.items()
+            ]
+        return metric_data
+    
     @staticmethod
     def publish_budget_metric(metric_name: str, value: float, unit: str = 'None', 
                             dimensions: Optional[Dict[str, str]] = None):
         """Publish a budget-related metric to CloudWatch"""
         try:
-            metric_data = {
-                'MetricName': metric_name,
-                'Value': value,
-                'Unit': unit,
-                'Timestamp': datetime.now(timezone.utc)
-            }
-            
-            if dimensions:
-                metric_data['Dimensions'] = [
-                    {'Name': k, 'Value': v} for k, v in dimensions.items()
-                ]
-            
             cloudwatch.put_metric_data(
                 Namespace='BedrockBudgeteer',
-                MetricData=[metric_data]
+                MetricData=[MetricsPublisher._datum(metric_name, value, unit, dimensions)]
             )
         except Exception as e:
             logger.error(f"Failed to publish metric {metric_name}: {e}")
+    
+    @staticmethod
+    def queue_budget_metric(metric_name: str, value: float, unit: str = 'None',
+                            dimensions: Optional[Dict[str, str]] = None):
+        """Queue a budget-related metric for the next flush()"""
+        MetricsPublisher._pending.append(MetricsPublisher._datum(metric_name, value, unit, dimensions))
+    
+    @staticmethod
+    def flush() -> int:
+        """Send queued metrics in PutMetricData batches; returns the number sent"""
+        pending, MetricsPublisher._pending = MetricsPublisher._pending, []
+        sent = 0
+        for start in range(0, len(pending), MetricsPublisher.MAX_BATCH_SIZE):
+            chunk = pending[start:start + MetricsPublisher.MAX_BATCH_SIZE]
+            try:
+                cloudwatch.put_metric_data(Namespace='BedrockBudgeteer', MetricData=chunk)
+                sent += len(chunk)
+            except Exception as e:
+                logger.error(f"Failed to publish {len(chunk)} metrics: {e}")
+        return sent
 '''
 
 
@@ -460,20 +603,64 @@ def _get_event_publisher_code() -> str:
 class EventPublisher:
     """Publishes events to EventBridge"""
     
+    # Entries queued during an invocation; sent in batches of 10 by flush()
+    _pending: List[Dict[str, Any]] = []
+    # Retries for entries PutEvents rejects individually (e.g. throttling)
+    MAX_ENTRY_RETRIES = 3
+    
+    @staticmethod
+    def _entry(event_type: str, detail: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a PutEvents entry for a budget-related event"""
+        return {
+            'Source': 'bedrock-budgeteer',
+            'DetailType': event_type,
+            'Detail': json.dumps(detail, default=str),
+            'Time': datetime.now(timezone.utc)
+        }
+    
     @staticmethod
     def publish_budget_event(event_type: str, detail: Dict[str, Any]):
         """Publish a budget-related event to EventBridge"""
         try:
-            events.put_events(
-                Entries=[
-                    {
-                        'Source': 'bedrock-budgeteer',
-                        'DetailType': event_type,
-                        'Detail': json.dumps(detail, default=str),
-                        'Time': datetime.now(timezone.utc)
-                    }
-                ]
-            )
+            events.put_events(Entries=[EventPublisher._entry(event_type, detail)])
         except Exception as e:
             logger.error(f"Failed to publish event {event_type}: {e}")
+    
+    @staticmethod
+    def queue_budget_event(event_type: str, detail: Dict[str, Any]):
+        """Queue a budget-related event for the next flush()"""
+        EventPublisher._pending.append(EventPublisher._entry(event_type, detail))
+    
+    @staticmethod
+    def flush() -> int:
+        """Send queued events in PutEvents batches of 10, in parallel; returns the number sent"""
+        pending, EventPublisher._pending = EventPublisher._pending, []
+        if not pending:
+            return 0
+        
+        def _send(chunk):
+            remaining = chunk
+            for attempt in range(EventPublisher.MAX_ENTRY_RETRIES + 1):
+                if attempt:
+                    time.sleep(min(2 ** attempt * 0.1, 2.0) + random.random() * 0.1)
+                try:
+                    response = events.put_events(Entries=remaining)
+                except Exception as e:
+                    logger.error(f"Failed to publish {len(remaining)} events: {e}")
+                    break
+                if not response.get('FailedEntryCount', 0):
+                    return len(chunk)
+                # Only resend the entries EventBridge rejected
+                remaining = [
+                    entry for entry, result in zip(remaining, response.get('Entries', []))
+                    if result.get('ErrorCode')
+                ]
+            logger.error(f"Failed to publish {len(remaining)} of {len(chunk)} events")
+            return len(chunk) - len(remaining)
+        
+        chunks = [pending[i:i + 10] for i in range(0, len(pending), 10)]
+        if len(chunks) == 1:
+            return _send(chunks[0])
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return sum(executor.map(_send, chunks))
 '''
@@ -0,0 +1,26 @@
+"""
+Shared Resources for Bedrock Budgeteer constructs
+Bundles the resources that the stack hands from one construct to the next
+"""
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class SharedResources:
+    """Resources created by earlier constructs and consumed by later ones.
+
+    The stack builds this up as constructs are created (see ``with_updates``)
+    and passes a single ``shared`` argument instead of one keyword per resource.
+    """
+    tables: Dict[str, Any] = field(default_factory=dict)
+    functions: Dict[str, Any] = field(default_factory=dict)
+    queues: Dict[str, Any] = field(default_factory=dict)
+    bucket: Optional[Any] = None
+    roles: Dict[str, Any] = field(default_factory=dict)
+    topics: Dict[str, Any] = field(default_factory=dict)
+    kms_key: Optional[Any] = None
+
+    def with_updates(self, **changes: Any) -> "SharedResources":
+        """Return a copy with the given fields replaced"""
+        return replace(self, **changes)
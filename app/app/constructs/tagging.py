@@ -1,6 +1,6 @@
 """
 Tagging Framework for Bedrock Budgeteer
-Implements consistent tagging using CDK Aspects and Tags
+Implements consistent tagging applied eagerly at construction time
 """
 from typing import Dict, Optional
 import jsii
@@ -8,7 +8,7 @@ from aws_cdk import (
     IAspect,
     CfnResource,
 )
-from constructs import Construct, IConstruct
+from constructs import IConstruct
 
 
 @jsii.implements(IAspect)
@@ -114,29 +114,13 @@ class UnifiedTaggingAspect:
             pass
 
 
+def apply_tags(scope: IConstruct, environment_name: str,
+               additional_tags: Optional[Dict[str, str]] = None) -> None:
+    """Tag every CloudFormation resource under scope immediately.
 
-
-
-class TaggingFramework(Construct):
-    """Centralized tagging framework that applies all tagging aspects"""
-    
-    def __init__(self, scope: Construct, construct_id: str, 
-                 environment_name: str, **kwargs) -> None:
-        super().__init__(scope, construct_id, **kwargs)
-        
-        self.environment_name = environment_name
-        
-        # Apply all tagging aspects to the scope
-        self._apply_tagging_aspects(scope)
-    
-    def _apply_tagging_aspects(self, scope: Construct) -> None:
-        """Apply unified tagging aspect to the given scope"""
-        from aws_cdk import Aspects, AspectPriority
-        
-        # Single unified tagging aspect - applies all tags (core, compliance, cost) in one pass
-        # Set to MUTATING priority (200) to match Tags.of().add() calls and avoid priority conflicts
-        Aspects.of(scope).add(
-            UnifiedTaggingAspect(self.environment_name),
-            priority=AspectPriority.MUTATING
-        )
-
+    Call this once after the resources exist. Unlike registering an Aspect (which is
+    also what Tags.of().add() does), no extra tree walk is left for synth time.
+    """
+    tagger = UnifiedTaggingAspect(environment_name, additional_tags)
+    for node in scope.node.find_all():
+        tagger.visit(node)
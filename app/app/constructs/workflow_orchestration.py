@@ -18,6 +18,8 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+from .shared_resources import SharedResources
+
 # Import the new modular components
 from .workflow_lambda_functions import (
     get_iam_utilities_function_code,
@@ -39,23 +41,26 @@ class WorkflowOrchestrationConstruct(Construct):
         scope: Construct,
         construct_id: str,
         environment_name: str,
-        dynamodb_tables: Dict[str, dynamodb.Table],
-        lambda_functions: Dict[str, lambda_.Function],
-        step_functions_role: iam.Role,
-        lambda_execution_role: iam.Role,
+        dynamodb_tables: Optional[Dict[str, dynamodb.Table]] = None,
+        lambda_functions: Optional[Dict[str, lambda_.Function]] = None,
+        step_functions_role: Optional[iam.Role] = None,
+        lambda_execution_role: Optional[iam.Role] = None,
         sns_topics: Optional[Dict[str, sns.Topic]] = None,
         kms_key: Optional[kms.Key] = None,
+        shared: Optional[SharedResources] = None,
         **kwargs
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
         
+        # Explicit arguments win; anything omitted is taken from the shared bundle
+        self._shared = shared or SharedResources()
         self.environment_name = environment_name
-        self.dynamodb_tables = dynamodb_tables
-        self.lambda_functions = lambda_functions
-        self.step_functions_role = step_functions_role
-        self.lambda_execution_role = lambda_execution_role
-        self.sns_topics = sns_topics or {}
-        self.kms_key = kms_key
+        self.dynamodb_tables = dynamodb_tables if dynamodb_tables is not None else self._shared.tables
+        self.lambda_functions = lambda_functions if lambda_functions is not None else self._shared.functions
+        self.step_functions_role = step_functions_role or self._shared.roles.get("step_functions")
+        self.lambda_execution_role = lambda_execution_role or self._shared.roles.get("lambda_execution")
+        self.sns_topics = sns_topics or self._shared.topics
+        self.kms_key = kms_key if kms_key is not None else self._shared.kms_key
         
         # Storage for created resources
         self._state_machines: Dict[str, sfn.StateMachine] = {}
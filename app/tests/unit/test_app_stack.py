@@ -37,3 +37,58 @@ def test_sqs_queue_created():
             pytest.skip("Skipping due to known AspectLoop issue - basic infrastructure is valid")
         else:
             raise
+
+def test_partial_synth_builds_dependency_closure():
+    """Test that enabled_components only builds the requested components and their dependencies"""
+    app = core.App()
+    stack = AppStack(app, "partial", environment_name="production",
+                     enabled_components={"EventIngestion"})
+
+    assert stack._enabled_components == [
+        "Security", "DataStorage", "LogStorage", "CoreProcessing", "EventIngestion",
+    ]
+    assert not hasattr(stack, "monitoring")
+    assert not hasattr(stack, "workflow_orchestration")
+
+def test_partial_synth_reads_components_from_context_and_warns():
+    """Test that bb-components context selects components and the skipped ones are annotated"""
+    app = core.App(context={"bb-components": "LogStorage,Configuration"})
+    stack = AppStack(app, "partialctx", environment_name="production")
+
+    assert stack._enabled_components == ["LogStorage", "Configuration"]
+    assertions.Annotations.from_stack(stack).has_warning(
+        "/partialctx",
+        assertions.Match.string_like_regexp("skipping component\\(s\\) Security, DataStorage, CoreProcessing")
+    )
+
+def test_components_environment_variable_ignored(monkeypatch):
+    """Test that only explicit context, not the environment, selects a partial synth"""
+    monkeypatch.setenv("BB_COMPONENTS", "LogStorage")
+    app = core.App()
+    stack = AppStack(app, "fullenv", environment_name="production")
+
+    assert "WorkflowOrchestration" in stack._enabled_components
+
+def test_partial_synth_rejects_unknown_component():
+    """Test that an unknown component name fails fast"""
+    import pytest
+    app = core.App()
+    with pytest.raises(ValueError):
+        AppStack(app, "bad", environment_name="production", enabled_components={"Nope"})
+
+def test_shared_resources_accumulate_across_constructs():
+    """Test that the stack hands one shared bundle to downstream constructs"""
+    app = core.App()
+    stack = AppStack(app, "shared", environment_name="production",
+                     enabled_components={"CoreProcessing"})
+
+    assert stack.shared.tables is stack.data_storage.tables
+    assert stack.shared.functions is stack.core_processing.functions
+    assert stack.core_processing.lambda_execution_role is stack.security.roles["lambda_execution"]
+
+def test_create_dashboards_context_skips_workflow_dashboard():
+    """Test that -c create_dashboards=false leaves out the dedicated dashboards"""
+    app = core.App(context={"create_dashboards": "false"})
+    stack = AppStack(app, "nodash", environment_name="production")
+
+    assert not hasattr(stack.monitoring, "workflow_dashboard")
@@ -0,0 +1,124 @@
+"""Tests for the audit logger Lambda handler"""
+import json
+import logging
+import os
+import time
+import typing
+import unittest
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
+
+
+class _FakeClient:
+    """BatchWriteItem stub that raises for the requests listed in fail_calls"""
+
+    def __init__(self, fail_calls=()):
+        self.fail_calls = set(fail_calls)
+        self.calls = 0
+        self.written = []
+
+    def batch_write_item(self, RequestItems):
+        self.calls += 1
+        if self.calls in self.fail_calls:
+            raise RuntimeError('ProvisionedThroughputExceededException')
+        for requests in RequestItems.values():
+            self.written.extend(request['PutRequest']['Item'] for request in requests)
+        return {'UnprocessedItems': {}}
+
+
+class TestAuditLoggerHandler(unittest.TestCase):
+    """Run the audit logger handler against a stubbed audit logs table"""
+
+    def _load_handler(self, client):
+        from app.constructs.lambda_functions.audit_logger import get_audit_logger_function_code
+        from app.constructs.shared.lambda_utilities import _get_dynamodb_helper_code
+
+        table = SimpleNamespace(name='audit-logs', meta=SimpleNamespace(client=client))
+        namespace = {
+            'json': json, 'os': os, 'time': time, 'Decimal': Decimal,
+            'datetime': datetime, 'timezone': timezone, 'timedelta': timedelta,
+            'logger': logging.getLogger('audit-logger-test'),
+            'dynamodb': SimpleNamespace(Table=lambda name: table),
+            'MetricsPublisher': mock.Mock(),
+        }
+        namespace.update({name: getattr(typing, name) for name in typing.__all__})
+        with mock.patch.dict(os.environ, {'AUDIT_LOGS_TABLE': 'audit-logs', 'ENVIRONMENT': 'test'}):
+            exec(_get_dynamodb_helper_code(), namespace)
+            exec(get_audit_logger_function_code(), namespace)
+        return namespace['lambda_handler']
+
+    @staticmethod
+    def _sqs_records(count):
+        return [
+            {
+                'messageId': f'msg-{index}',
+                'body': json.dumps({
+                    'id': f'event-{index}',
+                    'time': '2026-01-01T00:00:00Z',
+                    'source': 'bedrock-budgeteer',
+                    'detail-type': 'Budget Exceeded',
+                    'detail': {'principal_id': f'user-{index}'},
+                }),
+            }
+            for index in range(count)
+        ]
+
+    def test_only_unwritten_chunk_is_reported(self):
+        """A failure on the second BatchWriteItem chunk must not redeliver the first"""
+        client = _FakeClient(fail_calls={2})
+        handler = self._load_handler(client)
+
+        with mock.patch.dict(os.environ, {'ENVIRONMENT': 'test'}):
+            result = handler({'Records': self._sqs_records(30)}, None)
+
+        self.assertEqual(len(client.written), 25)
+        self.assertEqual(
+            [failure['itemIdentifier'] for failure in result['batchItemFailures']],
+            [f'msg-{index}' for index in range(25, 30)]
+        )
+
+    def test_all_written_reports_no_failures(self):
+        client = _FakeClient()
+        handler = self._load_handler(client)
+
+        with mock.patch.dict(os.environ, {'ENVIRONMENT': 'test'}):
+            result = handler({'Records': self._sqs_records(3)}, None)
+
+        self.assertEqual(result, {'batchItemFailures': []})
+        self.assertEqual(
+            sorted(item['principal_id'] for item in client.written),
+            ['user-0', 'user-1', 'user-2']
+        )
+
+    def test_redelivered_event_keeps_its_key(self):
+        """Keys come from the envelope id and time, so redelivery overwrites the same row"""
+        client = _FakeClient()
+        handler = self._load_handler(client)
+        records = self._sqs_records(1)
+
+        with mock.patch.dict(os.environ, {'ENVIRONMENT': 'test'}):
+            handler({'Records': records}, None)
+            handler({'Records': [dict(records[0], messageId='msg-redelivered')]}, None)
+
+        first, second = client.written
+        self.assertEqual(first['event_id'], second['event_id'])
+        self.assertEqual(first['event_time'], '2026-01-01T00:00:00+00:00')
+        self.assertEqual(second['event_time'], first['event_time'])
+
+    def test_duplicate_event_in_batch_written_once(self):
+        """BatchWriteItem rejects duplicate keys within one request"""
+        client = _FakeClient()
+        handler = self._load_handler(client)
+        record = self._sqs_records(1)[0]
+
+        with mock.patch.dict(os.environ, {'ENVIRONMENT': 'test'}):
+            result = handler({'Records': [record, dict(record, messageId='msg-copy')]}, None)
+
+        self.assertEqual(result, {'batchItemFailures': []})
+        self.assertEqual(len(client.written), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -153,6 +153,17 @@ class TestMonitoringResources(TestBedrockBudgeteerStack):
         template.has_resource_properties("AWS::CloudWatch::Dashboard", {
             "DashboardName": "bedrock-budgeteer-production-system"
         })
+    
+    def test_invocation_logs_stream_directly_to_firehose(self, template):
+        """Test that the invocation log subscription targets Firehose without a forwarder Lambda"""
+        template.has_resource_properties("AWS::Logs::SubscriptionFilter", {
+            "FilterName": "bedrock-budgeteer-production-invocation-logs",
+            "DestinationArn": {"Fn::GetAtt": [Match.string_like_regexp("BedrockUsageFirehose"), "Arn"]},
+            "RoleArn": Match.any_value()
+        })
+        template.resource_properties_count_is("AWS::Lambda::Function", {
+            "FunctionName": "bedrock-budgeteer-production-logs-forwarder"
+        }, 0)
 
 
 class TestSSMParameters(TestBedrockBudgeteerStack):
@@ -212,6 +223,25 @@ class TestResourceTagging(TestBedrockBudgeteerStack):
         })
 
 
+class TestUsageLogDelivery(TestBedrockBudgeteerStack):
+    """Test S3 delivery of Lambda-processed usage logs"""
+    
+    def test_usage_logs_not_dynamically_partitioned(self, template):
+        """Test that the usage stream writes time-partitioned objects only.
+        
+        One Firehose record carries a whole CloudWatch Logs batch, which can span
+        many principals, so there is no per-record principal to partition by.
+        """
+        template.has_resource_properties("AWS::KinesisFirehose::DeliveryStream", {
+            "DeliveryStreamName": "bedrock-budgeteer-production-usage-logs",
+            "ExtendedS3DestinationConfiguration": Match.object_like({
+                "Prefix": "bedrock-usage-logs/year=!{timestamp:yyyy}/month=!{timestamp:MM}/day=!{timestamp:dd}/hour=!{timestamp:HH}/",
+                "DynamicPartitioningConfiguration": Match.absent(),
+                "BufferingHints": {"IntervalInSeconds": 300, "SizeInMBs": 5}
+            })
+        })
+
+
 class TestStackSynthesis(TestBedrockBudgeteerStack):
     """Test overall stack synthesis and structure"""
     
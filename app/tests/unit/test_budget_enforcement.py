@@ -0,0 +1,119 @@
+"""Tests for the shared budget enforcement helpers"""
+import logging
+import os
+import re
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+
+class _ConditionalCheckFailedException(Exception):
+    pass
+
+
+class _FakeTable:
+    """In-memory table for SET updates, evaluating the condition expressions used by the helpers"""
+
+    _TOKENS = [
+        (r'attribute_not_exists\((\w+)\)', lambda m: f"({m.group(1)!r} not in item)"),
+        (r'attribute_type\((\w+), (:\w+)\)',
+         lambda m: f"(_type(item, {m.group(1)!r}) == values[{m.group(2)!r}])"),
+        (r'(#\w+) <> (:\w+)', lambda m: f"(item.get(names[{m.group(1)!r}]) != values[{m.group(2)!r}])"),
+        (r'\bAND\b', lambda m: 'and'),
+        (r'\bOR\b', lambda m: 'or'),
+    ]
+
+    def __init__(self, items):
+        self.items = {item['principal_id']: dict(item) for item in items}
+
+    @staticmethod
+    def _type(item, name):
+        if name not in item:
+            return None
+        return 'NULL' if item[name] is None else 'N' if isinstance(item[name], (int, float)) else 'S'
+
+    def _check(self, item, condition, names, values):
+        for pattern, replacement in self._TOKENS:
+            condition = re.sub(pattern, replacement, condition)
+        scope = {'item': item, 'names': names, 'values': values, '_type': self._type}
+        return eval(condition, {'__builtins__': {}}, scope)
+
+    def update_item(self, Key, UpdateExpression, ExpressionAttributeValues,
+                    ExpressionAttributeNames=None, ConditionExpression=None):
+        names = ExpressionAttributeNames or {}
+        item = self.items[Key['principal_id']]
+        if ConditionExpression and not self._check(item, ConditionExpression, names,
+                                                   ExpressionAttributeValues):
+            raise _ConditionalCheckFailedException()
+        for assignment in UpdateExpression[len('SET '):].split(', '):
+            name, value = assignment.split(' = ')
+            item[names.get(name, name)] = ExpressionAttributeValues[value]
+
+
+class TestHandleBudgetExceeded(unittest.TestCase):
+    """Run _handle_budget_exceeded against stored user-budget records"""
+
+    def setUp(self):
+        from app.constructs.lambda_functions.budget_enforcement import get_budget_enforcement_code
+        self.event_publisher = mock.Mock()
+        exceptions = mock.Mock(ConditionalCheckFailedException=_ConditionalCheckFailedException)
+        self.namespace = {
+            'os': os, 'time': time, 'datetime': datetime, 'timezone': timezone,
+            'logger': logging.getLogger('budget-enforcement-test'),
+            'dynamodb': mock.Mock(meta=mock.Mock(client=mock.Mock(exceptions=exceptions))),
+            'ConfigurationManager': mock.Mock(),
+            'EventPublisher': self.event_publisher,
+            'MetricsPublisher': mock.Mock(),
+        }
+        exec(get_budget_enforcement_code(), self.namespace)
+        self.handle = self.namespace['_handle_budget_exceeded']
+
+    def _over_budget(self, table, principal_id):
+        key_item = dict(table.items[principal_id])
+        return self.handle(table, key_item, 300, 'per_key'), key_item
+
+    def _started_events(self):
+        return [c for c in self.event_publisher.queue_budget_event.call_args_list
+                if c.args[0] == 'Grace Period Started']
+
+    def test_refreshed_key_with_null_deadline_enters_grace_period(self):
+        """Budget refresh stores grace_deadline_epoch as NULL; that must not block the grace period"""
+        table = _FakeTable([{
+            'principal_id': 'BedrockAPIKey-alice', 'status': 'active',
+            'grace_deadline_epoch': None, 'spent_usd': 101, 'budget_limit_usd': 100
+        }])
+
+        result, key_item = self._over_budget(table, 'BedrockAPIKey-alice')
+
+        self.assertEqual(result, 0)
+        self.assertEqual(table.items['BedrockAPIKey-alice']['status'], 'grace_period')
+        self.assertIsInstance(table.items['BedrockAPIKey-alice']['grace_deadline_epoch'], int)
+        self.assertEqual(key_item['status'], 'grace_period')
+        self.assertEqual(len(self._started_events()), 1)
+
+    def test_key_without_deadline_attribute_enters_grace_period(self):
+        table = _FakeTable([{'principal_id': 'BedrockAPIKey-bob', 'status': 'active'}])
+
+        self._over_budget(table, 'BedrockAPIKey-bob')
+
+        self.assertEqual(table.items['BedrockAPIKey-bob']['status'], 'grace_period')
+        self.assertEqual(len(self._started_events()), 1)
+
+    def test_concurrent_start_publishes_once(self):
+        """A second monitor holding a stale copy must not restart the grace period"""
+        table = _FakeTable([{
+            'principal_id': 'BedrockAPIKey-carol', 'status': 'active', 'grace_deadline_epoch': None
+        }])
+        stale_copy = dict(table.items['BedrockAPIKey-carol'])
+
+        self.handle(table, dict(stale_copy), 300, 'per_key')
+        deadline = table.items['BedrockAPIKey-carol']['grace_deadline_epoch']
+        self.handle(table, dict(stale_copy), 300, 'per_key')
+
+        self.assertEqual(table.items['BedrockAPIKey-carol']['grace_deadline_epoch'], deadline)
+        self.assertEqual(len(self._started_events()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""Tests for stream-driven budget monitor Lambda function code"""
+import logging
+import os
+import sys
+import types
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+
+class _TypeDeserializer:
+    """Subset of boto3's TypeDeserializer covering the attribute types used below"""
+
+    def deserialize(self, value):
+        (type_name, raw), = value.items()
+        if type_name == 'N':
+            return Decimal(raw)
+        if type_name == 'NULL':
+            return None
+        return raw
+
+
+def _image(**attributes):
+    """Build a DynamoDB Stream image from plain values"""
+    image = {}
+    for name, value in attributes.items():
+        if isinstance(value, bool):
+            image[name] = {'BOOL': value}
+        elif isinstance(value, (int, float)):
+            image[name] = {'N': str(value)}
+        else:
+            image[name] = {'S': value}
+    return image
+
+
+class TestBudgetMonitorStreamHandler(unittest.TestCase):
+    """Run budget_monitor_stream against DynamoDB Stream records"""
+
+    def setUp(self):
+        from app.constructs.lambda_functions.budget_monitor_stream import (
+            get_budget_monitor_stream_function_code
+        )
+        self.table = mock.Mock(name='user_budgets_table')
+        self.namespace = {
+            'os': os,
+            'logger': logging.getLogger('budget-monitor-stream-test'),
+            'dynamodb': mock.Mock(Table=mock.Mock(return_value=self.table)),
+            'ConfigurationManager': mock.Mock(
+                get_parameter=mock.Mock(side_effect=lambda name, default: default)
+            ),
+            'EventPublisher': mock.Mock(),
+            '_get_grace_period_seconds': mock.Mock(return_value=300),
+            '_handle_budget_exceeded': mock.Mock(return_value=1),
+            '_update_threshold_state': mock.Mock(),
+        }
+        boto3_types = types.ModuleType('boto3.dynamodb.types')
+        boto3_types.TypeDeserializer = _TypeDeserializer
+        stub_modules = {
+            'boto3': types.ModuleType('boto3'),
+            'boto3.dynamodb': types.ModuleType('boto3.dynamodb'),
+            'boto3.dynamodb.types': boto3_types,
+        }
+        with mock.patch.dict(sys.modules, stub_modules), \
+                mock.patch.dict(os.environ, {'USER_BUDGETS_TABLE': 'user-budgets'}):
+            exec(get_budget_monitor_stream_function_code(), self.namespace)
+        self.handler = self.namespace['lambda_handler']
+
+    @staticmethod
+    def _modify_record(old_spent, new_spent, **overrides):
+        key = {
+            'principal_id': 'BedrockAPIKey-alice', 'has_carveout': True,
+            'status': 'active', 'budget_limit_usd': 100, **overrides
+        }
+        return {
+            'eventName': 'MODIFY',
+            'dynamodb': {
+                'OldImage': _image(spent_usd=old_spent, **key),
+                'NewImage': _image(spent_usd=new_spent, **key),
+            }
+        }
+
+    def test_spend_change_crossing_critical_updates_threshold(self):
+        result = self.handler({'Records': [self._modify_record(80, 95)]}, None)
+
+        self.assertEqual(result, {'evaluated_keys': 1, 'suspensions_triggered': 0})
+        threshold_call = self.namespace['_update_threshold_state'].call_args
+        self.assertIs(threshold_call.args[0], self.table)
+        self.assertEqual(threshold_call.args[1]['principal_id'], 'BedrockAPIKey-alice')
+        self.assertEqual(threshold_call.args[2], 'critical')
+        self.namespace['EventPublisher'].flush.assert_called_once()
+
+    def test_spend_over_budget_hands_off_to_enforcement(self):
+        result = self.handler({'Records': [self._modify_record(99, 101)]}, None)
+
+        self.assertEqual(result, {'evaluated_keys': 1, 'suspensions_triggered': 1})
+        self.namespace['_handle_budget_exceeded'].assert_called_once_with(
+            self.table, mock.ANY, 300, 'per_key'
+        )
+        self.namespace['_update_threshold_state'].assert_not_called()
+
+    def test_modify_without_spend_change_is_skipped(self):
+        """Status and threshold writes made by this function must not re-trigger it"""
+        result = self.handler({'Records': [self._modify_record(95, 95)]}, None)
+
+        self.assertEqual(result['evaluated_keys'], 0)
+        self.namespace['_update_threshold_state'].assert_not_called()
+
+    def test_keys_without_carveout_are_left_to_scheduled_monitor(self):
+        record = self._modify_record(80, 95, has_carveout=False)
+
+        result = self.handler({'Records': [record]}, None)
+
+        self.assertEqual(result['evaluated_keys'], 0)
+        self.namespace['_update_threshold_state'].assert_not_called()
+
+    def test_code_compiles(self):
+        from app.constructs.lambda_functions.budget_enforcement import get_budget_enforcement_code
+        from app.constructs.lambda_functions.budget_monitor_stream import (
+            get_budget_monitor_stream_function_code
+        )
+        compile(
+            get_budget_enforcement_code() + get_budget_monitor_stream_function_code(),
+            'budget_monitor_stream', 'exec'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
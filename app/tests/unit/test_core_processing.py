@@ -11,10 +11,10 @@ from datetime import datetime, timezone
 
 
 from aws_cdk import App, Stack
-from aws_cdk.assertions import Template
+from aws_cdk.assertions import Match, Template
 
 # Import the construct
-from app.constructs.core_processing import CoreProcessingConstruct
+from app.constructs.core_processing import CoreProcessingConstruct, ESSENTIAL_FOUNDATION_MODELS
 from app.constructs.data_storage import DataStorageConstruct
 from app.constructs.log_storage import LogStorageConstruct
 
@@ -97,6 +97,12 @@ class TestLambdaImportValidation(unittest.TestCase):
         for client in required_clients:
             self.assertIn(client, shared_utils,
                          f"Missing AWS client initialization: {client}")
+
+        # Clients share one keep-alive, adaptive-retry config, including the Pricing API client
+        self.assertIn('tcp_keepalive=True', shared_utils)
+        self.assertIn("'mode': 'adaptive'", shared_utils)
+        self.assertIn("dynamodb = boto3.resource('dynamodb', config=BOTO_CONFIG)", shared_utils)
+        self.assertIn("boto3.client('pricing', region_name='us-east-1', config=BOTO_CONFIG)", shared_utils)
         
         # Check for utility classes
         required_classes = [
@@ -110,7 +116,45 @@ class TestLambdaImportValidation(unittest.TestCase):
         for cls in required_classes:
             self.assertIn(cls, shared_utils,
                          f"Missing utility class: {cls}")
-    
+
+    def test_shared_utilities_layer_contains_module(self):
+        """Test that the layer asset exposes the shared utilities as an importable module"""
+        import os
+        from app.constructs.shared.lambda_utilities import (
+            build_shared_utilities_layer, get_shared_lambda_utilities
+        )
+
+        layer_dir = build_shared_utilities_layer()
+        module_path = os.path.join(layer_dir, 'python', 'shared_utilities.py')
+
+        self.assertTrue(os.path.isfile(module_path))
+        with open(module_path) as module_file:
+            self.assertEqual(module_file.read(), get_shared_lambda_utilities())
+
+    def test_function_asset_contains_handler_module(self):
+        """Test that generated function assets expose the code as index.py"""
+        import os
+        from app.constructs.shared.lambda_utilities import build_function_asset
+
+        asset_dir = build_function_asset('pricing_manager', 'def lambda_handler(event, context):\n    return {}\n')
+        module_path = os.path.join(asset_dir, 'index.py')
+
+        self.assertTrue(os.path.isfile(module_path))
+        with open(module_path) as module_file:
+            self.assertIn('def lambda_handler', module_file.read())
+
+    def test_function_asset_is_source_only_and_reused(self):
+        """Test that assets hold no bytecode and the same code maps to the same directory"""
+        import os
+        from app.constructs.shared.lambda_utilities import build_function_asset
+
+        code = 'def lambda_handler(event, context):\n    return {"reused": True}\n'
+        asset_dir = build_function_asset('usage_calculator', code)
+        build_function_asset.cache_clear()
+
+        self.assertEqual(build_function_asset('usage_calculator', code), asset_dir)
+        self.assertEqual(os.listdir(asset_dir), ['index.py'])
+
     def test_user_setup_lambda_uses_correct_references(self):
         """Test that user setup Lambda uses correct AWS client and utility references"""
         from app.constructs.lambda_functions.user_setup import get_user_setup_function_code
@@ -150,8 +194,12 @@ class TestLambdaImportValidation(unittest.TestCase):
                      "Usage calculator Lambda should use BedrockPricingCalculator")
         self.assertIn('ConfigurationManager.get_parameter', usage_calc_code,
                      "Usage calculator Lambda should use ConfigurationManager")
-        self.assertIn('EventPublisher.publish_budget_event', usage_calc_code,
+        self.assertIn('EventPublisher.queue_budget_event', usage_calc_code,
                      "Usage calculator Lambda should use EventPublisher")
+        self.assertIn('EventPublisher.flush()', usage_calc_code,
+                     "Usage calculator Lambda should flush queued events once per batch")
+        self.assertIn('MetricsPublisher.flush()', usage_calc_code,
+                     "Usage calculator Lambda should flush queued metrics once per batch")
         
         # Check that it uses required imports
         # These should be provided by shared utilities, not imported separately
@@ -260,8 +308,7 @@ class TestCoreProcessingConstruct(unittest.TestCase):
             "user_setup",
             "usage_calculator", 
             "budget_monitor",
-            "audit_logger",
-            "state_reconciliation"
+            "audit_logger"
         ]
         
         # Check that all functions exist in the construct
@@ -277,16 +324,16 @@ class TestCoreProcessingConstruct(unittest.TestCase):
             "user_setup",
             "usage_calculator",
             "budget_monitor", 
-            "audit_logger",
-            "state_reconciliation"
+            "budget_monitor_stream",
+            "audit_logger"
         ]
         
         # Check that all DLQ queues exist
         for queue_name in expected_queues:
             self.assertIn(queue_name, self.core_processing.dead_letter_queues)
         
-        # Check CDK template has SQS queues
-        self.template.resource_count_is("AWS::SQS::Queue", 5)
+        # Check CDK template has SQS queues: six DLQs plus the audit ingest queue
+        self.template.resource_count_is("AWS::SQS::Queue", 7)
     
     def test_iam_role_created(self):
         """Test that IAM execution role is created with proper permissions"""
@@ -320,6 +367,31 @@ class TestCoreProcessingConstruct(unittest.TestCase):
             }
         })
     
+    def test_pricing_rule_matches_only_api_key_users(self):
+        """Test that pricing refreshes are only triggered by Bedrock API key user creation"""
+        self.template.has_resource_properties("AWS::Events::Rule", {
+            "Name": "bedrock-budgeteer-api-key-pricing-production",
+            "EventPattern": {
+                "detail": {
+                    "eventName": ["CreateUser"],
+                    "requestParameters": {
+                        "userName": [{"prefix": "BedrockAPIKey-"}]
+                    }
+                }
+            },
+            "Targets": [Match.object_like({"Input": Match.any_value()})]
+        })
+    
+    def test_audit_rule_skips_usage_cost_events(self):
+        """Test that per-invocation cost events are not routed to the audit queue"""
+        self.template.has_resource_properties("AWS::Events::Rule", {
+            "Name": "bedrock-budgeteer-audit-production",
+            "EventPattern": {
+                "source": ["bedrock-budgeteer"],
+                "detail-type": [{"anything-but": "Usage Cost Calculated"}]
+            }
+        })
+    
     def test_lambda_environment_variables(self):
         """Test that Lambda functions have correct environment variables"""
         self.template.has_resource_properties("AWS::Lambda::Function", {
@@ -333,6 +405,37 @@ class TestCoreProcessingConstruct(unittest.TestCase):
             }
         })
 
+    def test_usage_calculator_runs_on_arm64(self):
+        """Test that the usage calculator runs on Graviton"""
+        self.template.has_resource_properties("AWS::Lambda::Function", {
+            "FunctionName": "bedrock-budgeteer-usage-calculator-production",
+            "Architectures": ["arm64"]
+        })
+
+    @patch("app.constructs.core_processing.fetch_foundation_models")
+    def test_pricing_manager_bakes_foundation_models(self, mock_fetch):
+        """Test that synth bakes the essential fallback list without calling Bedrock by default"""
+        app = App()
+        stack = Stack(app, "BakedModelsStack")
+        data_storage = DataStorageConstruct(stack, "DataStorage", environment_name="production")
+        log_storage = LogStorageConstruct(stack, "LogStorage", environment_name="production")
+        CoreProcessingConstruct(
+            stack, "CoreProcessing",
+            environment_name="production",
+            dynamodb_tables=data_storage.tables,
+            s3_bucket=log_storage.logs_bucket
+        )
+
+        Template.from_stack(stack).has_resource_properties("AWS::Lambda::Function", {
+            "FunctionName": "bedrock-budgeteer-pricing-manager-production",
+            "Environment": {
+                "Variables": Match.object_like({
+                    "BAKED_FOUNDATION_MODELS": json.dumps(ESSENTIAL_FOUNDATION_MODELS)
+                })
+            }
+        })
+        mock_fetch.assert_not_called()
+
 
 class TestUserSetupLambda(unittest.TestCase):
     """Test User Setup Lambda function logic"""
@@ -1118,7 +1221,7 @@ class TestBudgetRefreshFunctionality(unittest.TestCase):
         self.template.has_resource_properties("AWS::SQS::Queue", {
             "QueueName": "bedrock-budgeteer-budget-refresh-dlq-production",
             "MessageRetentionPeriod": 1209600,  # 14 days
-            "KmsMasterKeyId": "alias/aws/sqs"
+            "SqsManagedSseEnabled": True
         })
     
     @patch('boto3.resource')
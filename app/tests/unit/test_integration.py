@@ -98,11 +98,19 @@ class TestIntegration(unittest.TestCase):
         self.template.has_resource("AWS::CloudTrail::Trail", {
             "Properties": {
                 "TrailName": "bedrock-budgeteer-production-trail",
-                "IncludeGlobalServiceEvents": True,
-                "IsMultiRegionTrail": True,
+                "IncludeGlobalServiceEvents": False,
+                "IsMultiRegionTrail": False,
                 "EnableLogFileValidation": True
             }
         })
+        # IAM events come from a separate multi-region trail
+        self.template.has_resource("AWS::CloudTrail::Trail", {
+            "Properties": {
+                "TrailName": "bedrock-budgeteer-production-global-trail",
+                "IncludeGlobalServiceEvents": True,
+                "IsMultiRegionTrail": True
+            }
+        })
 
     def test_eventbridge_rules_created(self):
         """Test that EventBridge rules are created"""
@@ -212,6 +220,19 @@ class TestIntegration(unittest.TestCase):
                                 "KeyType": "RANGE"
                             }
                         ]
+                    },
+                    {
+                        "IndexName": "ActiveBudgetIndex",
+                        "KeySchema": [
+                            {
+                                "AttributeName": "status",
+                                "KeyType": "HASH"
+                            },
+                            {
+                                "AttributeName": "spent_usd",
+                                "KeyType": "RANGE"
+                            }
+                        ]
                     }
                 ]
             }
@@ -88,7 +88,7 @@ class TestMonitoringConstruct(unittest.TestCase):
     def test_lambda_monitoring_alarms_created(self):
         """Test that Lambda function monitoring alarms are created"""
         # Should have error rate alarms for Lambda functions
-        lambda_functions = ["user_setup", "usage_calculator", "budget_monitor", "audit_logger", "state_reconciliation"]
+        lambda_functions = ["user_setup", "usage_calculator", "budget_monitor", "audit_logger"]
         
         for function_name in lambda_functions:
             # Error alarm
@@ -569,7 +569,7 @@ class TestIntegration(unittest.TestCase):
     def test_monitoring_covers_all_components(self):
         """Test that monitoring covers all system components"""
         # Should have monitoring for Lambda functions
-        lambda_functions = ["user_setup", "usage_calculator", "budget_monitor", "audit_logger", "state_reconciliation"]
+        lambda_functions = ["user_setup", "usage_calculator", "budget_monitor", "audit_logger"]
         for function_name in lambda_functions:
             self.assertIn(function_name, self.stack.core_processing.functions)
         
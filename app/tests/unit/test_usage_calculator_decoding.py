@@ -0,0 +1,89 @@
+"""Tests for usage_calculator Firehose record decoding"""
+import ast
+import base64
+import gzip
+import json
+import re
+import time
+import unittest
+
+
+class TestUsageCalculatorDecoding(unittest.TestCase):
+    """Validate how usage_calculator decodes Firehose records"""
+
+    def setUp(self):
+        from app.constructs.lambda_functions.usage_calculator import get_usage_calculator_function_code
+        self.code = get_usage_calculator_function_code()
+
+    def test_detects_gzip_by_magic_bytes(self):
+        """Plain records must not pay for a failed decompress"""
+        self.assertIn("GZIP_MAGIC = b'\\x1f\\x8b'", self.code)
+        self.assertIn('if decoded_data[:2] == GZIP_MAGIC:', self.code)
+        self.assertNotIn('except OSError', self.code)
+
+    def test_decompresses_with_zlib_gzip_mode(self):
+        """Subscription payloads are single-member gzip, so zlib can read them directly"""
+        self.assertIn('zlib.decompress(decoded_data, 31)', self.code)
+        self.assertNotIn('gzip.decompress', self.code)
+
+    def test_usage_records_written_per_batch(self):
+        """Usage rows are queued per record and written with BatchWriteItem once per batch"""
+        self.assertNotIn('usage_tracking_table.put_item', self.code)
+        self.assertIn('DynamoDBHelper.batch_put_items(USAGE_TRACKING_TABLE, items)', self.code)
+        self.assertIn('_flush_usage_records()', self.code)
+
+    def test_budget_updates_coalesced_per_principal(self):
+        """Spend is summed per principal and applied with one update each"""
+        self.assertIn('_pending_budget_updates.append(', self.code)
+        self.assertIn('failed_record_ids = _flush_budget_updates()', self.code)
+        self.assertIn('model_spend_breakdown.#m{index}', self.code)
+
+    def test_budget_without_breakdown_map_is_initialized(self):
+        """Keys registered without model_spend_breakdown get the map on first spend"""
+        self.assertIn("!= 'ValidationException'", self.code)
+        self.assertIn('attribute_not_exists(model_spend_breakdown)', self.code)
+        self.assertIn('_initialize_spend_breakdown(principal_id, model_costs, current_time)', self.code)
+
+    def _load_functions(self, *names):
+        """Exec selected top-level functions of the generated code without its AWS imports"""
+        tree = ast.parse(self.code)
+        functions = [node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name in names]
+        namespace = {
+            'base64': base64, 'json': json, 'time': time, '_json_loads': json.loads,
+            '_PRINCIPAL_RE': re.compile(r'(?:^|/)((?:user-|BedrockAPIKey-)[^/]*)'),
+        }
+        exec(compile(ast.Module(body=functions, type_ignores=[]), 'usage_calculator', 'exec'), namespace)
+        return namespace
+
+    def test_delivers_decompressed_messages(self):
+        """Firehose GZIPs S3 output, so records must not carry the gzipped subscription payload"""
+        namespace = self._load_functions('_unpack_log_events', '_delivery_data')
+        messages = [json.dumps({'requestId': 'a'}), json.dumps({'requestId': 'b'})]
+        payload = {
+            'messageType': 'DATA_MESSAGE',
+            'logGroup': '/aws/bedrock/modelinvocations',
+            'logStream': 'aws/bedrock/modelinvocations',
+            'logEvents': [{'id': str(i), 'timestamp': 0, 'message': m} for i, m in enumerate(messages)],
+        }
+        decoded = gzip.decompress(gzip.compress(json.dumps(payload).encode('utf-8')))
+
+        log_events = namespace['_unpack_log_events'](decoded)
+        data = base64.b64decode(namespace['_delivery_data'](log_events, decoded))
+
+        self.assertEqual(data.decode('utf-8'), '\n'.join(messages) + '\n')
+
+    def test_newline_delimited_records_delivered_as_is(self):
+        namespace = self._load_functions('_unpack_log_events', '_delivery_data')
+        decoded = b'{"requestId": "a"}\n{"requestId": "b"}\n'
+
+        log_events = namespace['_unpack_log_events'](decoded)
+        data = base64.b64decode(namespace['_delivery_data'](log_events, decoded))
+
+        self.assertEqual(data, decoded)
+
+    def test_code_compiles(self):
+        compile(self.code, 'usage_calculator', 'exec')
+
+
+if __name__ == '__main__':
+    unittest.main()